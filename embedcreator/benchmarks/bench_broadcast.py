@@ -0,0 +1,65 @@
+"""
+Benchmark do envio de uma embed para vários chats: laço sequencial (comportamento antigo) contra o `Broadcaster`,
+usando chats falsos que simulam a latência da API e respostas 429 ocasionais.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_broadcast.py
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import Embed, RateLimited
+from creator.broadcast import Broadcaster
+
+CHANNELS = 50
+LATENCY = 0.05
+RATE_LIMIT_CHANCE = 0.05
+
+
+class FakeChannel:
+    def __init__(self, id: int) -> None:
+        self.id = id
+        self.sent = 0
+
+    async def send(self, **kwargs):
+        await asyncio.sleep(LATENCY * random.uniform(0.5, 1.5))
+        if random.random() < RATE_LIMIT_CHANCE:
+            raise RateLimited(LATENCY)
+        self.sent += 1
+        return object()
+
+
+async def sequential(channels, embed):
+    for channel in channels:
+        while True:
+            try:
+                await channel.send(embed=embed)
+            except RateLimited as error:
+                await asyncio.sleep(error.retry_after)
+            else:
+                break
+
+
+async def main() -> None:
+    random.seed(0)
+    embed = Embed(title="Anúncio")
+    for label, run in (
+        ("sequencial", lambda channels: sequential(channels, embed)),
+        ("Broadcaster(5)", lambda channels: Broadcaster(5).send(channels, embed=embed)),
+        ("Broadcaster(20)", lambda channels: Broadcaster(20).send(channels, embed=embed)),
+    ):
+        channels = [FakeChannel(i) for i in range(CHANNELS)]
+        start = time.perf_counter()
+        await run(channels)
+        elapsed = time.perf_counter() - start
+        assert all(channel.sent == 1 for channel in channels)
+        print(f"{label:<16} {elapsed:6.3f}s ({CHANNELS / elapsed:6.1f} envios/s)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
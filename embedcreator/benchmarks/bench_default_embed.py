@@ -0,0 +1,47 @@
+"""
+Micro-benchmark do custo de criação da embed padrão: construção completa (comportamento antigo de `get_default_embed`)
+contra a cópia do modelo imutável e a criação de um rascunho compacto (`EmbedDraft`).
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_default_embed.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import Colour, Embed
+from creator.embed_creator.defaults import DEFAULT_PROTOTYPE
+
+N = 20_000
+
+
+def build_default_embed() -> Embed:
+    # o corpo antigo de `EmbedCreator.get_default_embed`
+    embed = Embed(title='Isso é um título',
+                  description="Use o menu de seleção para editar minhas seções", colour=Colour.from_str('#070d2d'))
+    embed.set_author(name='Bem-vindo ao Embed Builder.',
+                     icon_url="https://i.imgur.com/8Zx1lLv.gif")
+    embed.set_thumbnail(
+        url="https://i.imgur.com/hARDXOC.png")
+    embed.set_image(
+        url="https://i.imgur.com/g1eBpIP.png")
+    embed.set_footer(
+        text='Isso é um rodapé', icon_url="https://i.imgur.com/8Zx1lLv.gif")
+    return embed
+
+
+def main() -> None:
+    cases = {
+        "construção completa (antes)": build_default_embed,
+        "DEFAULT_PROTOTYPE.materialise()": DEFAULT_PROTOTYPE.materialise,
+        "DEFAULT_PROTOTYPE.draft()": DEFAULT_PROTOTYPE.draft,
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=N, repeat=5))
+        print(f"{name:<35} {best / N * 1e6:8.2f} µs/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark da memória ocupada pelos rascunhos: `discord.Embed` (o que cada painel guardava antes) contra `EmbedDraft`,
+e o custo de um `CreatorMethods` por sessão.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_draft_memory.py [sessões]
+"""
+import os
+import sys
+import tracemalloc
+from typing import Any, Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from creator.embed_creator.defaults import DEFAULT_PROTOTYPE
+from creator.embed_creator.methods import CreatorMethods
+
+
+def measure(factory: Callable[[int], Any], count: int) -> float:
+    """Retorna a memória média, em bytes, de cada objeto criado por `factory`."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects: List[Any] = [factory(index) for index in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return size / count
+
+
+def edited_embed(index: int) -> Any:
+    embed = DEFAULT_PROTOTYPE.materialise()
+    embed.title = f"Sessão {index}"
+    embed.add_field(name="Campo", value=str(index))
+    return embed
+
+
+def edited_draft(index: int) -> Any:
+    draft = DEFAULT_PROTOTYPE.draft()
+    draft.title = f"Sessão {index}"
+    draft.fields += (("Campo", str(index), True),)
+    return draft
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cases = {
+        "discord.Embed (modelo)": lambda index: DEFAULT_PROTOTYPE.materialise(),
+        "EmbedDraft (modelo)": lambda index: DEFAULT_PROTOTYPE.draft(),
+        "discord.Embed (editada)": edited_embed,
+        "EmbedDraft (editado)": edited_draft,
+        "CreatorMethods + EmbedDraft": lambda index: CreatorMethods(DEFAULT_PROTOTYPE.draft()),
+    }
+    print(f"{count} sessões")
+    for name, factory in cases.items():
+        print(f"{name:<30} {measure(factory, count):8.0f} bytes/sessão")
+
+
+if __name__ == "__main__":
+    main()
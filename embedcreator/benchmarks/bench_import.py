@@ -0,0 +1,54 @@
+"""
+Benchmark do tempo de importação (`python -X importtime`). Falha (código de saída 1) se algum módulo que não deveria depender
+do discord.py passar a importá-lo, ou se o tempo de importação de um deles passar de `--limit-ms`.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_import.py [--limit-ms 200]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# módulos que devem continuar importáveis sem o discord.py
+PURE = ("creator", "creator.constants", "creator.validation", "creator.storage", "creator.sessions", "creator.metrics")
+FULL = ("creator.embed_creator.builder",)
+
+
+def importtime(module: str) -> dict:
+    """Retorna {módulo importado: tempo acumulado em microssegundos} para um interpretador novo que importa `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if cumulative.isdigit():
+            times[name] = int(cumulative)
+    return times
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit-ms", type=float, default=200.0)
+    args = parser.parse_args()
+    failed = False
+    for module in (*PURE, *FULL):
+        times = importtime(module)
+        elapsed = times.get(module, 0) / 1000
+        loads_discord = "discord" in times
+        status = ""
+        if module in PURE and (loads_discord or elapsed > args.limit_ms):
+            status = "  <- REGRESSÃO"
+            failed = True
+        print(f"{module:<32} {elapsed:8.1f} ms  discord={'sim' if loads_discord else 'não'}{status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Teste de carga offline: milhares de sessões simultâneas do `EmbedCreator` passam pelas oito opções do menu de seleção
+e terminam com "Enviar" ou "Cancelar", usando os objetos falsos de `benchmarks/fakes.py` com latência simulada.
+
+Mostra a latência p50/p99 de cada callback, o pico de memória por interação e o pico de memória por sessão.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_load.py [--sessions 2000] [--latency 0.02] [--user-delay 0.05]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from creator import EmbedCreator
+from fakes import FakeAPI, FakeInteraction, FakeSelect
+
+ACTIONS = ("author", "message", "thumbnail", "image", "footer", "color", "addfield", "removefield")
+ANSWERS = {
+    "Cor da embed": "#ff0000",
+    "Url do autor": "https://example.com",
+    "Título da embed": "Anúncio",
+    "Nome do campo": "Campo",
+    "Valor do campo": "Valor",
+}
+
+
+async def run_session(api: FakeAPI, latencies: Dict[str, List[float]], index: int) -> None:
+    view = EmbedCreator(bot=None, edit_debounce=0)  # type: ignore
+    root = FakeInteraction(api)
+    for action in ACTIONS:
+        start = time.perf_counter()
+        await EmbedCreator.edit_select_callback(view, root.child(), FakeSelect(action))  # type: ignore
+        latencies[action].append(time.perf_counter() - start)
+    for action in ("undo", "redo"):
+        start = time.perf_counter()
+        await getattr(EmbedCreator, f"{action}_callback")(view, root.child(), None)  # type: ignore
+        latencies[action].append(time.perf_counter() - start)
+    action = "send" if index % 2 else "cancel"
+    callback = EmbedCreator.send_callback if action == "send" else EmbedCreator.cancel_callback
+    start = time.perf_counter()
+    await callback(view, root.child(), None)  # type: ignore
+    latencies[action].append(time.perf_counter() - start)
+    await asyncio.gather(*root.tasks)
+    view.stop()
+
+
+async def load(api: FakeAPI, sessions: int) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = {action: [] for action in (*ACTIONS, "undo", "redo", "send", "cancel")}
+    await asyncio.gather(*(run_session(api, latencies, index) for index in range(sessions)))
+    return latencies
+
+
+async def memory_per_interaction(api: FakeAPI) -> float:
+    view = EmbedCreator(bot=None, edit_debounce=0)  # type: ignore
+    root = FakeInteraction(api)
+    peaks = []
+    for action in ACTIONS:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        await EmbedCreator.edit_select_callback(view, root.child(), FakeSelect(action))  # type: ignore
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    view.stop()
+    return statistics.mean(peaks)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--user-delay", type=float, default=0.05)
+    args = parser.parse_args()
+    api = FakeAPI(args.latency, args.user_delay, ANSWERS)
+
+    start = time.perf_counter()
+    latencies = asyncio.run(load(api, args.sessions))
+    elapsed = time.perf_counter() - start
+    interactions = sum(len(values) for values in latencies.values())
+    print(f"{args.sessions} sessões, {interactions} interações em {elapsed:.2f}s ({interactions / elapsed:,.0f} interações/s)")
+    print(f"{'callback':<12} {'p50 (ms)':>9} {'p99 (ms)':>9}")
+    for action, values in latencies.items():
+        print(f"{action:<12} {percentile(values, 0.5) * 1e3:9.2f} {percentile(values, 0.99) * 1e3:9.2f}")
+    print("chamadas à API:", dict(sorted(api.calls.items())))
+
+    quiet = FakeAPI(answers=ANSWERS)
+    tracemalloc.start()
+    per_interaction = asyncio.run(memory_per_interaction(quiet))
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    asyncio.run(load(quiet, args.sessions))
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    print(f"pico de memória por interação: {per_interaction / 1024:.1f} KiB")
+    print(f"pico de memória por sessão: {peak / args.sessions / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Micro-benchmark do custo de criar os modals a cada clique: construção manual de `ModalInput` e `TextInput`
+(comportamento antigo dos métodos `edit_*`) contra os modals das seções pré-compiladas em `SECTIONS`.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_modals.py
+"""
+import asyncio
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import TextStyle
+from discord.ui import TextInput
+from creator.embed_creator.defaults import DEFAULT_PROTOTYPE
+from creator.embed_creator.sections import SECTIONS
+from creator.input import ModalInput
+
+N = 5_000
+DRAFT = DEFAULT_PROTOTYPE.draft()
+
+
+def build_author_modal() -> ModalInput:
+    # o corpo antigo de `CreatorMethods.edit_author`, até o envio do modal
+    modal = ModalInput(title="Edite o autor da embed")
+    modal.add_item(
+        TextInput(label="Nome do autor", max_length=100, default=DRAFT.author_name,
+                  placeholder="Nome do autor para ser mostrado na embed", required=False)
+    )
+    modal.add_item(
+        TextInput(label="Url do ícone do autor", default=DRAFT.author_icon_url,
+                  placeholder="Ícone do autor para ser mostrado na embed", required=False)
+    )
+    modal.add_item(
+        TextInput(label="Url do autor", default=DRAFT.author_url,
+                  placeholder="URL para definir como o link do autor da embed", required=False)
+    )
+    return modal
+
+
+def build_field_modal() -> ModalInput:
+    # o corpo antigo de `CreatorMethods.add_field`, até o envio do modal
+    modal = ModalInput(title="Adicionar novo campo")
+    modal.add_item(TextInput(label="Nome do campo", placeholder="Nome para ser mostrado no campo", max_length=255))
+    modal.add_item(TextInput(label="Valor do campo", placeholder="Valor para ser mostrado no campo", max_length=2000,
+                             style=TextStyle.paragraph))
+    modal.add_item(TextInput(label="Campos na mesma linha (True/False)", default="True", max_length=5,
+                             placeholder="Os campos ficarão na mesma linha? (True ou False)"))
+    return modal
+
+
+def measure(factory) -> float:
+    def run() -> None:
+        # os modals são encerrados para sair do registro de sessões, como acontece depois de cada clique
+        factory().stop()
+    return min(timeit.repeat(run, number=N, repeat=5)) / N * 1e6
+
+
+async def run() -> None:
+    cases = {
+        "autor (antes)": build_author_modal,
+        "autor (SECTIONS)": lambda: SECTIONS["author"].modal(DRAFT),
+        "campo (antes)": build_field_modal,
+        "campo (SECTIONS)": lambda: SECTIONS["addfield"].modal(DRAFT),
+    }
+    for name, factory in cases.items():
+        print(f"{name:<20} {measure(factory):8.2f} µs/modal")
+
+
+def main() -> None:
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
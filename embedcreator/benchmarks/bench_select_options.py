@@ -0,0 +1,58 @@
+"""
+Benchmark da construção de painéis: opções do menu de seleção reconstruídas a cada painel (antes)
+contra a consulta ao cache compartilhado `EmbedCreator._options_cache`, e a vazão de construção de 10 mil painéis.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_select_options.py
+"""
+import asyncio
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from discord import SelectOption
+from creator import EmbedCreator
+from creator.constants import DEFAULT_OPTIONS
+
+N = 10_000
+
+
+def build_options_uncached(kwargs):
+    data = [
+        {
+            "label": kwargs.get(f"{value}_label", defaults["label"]),
+            "description": kwargs.get(f"{value}_description", defaults["description"]),
+            "emoji": kwargs.get(f"{value}_emoji", defaults["emoji"]),
+            "value": value,
+        }
+        for value, defaults in DEFAULT_OPTIONS.items()
+    ]
+    return [SelectOption(**option) for option in data]
+
+
+def build_options_cached(kwargs):
+    return list(EmbedCreator._options_cache.get(kwargs)[1])
+
+
+async def panels(n):
+    start = time.perf_counter()
+    for _ in range(n):
+        EmbedCreator(bot=None)  # type: ignore
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for label, kwargs in (("padrão", {}), ("personalizado", {"author_label": "Author", "color_emoji": "🎨"})):
+        before = min(timeit.repeat(lambda: build_options_uncached(kwargs), number=N, repeat=3))
+        after = min(timeit.repeat(lambda: build_options_cached(kwargs), number=N, repeat=3))
+        print(f"opções ({label}): {before / N * 1e6:7.2f} µs -> {after / N * 1e6:7.2f} µs por painel")
+
+    elapsed = asyncio.run(panels(N))
+    print(f"{N} painéis em {elapsed:.3f}s ({N / elapsed:,.0f} painéis/s)")
+
+
+if __name__ == "__main__":
+    main()
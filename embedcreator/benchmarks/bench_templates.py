@@ -0,0 +1,47 @@
+"""
+Benchmark da biblioteca de modelos: carregar um modelo do cache em memória contra do disco, e buscar nomes por prefixo
+em um banco com muitos modelos.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_templates.py [modelos]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from creator.embed_creator.defaults import DEFAULT_PROTOTYPE
+from creator.templates import TemplateLibrary
+
+N = 5_000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    with tempfile.TemporaryDirectory() as folder:
+        library = TemplateLibrary(os.path.join(folder, "templates.sqlite3"))
+        draft = DEFAULT_PROTOTYPE.draft()
+        for index in range(count):
+            library.save(index % 100, f"modelo {index:05}", draft)
+        library.clear_cache()
+
+        def from_disk() -> None:
+            library.clear_cache()
+            library.load(42, "modelo 00042")
+
+        cases = {
+            "load (disco)": from_disk,
+            "load (cache LRU)": lambda: library.load(42, "modelo 00042"),
+            "names (prefixo)": lambda: library.names(42, "modelo 001"),
+        }
+        print(f"{count} modelos em 100 servidores")
+        for name, func in cases.items():
+            best = min(timeit.repeat(func, number=N, repeat=5))
+            print(f"{name:<20} {best / N * 1e6:8.2f} µs/op")
+        library.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do `UrlChecker` contra um servidor HTTP local que simula um CDN de imagens com latência.
+Mede muitos painéis verificando as mesmas poucas URLs ao mesmo tempo (verificações deduplicadas) e depois com o cache já preenchido.
+
+Uso (dentro da pasta `embedcreator`):
+    python benchmarks/bench_urlcheck.py [verificações]
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+from creator.urlcheck import UrlChecker
+
+LATENCY = 0.05
+URLS = 20
+
+
+async def run(checks: int) -> None:
+    requests = 0
+
+    async def image(request: web.Request) -> web.Response:
+        nonlocal requests
+        requests += 1
+        await asyncio.sleep(LATENCY)
+        return web.Response(body=b"\x89PNG", content_type="image/png")
+
+    app = web.Application()
+    app.router.add_route("*", "/{name}", image)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore
+    urls = [f"http://127.0.0.1:{port}/{index}.png" for index in range(URLS)]
+    checker = UrlChecker(concurrency=10, allow_private=True)
+    try:
+        for label in ("cache vazio", "cache preenchido"):
+            requests, start = 0, time.perf_counter()
+            results = await checker.check_many(urls[index % URLS] for index in range(checks))
+            elapsed = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            print(f"{label:<18} {checks} verificações, {requests} requisições HTTP em {elapsed * 1000:7.1f} ms")
+    finally:
+        await checker.close()
+        await runner.cleanup()
+
+
+def main() -> None:
+    checks = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    asyncio.run(run(checks))
+
+
+if __name__ == "__main__":
+    main()
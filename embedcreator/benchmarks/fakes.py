@@ -0,0 +1,197 @@
+"""
+Substitutos locais para `Interaction`, `InteractionResponse`, `Message` e chats, usados pelos benchmarks para exercitar
+`EmbedCreator` e `CreatorMethods` sem conexão com o Discord. Cada chamada à "API" espera `latency` segundos.
+
+Os modals e prompts enviados são respondidos automaticamente por um usuário simulado depois de `user_delay` segundos,
+com os textos de `answers` (indexados pelo label do `TextInput`) e a primeira opção de cada menu de seleção.
+"""
+from __future__ import annotations
+import asyncio
+import itertools
+from typing import Any, Dict, List, Optional
+
+from discord import NotFound
+from discord.ui import Modal, View
+from creator.input import ChannelSelectPrompt, SelectPrompt
+
+_ids = itertools.count(1)
+
+
+class FakeAPI:
+    """Configuração compartilhada pelos objetos falsos e contagem das chamadas feitas à "API"."""
+
+    def __init__(self, latency: float = 0.0, user_delay: float = 0.0, answers: Optional[Dict[str, str]] = None) -> None:
+        self.latency = latency
+        self.user_delay = user_delay
+        self.answers = answers or {}
+        self.calls: Dict[str, int] = {}
+
+    async def call(self, route: str) -> None:
+        self.calls[route] = self.calls.get(route, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+class FakeMessage:
+    def __init__(self, api: FakeAPI, channel: Optional[FakeChannel] = None, **kwargs: Any) -> None:
+        self.api, self.channel, self.id = api, channel, next(_ids)
+        self.embed, self.view = kwargs.get("embed"), kwargs.get("view")
+        self.embeds = kwargs.get("embeds") or ([self.embed] if self.embed is not None else [])
+
+    async def edit(self, **kwargs: Any) -> FakeMessage:
+        await self.api.call("message.edit")
+        self.embed, self.view = kwargs.get("embed", self.embed), kwargs.get("view", self.view)
+        if "embeds" in kwargs:
+            self.embeds = kwargs["embeds"]
+            self.embed = self.embeds[0] if self.embeds else None
+        elif "embed" in kwargs:
+            self.embeds = [self.embed] if self.embed is not None else []
+        return self
+
+    async def delete(self) -> None:
+        await self.api.call("message.delete")
+
+
+class _NotFoundResponse:
+    status, reason = 404, "Not Found"
+
+
+class FakeChannel:
+    def __init__(self, api: FakeAPI, name: str = "geral") -> None:
+        self.api, self.name, self.id = api, name, next(_ids)
+        self.messages: List[FakeMessage] = []
+
+    async def send(self, **kwargs: Any) -> FakeMessage:
+        await self.api.call("channel.send")
+        message = FakeMessage(self.api, self, **kwargs)
+        self.messages.append(message)
+        return message
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        await self.api.call("channel.fetch_message")
+        for message in self.messages:
+            if message.id == message_id:
+                return message
+        raise NotFound(_NotFoundResponse(), "Unknown Message")  # type: ignore
+
+    def __str__(self) -> str:
+        return f"#{self.name}"
+
+
+class FakeGuild:
+    def __init__(self, api: FakeAPI, channels: int = 1) -> None:
+        self.id = next(_ids)
+        self.channels = [FakeChannel(api, f"chat-{index}") for index in range(channels)]
+        self._by_id = {channel.id: channel for channel in self.channels}
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self._by_id.get(channel_id)
+
+    get_channel_or_thread = get_channel
+
+
+class FakeWebhook:
+    def __init__(self, api: FakeAPI, interaction: Optional[FakeInteraction] = None) -> None:
+        self.api = api
+        self.sent: List[Dict[str, Any]] = []
+        self._interaction = interaction
+
+    async def send(self, content: Optional[str] = None, *, view: Optional[View] = None, **kwargs: Any) -> None:
+        await self.api.call("followup.send")
+        self.sent.append({"content": content, "view": view, **kwargs})
+        if view is not None and self._interaction is not None:
+            self._interaction.user_task(self._interaction.answer_view(view))
+
+
+class FakeResponse:
+    def __init__(self, interaction: FakeInteraction) -> None:
+        self._interaction = interaction
+        self._done = False
+
+    def is_done(self) -> bool:
+        return self._done
+
+    async def _respond(self, route: str) -> None:
+        if self._done:
+            raise RuntimeError("Essa interação já foi respondida.")
+        self._done = True
+        await self._interaction.api.call(route)
+
+    async def defer(self, **kwargs: Any) -> None:
+        await self._respond("response.defer")
+
+    async def send_message(self, content: Optional[str] = None, *, view: Optional[View] = None, **kwargs: Any) -> None:
+        await self._respond("response.send_message")
+        if view is not None:
+            self._interaction.user_task(self._interaction.answer_view(view))
+
+    async def send_modal(self, modal: Modal) -> None:
+        await self._respond("response.send_modal")
+        self._interaction.user_task(self._interaction.answer_modal(modal))
+
+
+class FakeInteraction:
+    """
+    Uma interação falsa. `followup`, `guild`, `message` e `client` são compartilhados pelas interações criadas com `child()`,
+    como acontece com as interações de um mesmo painel.
+    """
+
+    def __init__(
+        self,
+        api: FakeAPI,
+        *,
+        guild: Optional[FakeGuild] = None,
+        message: Optional[FakeMessage] = None,
+        locale: str = "pt-BR",
+    ) -> None:
+        self.api = api
+        self.id = next(_ids)
+        self.guild = guild or FakeGuild(api)
+        self.guild_id = self.guild.id
+        self.message = message or FakeMessage(api)
+        self.locale = locale
+        self.client = None
+        self.user = None
+        self.response = FakeResponse(self)
+        self.followup = FakeWebhook(api, self)
+        self.tasks: List[asyncio.Task[Any]] = []
+
+    def child(self) -> FakeInteraction:
+        interaction = FakeInteraction(self.api, guild=self.guild, message=self.message, locale=self.locale)
+        interaction.followup, interaction.tasks = self.followup, self.tasks
+        return interaction
+
+    def user_task(self, coroutine: Any) -> None:
+        self.tasks.append(asyncio.get_running_loop().create_task(coroutine))
+
+    async def delete_original_response(self) -> None:
+        await self.api.call("interaction.delete_original_response")
+
+    async def answer_modal(self, modal: Modal) -> None:
+        if self.api.user_delay:
+            await asyncio.sleep(self.api.user_delay)
+        for item in modal.children:
+            # `TextInput.label` está obsoleto nas versões mais novas do discord.py e emite um aviso a cada leitura
+            label = item._underlying.label  # type: ignore
+            item._value = self.api.answers.get(label, getattr(item, "default", None) or "texto")  # type: ignore
+        # o mesmo fluxo de `Modal._scheduled_task`
+        await modal.on_submit(self.child())  # type: ignore
+        modal.stop()
+
+    async def answer_view(self, view: View) -> None:
+        if self.api.user_delay:
+            await asyncio.sleep(self.api.user_delay)
+        select = view.children[0]
+        if isinstance(view, ChannelSelectPrompt):
+            select._values = self.guild.channels[: select.max_values]  # type: ignore
+            await ChannelSelectPrompt.callback(view, self.child(), select)  # type: ignore
+        elif isinstance(view, SelectPrompt):
+            select._values = [select.options[0].value]  # type: ignore
+            await SelectPrompt.select_callback(view, self.child(), select)  # type: ignore
+
+
+class FakeSelect:
+    """Um menu de seleção falso com os valores já escolhidos, passado diretamente para `EmbedCreator.edit_select_callback`."""
+
+    def __init__(self, *values: str) -> None:
+        self.values = list(values)
@@ -1,12 +1,139 @@
-from .input import ModalInput, SelectPrompt, ChannelSelectPrompt
-from .embed_creator import EmbedCreator, CreatorMethods
+"""
+Os nomes públicos do pacote são carregados sob demanda: importar `creator` não importa o discord.py.
+Ele só é carregado no primeiro acesso a uma classe que depende dele, como `creator.EmbedCreator`.
+Os módulos `creator.constants`, `creator.draft`, `creator.history`, `creator.locales`, `creator.validation`, `creator.versioning`, `creator.storage`, `creator.templates`, `creator.sessions` e `creator.metrics` não dependem do discord.py.
+"""
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .metrics import Metrics, MetricsExporter, LoggingExporter
+    from .validation import EmbedLimits, EmbedValidationError, EmbedValidator
+    from .sessions import SessionRegistry, registry
+    from .input import ModalInput, SelectPrompt, ChannelSelectPrompt
+    from .broadcast import BroadcastResult, Broadcaster, broadcast_embed
+    from .channels import ChannelIndex
+    from .scheduler import ScheduledPost, PostScheduler, parse_when
+    from .storage import DraftStore, SQLiteDraftStore, WriteBehindDraftStore
+    from .templates import TemplateLibrary
+    from .urlcheck import UrlCheckResult, UrlChecker
+    from .draft import EmbedDraft
+    from .locales import DEFAULT_LOCALE, LocalizedError, register_locale, resolve_locale
+    from .history import DraftHistory
+    from .versioning import DraftConflictError, DraftVersions, merge_values
+    from .embed_creator import EmbedCreator, CreatorMethods, InputSpec, SectionSpec, SECTIONS, LocaleCatalog, get_catalog, EmbedPrototype, register_prototype, get_prototype, DEFAULT_PROTOTYPE, PersistentPanelItem, setup_persistent_panels
 
 __version__ = "0.1.9"
 
+# nome público -> módulo que o define; os módulos só são importados no primeiro acesso
+_LAZY = {
+    "ModalInput": ".input",
+    "SelectPrompt": ".input",
+    "ChannelSelectPrompt": ".input",
+    "EmbedCreator": ".embed_creator",
+    "CreatorMethods": ".embed_creator",
+    "InputSpec": ".embed_creator",
+    "SectionSpec": ".embed_creator",
+    "SECTIONS": ".embed_creator",
+    "LocaleCatalog": ".embed_creator",
+    "get_catalog": ".embed_creator",
+    "DEFAULT_LOCALE": ".locales",
+    "LocalizedError": ".locales",
+    "register_locale": ".locales",
+    "resolve_locale": ".locales",
+    "EmbedPrototype": ".embed_creator",
+    "EmbedDraft": ".draft",
+    "DraftHistory": ".history",
+    "DraftConflictError": ".versioning",
+    "DraftVersions": ".versioning",
+    "merge_values": ".versioning",
+    "register_prototype": ".embed_creator",
+    "get_prototype": ".embed_creator",
+    "DEFAULT_PROTOTYPE": ".embed_creator",
+    "PersistentPanelItem": ".embed_creator",
+    "setup_persistent_panels": ".embed_creator",
+    "SessionRegistry": ".sessions",
+    "registry": ".sessions",
+    "DraftStore": ".storage",
+    "SQLiteDraftStore": ".storage",
+    "WriteBehindDraftStore": ".storage",
+    "TemplateLibrary": ".templates",
+    "UrlCheckResult": ".urlcheck",
+    "UrlChecker": ".urlcheck",
+    "BroadcastResult": ".broadcast",
+    "Broadcaster": ".broadcast",
+    "broadcast_embed": ".broadcast",
+    "ChannelIndex": ".channels",
+    "ScheduledPost": ".scheduler",
+    "PostScheduler": ".scheduler",
+    "parse_when": ".scheduler",
+    "EmbedLimits": ".validation",
+    "EmbedValidationError": ".validation",
+    "EmbedValidator": ".validation",
+    "Metrics": ".metrics",
+    "MetricsExporter": ".metrics",
+    "LoggingExporter": ".metrics",
+}
+
 __all__ = [
     "ModalInput",
     "SelectPrompt",
     "ChannelSelectPrompt",
     "EmbedCreator",
     "CreatorMethods",
-]
\ No newline at end of file
+    "InputSpec",
+    "SectionSpec",
+    "SECTIONS",
+    "LocaleCatalog",
+    "get_catalog",
+    "DEFAULT_LOCALE",
+    "LocalizedError",
+    "register_locale",
+    "resolve_locale",
+    "EmbedPrototype",
+    "EmbedDraft",
+    "DraftHistory",
+    "DraftConflictError",
+    "DraftVersions",
+    "merge_values",
+    "register_prototype",
+    "get_prototype",
+    "DEFAULT_PROTOTYPE",
+    "SessionRegistry",
+    "registry",
+    "DraftStore",
+    "SQLiteDraftStore",
+    "WriteBehindDraftStore",
+    "TemplateLibrary",
+    "UrlCheckResult",
+    "UrlChecker",
+    "PersistentPanelItem",
+    "setup_persistent_panels",
+    "BroadcastResult",
+    "Broadcaster",
+    "broadcast_embed",
+    "ChannelIndex",
+    "ScheduledPost",
+    "PostScheduler",
+    "parse_when",
+    "EmbedLimits",
+    "EmbedValidationError",
+    "EmbedValidator",
+    "Metrics",
+    "MetricsExporter",
+    "LoggingExporter",
+]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
@@ -0,0 +1,177 @@
+from __future__ import annotations
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from discord import Embed, HTTPException, Message, RateLimited
+from discord.abc import Messageable
+from creator.metrics import span
+
+if TYPE_CHECKING:
+    from creator.channels import ChannelIndex
+
+__all__ = ("BroadcastResult", "Broadcaster", "broadcast_embed")
+
+
+class BroadcastResult:
+    """
+    Essa classe representa o resultado do envio (ou da edição de uma mensagem) em um chat.
+
+    Atributos:
+        channel (discord.abc.Messageable): O chat de destino.
+        message (discord.Message, optional): A mensagem enviada ou editada, se deu certo.
+        error (Exception, optional): O erro do último envio, se ele falhou.
+        attempts (int): O número de tentativas feitas.
+    """
+
+    __slots__ = ("channel", "message", "error", "attempts")
+
+    def __init__(self, channel: Messageable) -> None:
+        self.channel = channel
+        self.message: Optional[Message] = None
+        self.error: Optional[Exception] = None
+        self.attempts = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.message is not None
+
+    def __repr__(self) -> str:
+        return f"<BroadcastResult channel={getattr(self.channel, 'id', None)} ok={self.ok} attempts={self.attempts}>"
+
+
+class _Route:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        # os envios que estão usando ou esperando a rota; ela é descartada quando não sobra nenhum
+        self.users = 0
+
+
+class Broadcaster:
+    """
+    Essa classe envia uma embed para vários chats (ou edita várias mensagens) ao mesmo tempo, com um limite de envios simultâneos.
+    Cada chat é uma rota separada na API do Discord, então os envios para o mesmo chat são feitos em fila e os para chats diferentes em paralelo.
+    Quando o Discord responde com um limite de taxa (429) ou um erro de servidor (5xx), o envio é repetido depois do `retry_after` informado
+    ou de uma espera exponencial. Os outros erros não são repetidos; eles ficam no resultado do chat, sem interromper os envios dos demais.
+
+    Parâmetros:
+        concurrency (int, optional): O número máximo de envios simultâneos. Por padrão é 5.
+        max_retries (int, optional): O número máximo de novas tentativas por chat. Por padrão é 3.
+        base_delay (float, optional): A espera, em segundos, antes da primeira nova tentativa de um erro de servidor. Por padrão é 1.
+        channel_index (ChannelIndex, optional): Quando informado, os chats em que o bot não pode enviar embeds são recusados sem chamar a API,
+            com um `PermissionError` no resultado.
+    """
+
+    def __init__(
+        self, concurrency: int = 5, max_retries: int = 3, base_delay: float = 1.0, channel_index: Optional[ChannelIndex] = None
+    ) -> None:
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.channel_index = channel_index
+        self._routes: Dict[Any, _Route] = {}
+
+    @asynccontextmanager
+    async def _route(self, channel: Messageable) -> AsyncIterator[None]:
+        key = getattr(channel, "id", id(channel))
+        route = self._routes.get(key)
+        if route is None:
+            route = self._routes[key] = _Route()
+        route.users += 1
+        try:
+            async with route.lock:
+                yield
+        finally:
+            route.users -= 1
+            if not route.users:
+                del self._routes[key]
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        if isinstance(error, RateLimited):
+            return error.retry_after
+        if isinstance(error, HTTPException) and (error.status == 429 or error.status >= 500):
+            return self.base_delay * 2 ** attempt + random.uniform(0, self.base_delay)
+        return None
+
+    async def _send(
+        self, semaphore: asyncio.Semaphore, result: BroadcastResult, name: str, request: Callable[[], Awaitable[Message]]
+    ) -> None:
+        async with self._route(result.channel):
+            while True:
+                async with semaphore:
+                    result.attempts += 1
+                    try:
+                        with span(name):
+                            result.message = await request()
+                    except Exception as error:
+                        # qualquer falha fica só no resultado deste chat, sem interromper os envios dos outros
+                        result.error = error
+                    else:
+                        result.error = None
+                        return
+                delay = self._retry_delay(result.error, result.attempts - 1)
+                if delay is None or result.attempts > self.max_retries:
+                    return
+                # a espera acontece fora do semáforo, liberando a vaga para outros chats
+                await asyncio.sleep(delay)
+
+    async def send(self, channels: Iterable[Messageable], **kwargs: Any) -> List[BroadcastResult]:
+        """
+        Esse método envia a mesma mensagem para todos os chats.
+
+        Parâmetros:
+            channels (Iterable[discord.abc.Messageable]): Os chats de destino.
+            **kwargs: Os argumentos passados para `channel.send`, por exemplo `embed=`.
+
+        Retorna:
+            results (List[BroadcastResult]): Um resultado por chat, na mesma ordem de `channels`.
+        """
+        channels = list(channels)
+        results = [BroadcastResult(channel) for channel in channels]
+        if self.channel_index is not None:
+            allowed = []
+            for result in results:
+                if self.channel_index.can_post(result.channel):
+                    allowed.append(result)
+                else:
+                    result.error = PermissionError(f"O bot não pode enviar embeds em {result.channel}.")
+        else:
+            allowed = results
+        await self._run(allowed, "channel.send", [lambda channel=result.channel: channel.send(**kwargs) for result in allowed])
+        return results
+
+    async def edit(self, edits: Iterable[Tuple[Message, Dict[str, Any]]]) -> List[BroadcastResult]:
+        """
+        Esse método edita várias mensagens já enviadas, com os mesmos limites e novas tentativas de `send`.
+
+        Parâmetros:
+            edits (Iterable[Tuple[discord.Message, Dict[str, Any]]]): Cada mensagem e os argumentos passados para `message.edit` dela.
+
+        Retorna:
+            results (List[BroadcastResult]): Um resultado por mensagem, na mesma ordem de `edits`. O chat de cada resultado é o da mensagem.
+        """
+        edits = list(edits)
+        return await self._run(
+            [BroadcastResult(message.channel) for message, _ in edits],
+            "message.edit",
+            [lambda message=message, kwargs=kwargs: message.edit(**kwargs) for message, kwargs in edits],
+        )
+
+    async def _run(
+        self, results: List[BroadcastResult], name: str, requests: List[Callable[[], Awaitable[Message]]]
+    ) -> List[BroadcastResult]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._send(semaphore, result, name, request) for result, request in zip(results, requests)))
+        return results
+
+
+async def broadcast_embed(embed: Embed, channels: Iterable[Messageable], *, concurrency: int = 5, max_retries: int = 3) -> List[BroadcastResult]:
+    """
+    Essa função envia a embed para todos os chats, usando um `Broadcaster`.
+
+    Retorna:
+        results (List[BroadcastResult]): Um resultado por chat, na mesma ordem de `channels`.
+    """
+    return await Broadcaster(concurrency, max_retries).send(channels, embed=embed)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from discord import CategoryChannel, Guild, Member, Role, TextChannel, Thread
+from discord.abc import GuildChannel, Messageable
+from creator.metrics import increment, span
+
+__all__ = ("ChannelIndex",)
+
+
+def _can_post(channel: Any, me: Optional[Member]) -> bool:
+    # só chats de texto, de anúncios e tópicos aceitam embeds; palco, fórum e categoria ficam de fora
+    if not isinstance(channel, (TextChannel, Thread)):
+        return False
+    if me is None:
+        return True
+    permissions = channel.permissions_for(me)
+    if not (permissions.view_channel and permissions.embed_links):
+        return False
+    if isinstance(channel, Thread):
+        return permissions.send_messages_in_threads and (not channel.locked or permissions.manage_threads)
+    return permissions.send_messages
+
+
+class ChannelIndex:
+    """
+    Essa classe mantém, para cada servidor, o índice dos chats em que o bot pode enviar embeds (ver o chat, enviar mensagens e inserir links).
+    O índice de um servidor é montado no primeiro uso e depois atualizado aos poucos pelos eventos do gateway: a criação, edição ou exclusão
+    de um chat recalcula só aquele chat (ou os chats da categoria), e a mudança de um cargo do bot descarta o índice do servidor,
+    que é remontado no próximo uso. Assim o seletor de chats e os envios não recalculam permissões a cada uso.
+
+    Para receber os eventos, o índice precisa ser registrado no bot com `attach`.
+    """
+
+    def __init__(self) -> None:
+        # id do servidor -> id do chat -> se o bot pode enviar embeds nele
+        self._guilds: Dict[int, Dict[int, bool]] = {}
+
+    def attach(self, bot: Any) -> ChannelIndex:
+        """
+        Esse método registra os listeners do índice no bot (um `discord.ext.commands.Bot`, ou qualquer cliente com `add_listener`).
+
+        Retorna:
+            index (ChannelIndex): O próprio índice.
+        """
+        for name in (
+            "on_guild_channel_create", "on_guild_channel_update", "on_guild_channel_delete",
+            "on_thread_create", "on_thread_update", "on_thread_delete",
+            "on_guild_role_update", "on_guild_role_delete", "on_member_update", "on_guild_remove",
+        ):
+            bot.add_listener(getattr(self, name), name)
+        return self
+
+    def _index(self, guild: Guild) -> Dict[int, bool]:
+        index = self._guilds.get(guild.id)
+        if index is None:
+            with span("channels.index.build"):
+                me = guild.me
+                index = {channel.id: _can_post(channel, me) for channel in (*guild.text_channels, *guild.threads)}
+            if me is not None:
+                self._guilds[guild.id] = index
+        return index
+
+    def can_post(self, channel: Messageable) -> bool:
+        """Esse método diz se o bot pode enviar embeds no chat. Chats fora de servidores (como DMs) são sempre aceitos."""
+        guild = getattr(channel, "guild", None)
+        if guild is None:
+            return True
+        index = self._index(guild)
+        allowed = index.get(channel.id)  # type: ignore
+        if allowed is None:
+            # um tópico que não estava no cache quando o índice foi montado
+            allowed = index[channel.id] = _can_post(channel, guild.me)  # type: ignore
+        return allowed
+
+    def channels(self, guild: Guild) -> List[GuildChannel]:
+        """Esse método lista os chats do servidor em que o bot pode enviar embeds."""
+        resolve = guild.get_channel_or_thread
+        return [channel for channel_id, allowed in self._index(guild).items() if allowed and (channel := resolve(channel_id)) is not None]  # type: ignore
+
+    def split(self, channels: Iterable[Messageable]) -> Tuple[List[Messageable], List[Messageable]]:
+        """
+        Esse método separa os chats em que o bot pode enviar embeds dos outros.
+
+        Retorna:
+            split (Tuple[List[discord.abc.Messageable], List[discord.abc.Messageable]]): Os chats permitidos e os recusados, na ordem de `channels`.
+        """
+        allowed: List[Messageable] = []
+        rejected: List[Messageable] = []
+        for channel in channels:
+            (allowed if self.can_post(channel) else rejected).append(channel)
+        return allowed, rejected
+
+    def invalidate(self, guild_id: Optional[int] = None) -> None:
+        """Esse método descarta o índice do servidor informado, ou de todos os servidores."""
+        if guild_id is None:
+            self._guilds.clear()
+        else:
+            self._guilds.pop(guild_id, None)
+        increment("channels.index.invalidations")
+
+    def _refresh(self, channel: Any) -> None:
+        index = self._guilds.get(channel.guild.id)
+        if index is None:
+            return
+        if isinstance(channel, CategoryChannel):
+            # os chats sincronizados com a categoria herdam as permissões dela
+            for child in channel.channels:
+                index[child.id] = _can_post(child, channel.guild.me)
+        else:
+            index[channel.id] = _can_post(channel, channel.guild.me)
+
+    def _forget(self, channel: Any) -> None:
+        index = self._guilds.get(channel.guild.id)
+        if index is not None:
+            index.pop(channel.id, None)
+
+    async def on_guild_channel_create(self, channel: GuildChannel) -> None:
+        self._refresh(channel)
+
+    async def on_guild_channel_update(self, before: GuildChannel, after: GuildChannel) -> None:
+        self._refresh(after)
+
+    async def on_guild_channel_delete(self, channel: GuildChannel) -> None:
+        self._forget(channel)
+
+    async def on_thread_create(self, thread: Thread) -> None:
+        self._refresh(thread)
+
+    async def on_thread_update(self, before: Thread, after: Thread) -> None:
+        self._refresh(after)
+
+    async def on_thread_delete(self, thread: Thread) -> None:
+        self._forget(thread)
+
+    async def on_guild_role_update(self, before: Role, after: Role) -> None:
+        me = after.guild.me
+        if after.is_default() or (me is not None and me.get_role(after.id) is not None):
+            self.invalidate(after.guild.id)
+
+    async def on_guild_role_delete(self, role: Role) -> None:
+        # o cargo já saiu da lista de cargos do bot quando o evento chega
+        self.invalidate(role.guild.id)
+
+    async def on_member_update(self, before: Member, after: Member) -> None:
+        if after.guild.me is not None and after.id == after.guild.me.id and before.roles != after.roles:
+            self.invalidate(after.guild.id)
+
+    async def on_guild_remove(self, guild: Guild) -> None:
+        self._guilds.pop(guild.id, None)
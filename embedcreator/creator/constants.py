@@ -0,0 +1,99 @@
+"""
+Dados padrão da biblioteca que não dependem do discord.py: a embed padrão (no formato da API do Discord) e as opções do menu de seleção.
+Podem ser importados sem carregar o discord.py, por exemplo por workers e ferramentas de linha de comando.
+"""
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+__all__ = ("DEFAULT_EMBED", "DEFAULT_OPTIONS", "OPTION_KWARGS", "TEMPLATE_OPTIONS")
+
+# a embed padrão do `EmbedCreator`, no formato de `discord.Embed.to_dict()`
+DEFAULT_EMBED: Mapping[str, Any] = MappingProxyType({
+    "type": "rich",
+    "title": "Isso é um título",
+    "description": "Use o menu de seleção para editar minhas seções",
+    "color": 0x070D2D,
+    "author": MappingProxyType({
+        "name": "Bem-vindo ao Embed Builder.",
+        "icon_url": "https://i.imgur.com/8Zx1lLv.gif",
+    }),
+    "thumbnail": MappingProxyType({"url": "https://i.imgur.com/hARDXOC.png"}),
+    "image": MappingProxyType({"url": "https://i.imgur.com/g1eBpIP.png"}),
+    "footer": MappingProxyType({
+        "text": "Isso é um rodapé",
+        "icon_url": "https://i.imgur.com/8Zx1lLv.gif",
+    }),
+})
+
+# valores padrão de cada opção do menu de seleção, na ordem em que aparecem
+DEFAULT_OPTIONS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "author": MappingProxyType({
+        "label": "Edite o Autor",
+        "description": "Edita o nome e ícone do autor.",
+        "emoji": "🔹",
+    }),
+    "message": MappingProxyType({
+        "label": "Edite a Mensagem (título e descrição)",
+        "description": "Edita o título e descrição da embed.",
+        "emoji": "🔹",
+    }),
+    "thumbnail": MappingProxyType({
+        "label": "Edite a Thumbnail",
+        "description": "Edita a thumbnail da embed.",
+        "emoji": "🔹",
+    }),
+    "image": MappingProxyType({
+        "label": "Edite a Imagem",
+        "description": "Edita a imagem da embed.",
+        "emoji": "🔹",
+    }),
+    "footer": MappingProxyType({
+        "label": "Edite o Rodapé",
+        "description": "Edita o texto e o ícone do rodapé da embed.",
+        "emoji": "🔹",
+    }),
+    "color": MappingProxyType({
+        "label": "Edite a Cor",
+        "description": "Edita a cor da embed.",
+        "emoji": "🔹",
+    }),
+    "addfield": MappingProxyType({
+        "label": "Adicione um campo",
+        "description": "Adiciona um campo à embed.",
+        "emoji": "🔹",
+    }),
+    "removefield": MappingProxyType({
+        "label": "Remova um campo",
+        "description": "Remove um campo da embed.",
+        "emoji": "🔹",
+    }),
+    "importjson": MappingProxyType({
+        "label": "Importe um JSON",
+        "description": "Substitui a embed inteira por um JSON de embed do Discord.",
+        "emoji": "🔹",
+    }),
+    "exportjson": MappingProxyType({
+        "label": "Exporte em JSON",
+        "description": "Mostra a embed atual em JSON.",
+        "emoji": "🔹",
+    }),
+    "savetemplate": MappingProxyType({
+        "label": "Salve como modelo",
+        "description": "Salva a embed atual como um modelo do servidor.",
+        "emoji": "🔹",
+    }),
+    "loadtemplate": MappingProxyType({
+        "label": "Carregue um modelo",
+        "description": "Substitui a embed por um modelo salvo do servidor.",
+        "emoji": "🔹",
+    }),
+})
+
+# opções que só aparecem quando o `EmbedCreator` recebe uma biblioteca de modelos
+TEMPLATE_OPTIONS = frozenset({"savetemplate", "loadtemplate"})
+
+# nome do kwarg (ex: "author_label") -> (opção, atributo)
+OPTION_KWARGS: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    f"{value}_{attr}": (value, attr) for value, defaults in DEFAULT_OPTIONS.items() for attr in defaults
+})
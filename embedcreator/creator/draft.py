@@ -0,0 +1,202 @@
+from __future__ import annotations
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+from creator.locales import LocalizedError
+
+if TYPE_CHECKING:
+    from discord import Embed
+
+__all__ = ("EmbedDraft", "Field")
+
+# (nome, valor, inline)
+Field = Tuple[str, str, bool]
+
+
+class EmbedDraft:
+    """
+    Essa classe é o rascunho compacto de uma embed, editado diretamente pelo `CreatorMethods`.
+    Todos os valores são imutáveis (textos, a cor como `int` e os campos como tuplas), então copiar um rascunho apenas copia referências
+    e rascunhos diferentes compartilham tudo o que não foi editado. O `discord.Embed` só é criado com `to_embed()`, na hora de mostrar ou enviar.
+    Essa classe não depende do discord.py, exceto em `to_embed()` e `from_embed()`.
+
+    Atributos:
+        title, description, url (str, optional): O título, a descrição e o link do título.
+        colour (int, optional): A cor, entre 0x000000 e 0xFFFFFF.
+        timestamp (datetime.datetime, optional): O horário mostrado no rodapé.
+        author_name, author_icon_url, author_url (str, optional): O autor.
+        footer_text, footer_icon_url (str, optional): O rodapé.
+        thumbnail, image (str, optional): As URLs da thumbnail e da imagem.
+        fields (Tuple[Tuple[str, str, bool], ...]): Os campos, como tuplas (nome, valor, inline).
+    """
+
+    __slots__ = (
+        "title", "description", "url", "colour", "timestamp",
+        "author_name", "author_icon_url", "author_url",
+        "footer_text", "footer_icon_url",
+        "thumbnail", "image", "fields",
+    )
+
+    def __init__(
+        self,
+        *,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        url: Optional[str] = None,
+        colour: Optional[int] = None,
+        timestamp: Optional[datetime] = None,
+        author_name: Optional[str] = None,
+        author_icon_url: Optional[str] = None,
+        author_url: Optional[str] = None,
+        footer_text: Optional[str] = None,
+        footer_icon_url: Optional[str] = None,
+        thumbnail: Optional[str] = None,
+        image: Optional[str] = None,
+        fields: Tuple[Field, ...] = (),
+    ) -> None:
+        self.title, self.description, self.url, self.colour, self.timestamp = title, description, url, colour, timestamp
+        self.author_name, self.author_icon_url, self.author_url = author_name, author_icon_url, author_url
+        self.footer_text, self.footer_icon_url = footer_text, footer_icon_url
+        self.thumbnail, self.image, self.fields = thumbnail, image, tuple(fields)
+
+    def copy(self) -> EmbedDraft:
+        """Esse método retorna uma cópia do rascunho, que compartilha todos os valores com o original."""
+        draft = EmbedDraft.__new__(EmbedDraft)
+        for attr in EmbedDraft.__slots__:
+            setattr(draft, attr, getattr(self, attr))
+        return draft
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> EmbedDraft:
+        """Esse método cria um rascunho a partir de um dicionário no formato da API do Discord."""
+        author = data.get("author") or {}
+        footer = data.get("footer") or {}
+        timestamp = data.get("timestamp")
+        return cls(
+            title=data.get("title"),
+            description=data.get("description"),
+            url=data.get("url"),
+            colour=data.get("color"),
+            timestamp=datetime.fromisoformat(timestamp) if isinstance(timestamp, str) else timestamp,
+            author_name=author.get("name"),
+            author_icon_url=author.get("icon_url"),
+            author_url=author.get("url"),
+            footer_text=footer.get("text"),
+            footer_icon_url=footer.get("icon_url"),
+            thumbnail=(data.get("thumbnail") or {}).get("url"),
+            image=(data.get("image") or {}).get("url"),
+            fields=tuple(
+                (field.get("name", ""), field.get("value", ""), bool(field.get("inline", True)))
+                for field in data.get("fields") or ()
+            ),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> EmbedDraft:
+        """
+        Esse método cria um rascunho a partir de um JSON de embed da API do Discord. Também aceita o JSON de uma mensagem (`{"embeds": [...]}`),
+        caso em que a primeira embed é usada.
+
+        Levanta:
+            LocalizedError: Se o texto não for um JSON válido ou não tiver o formato de uma embed, com uma das mensagens `json.<...>`.
+        """
+        try:
+            data = json.loads(text)
+        except ValueError as error:
+            raise LocalizedError("json.invalid", error=str(error)) from None
+        if isinstance(data, dict) and isinstance(data.get("embeds"), list):
+            data = data["embeds"][0] if data["embeds"] else {}
+        if not isinstance(data, dict):
+            raise LocalizedError("json.not_object")
+        for key in ("author", "footer", "thumbnail", "image"):
+            if not isinstance(data.get(key) or {}, dict):
+                raise LocalizedError("json.key_not_object", key=key)
+        if not isinstance(data.get("fields") or [], list) or not all(isinstance(field, dict) for field in data.get("fields") or ()):
+            raise LocalizedError("json.fields")
+        if data.get("color") is not None and (isinstance(data["color"], bool) or not isinstance(data["color"], int)):
+            raise LocalizedError("json.color")
+        try:
+            if not isinstance(data.get("timestamp") or "", str):
+                raise TypeError
+            draft = cls.from_dict(data)
+        except (TypeError, ValueError):
+            raise LocalizedError("json.timestamp") from None
+        for attr in _TEXT_SLOTS:
+            if not isinstance(getattr(draft, attr), (str, type(None))):
+                raise LocalizedError("json.not_text", key=attr)
+        if not all(isinstance(name, str) and isinstance(value, str) for name, value, _ in draft.fields):
+            raise LocalizedError("json.field_text")
+        return draft
+
+    def to_json(self, *, indent: Optional[int] = 2) -> str:
+        """Esse método retorna o rascunho como JSON de embed da API do Discord, pronto para ser importado com `from_json`."""
+        data = self.to_dict()
+        del data["type"]
+        return json.dumps(data, indent=indent, ensure_ascii=False)
+
+    @classmethod
+    def from_embed(cls, embed: Embed) -> EmbedDraft:
+        """Esse método cria um rascunho a partir de um `discord.Embed`."""
+        return cls.from_dict(embed.to_dict())  # type: ignore
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Esse método retorna o rascunho no formato da API do Discord, o mesmo de `discord.Embed.to_dict()`."""
+        data: Dict[str, Any] = {"type": "rich"}
+        for key in ("title", "description", "url"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.colour is not None:
+            data["color"] = self.colour
+        if self.timestamp is not None:
+            data["timestamp"] = self.timestamp.isoformat()
+        if self.author_name:
+            data["author"] = _compact(name=self.author_name, icon_url=self.author_icon_url, url=self.author_url)
+        if self.footer_text or self.footer_icon_url:
+            data["footer"] = _compact(text=self.footer_text, icon_url=self.footer_icon_url)
+        if self.thumbnail:
+            data["thumbnail"] = {"url": self.thumbnail}
+        if self.image:
+            data["image"] = {"url": self.image}
+        if self.fields:
+            data["fields"] = [{"name": name, "value": value, "inline": inline} for name, value, inline in self.fields]
+        return data
+
+    def to_embed(self) -> Embed:
+        """Esse método cria o `discord.Embed` do rascunho."""
+        from discord import Embed
+
+        embed = Embed(
+            title=self.title, description=self.description, url=self.url, colour=self.colour, timestamp=self.timestamp
+        )
+        if self.author_name:
+            embed.set_author(name=self.author_name, icon_url=self.author_icon_url, url=self.author_url)
+        if self.footer_text or self.footer_icon_url:
+            embed.set_footer(text=self.footer_text, icon_url=self.footer_icon_url)
+        if self.thumbnail:
+            embed.set_thumbnail(url=self.thumbnail)
+        if self.image:
+            embed.set_image(url=self.image)
+        for name, value, inline in self.fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        return embed
+
+    def image_urls(self) -> Tuple[str, ...]:
+        """Esse método retorna as URLs de imagem preenchidas: ícone do autor, ícone do rodapé, thumbnail e imagem."""
+        return tuple(url for url in (self.author_icon_url, self.footer_icon_url, self.thumbnail, self.image) if url)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmbedDraft):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in EmbedDraft.__slots__)
+
+    def __repr__(self) -> str:
+        return f"<EmbedDraft title={self.title!r} fields={len(self.fields)}>"
+
+
+# atributos que devem ser textos (ou None)
+_TEXT_SLOTS = tuple(attr for attr in EmbedDraft.__slots__ if attr not in ("colour", "timestamp", "fields"))
+
+
+def _compact(**values: Optional[str]) -> Dict[str, str]:
+    return {key: value for key, value in values.items() if value}
@@ -1,4 +1,44 @@
-from .builder import EmbedCreator
-from .methods import CreatorMethods
+from __future__ import annotations
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
-__all__ = ["EmbedCreator", "CreatorMethods"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .builder import EmbedCreator
+    from .methods import CreatorMethods
+    from .persistent import PersistentPanelItem, setup_persistent_panels
+    from .sections import InputSpec, SectionSpec, SECTIONS
+    from .catalog import LocaleCatalog, get_catalog
+    from .defaults import EmbedPrototype, EmbedDraft, register_prototype, get_prototype, DEFAULT_PROTOTYPE
+
+# nome público -> módulo que o define; os módulos só são importados no primeiro acesso
+_LAZY = {
+    "EmbedCreator": ".builder",
+    "CreatorMethods": ".methods",
+    "PersistentPanelItem": ".persistent",
+    "setup_persistent_panels": ".persistent",
+    "InputSpec": ".sections",
+    "SectionSpec": ".sections",
+    "SECTIONS": ".sections",
+    "LocaleCatalog": ".catalog",
+    "get_catalog": ".catalog",
+    "EmbedPrototype": ".defaults",
+    "EmbedDraft": ".defaults",
+    "register_prototype": ".defaults",
+    "get_prototype": ".defaults",
+    "DEFAULT_PROTOTYPE": ".defaults",
+}
+
+__all__ = ["EmbedCreator", "CreatorMethods", "InputSpec", "SectionSpec", "SECTIONS", "LocaleCatalog", "get_catalog", "EmbedPrototype", "EmbedDraft", "register_prototype", "get_prototype", "DEFAULT_PROTOTYPE", "PersistentPanelItem", "setup_persistent_panels"]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(import_module(module, __name__), name)
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY})
@@ -1,182 +1,428 @@
 from __future__ import annotations
-from typing import Optional, Any
-from discord import ButtonStyle, CategoryChannel, Embed, ForumChannel, HTTPException, Interaction, StageChannel, Colour, SelectOption
+import asyncio
+import hashlib
+import json
+import os
+import time
+from typing import Collection, ClassVar, Dict, List, Mapping, Optional, Any, Sequence, Set, Tuple, Union
+from weakref import WeakValueDictionary
+from discord import ButtonStyle, CategoryChannel, Embed, ForumChannel, HTTPException, Interaction, Message, SelectOption, StageChannel
+from discord.abc import Messageable
 from discord.ext.commands import Bot
 from discord.ui import Item, Select, select, Button, button, View
+from creator.broadcast import Broadcaster
+from creator.channels import ChannelIndex
+from creator.constants import TEMPLATE_OPTIONS
+from creator.draft import EmbedDraft
+from creator.embed_creator.catalog import LocaleCatalog, get_catalog
+from creator.embed_creator.defaults import DEFAULT_PROTOTYPE, get_prototype
 from creator.embed_creator.methods import CreatorMethods
-from creator.input import ChannelSelectPrompt
+from creator.embed_creator.options import SelectOptionCache
+from creator.history import DraftHistory
+from creator.input import ChannelSelectPrompt, SelectPrompt
+from creator.locales import LocalizedError
+from creator.metrics import increment, span
+from creator.scheduler import PostScheduler, parse_when
+from creator.sessions import TrackedSession, registry
+from creator.storage import DraftStore
+from creator.templates import TemplateLibrary
+from creator.urlcheck import UrlChecker
 
 __all__ = ("EmbedCreator")
 
-class EmbedCreator(View):
+class EmbedCreator(TrackedSession, View):
     """
     Essa classe é uma subclasse de `discord.ui.View`.
     Destina-se a ser usada como uma classe base para criar um painel que permite os usuários criarem embeds em um canal Discord TextChannel especificado. 
 
     Parâmetros:
         bot (discord.Client ou discord.ext.commands.Bot): Uma instância do bot do Discord que vai ser usada para acessar informações do cliente como avatar, nome e ID. 
-        embed (discord.Embed): Uma instância do discord.Embed que vai ser usada como embed principal.
+        embed (discord.Embed ou EmbedDraft): Uma instância do discord.Embed (ou um rascunho) que vai ser usada como embed principal.
+        prototype (str, optional): O nome de um modelo registrado com `register_prototype`, usado quando `embed` não é informado. Por padrão é o modelo "default".
         timeout (float, optional): Um argumento opcional que é passado para a classe mãe View. É usado para especificar um timeout para a view, em segundos.
+        edit_debounce (float, optional): A janela, em segundos, em que várias atualizações da mensagem são agrupadas em uma única edição. Por padrão é 0.25.
+        store (DraftStore, optional): Ativa o modo persistente. O rascunho é salvo nesse armazenamento e os componentes do painel recebem custom_ids fixos,
+            então o painel continua funcionando depois que o bot reinicia (veja `setup_persistent_panels`).
+        session_key (str, optional): A chave do rascunho no modo persistente. Por padrão é gerada aleatoriamente.
+        max_channels (int, optional): O número máximo de chats que podem ser selecionados ao enviar a embed. Por padrão é 1.
+        broadcaster (Broadcaster, optional): O `Broadcaster` usado para enviar a embed. Por padrão é um compartilhado por todos os painéis, que envia para até 5 chats ao mesmo tempo.
+        history_limit (int, optional): O número máximo de edições que podem ser desfeitas com o botão "Desfazer". Por padrão é 50.
+        templates (TemplateLibrary, optional): Uma biblioteca de modelos. Quando informada, o menu de seleção ganha as opções para salvar a embed
+            como modelo do servidor e para carregar um modelo salvo. Para abrir o painel já com um modelo, use `embed=templates.load(...)`.
+        url_checker (UrlChecker, optional): Verifica se as URLs de imagem respondem e são imagens antes de aceitá-las. Pode ser compartilhado
+            entre os painéis, para aproveitar o cache dele. Por padrão as URLs só têm o formato validado.
+        targets (Sequence[discord.Message], optional): Ativa o modo de edição. O painel abre com a embed da primeira mensagem (se `embed` não for
+            informado) e o botão "Salvar" edita essas mensagens em vez de enviar uma nova. Só as mensagens cuja embed mudou são editadas,
+            todas de uma vez, através do `broadcaster`.
+        scheduler (PostScheduler, optional): Quando informado, o painel ganha o botão "Agendar", que agenda o envio da embed para um horário.
+        channel_index (ChannelIndex, optional): Quando informado, o seletor de chats só oferece os chats em que o bot pode enviar embeds
+            (se forem até 25; senão os outros são recusados depois da seleção). Deve ser registrado no bot com `ChannelIndex.attach`.
+        locale (str ou discord.Locale, optional): O idioma do painel (veja `creator.locales`). Por padrão os botões e o menu usam o
+            `DEFAULT_LOCALE` e os modals e mensagens usam o idioma de quem interage (`interaction.locale`).
+        editors (Collection[int ou discord.abc.Snowflake], optional): Ativa a edição compartilhada: só esses usuários (ou IDs) podem usar o painel,
+            e todos editam o mesmo rascunho ao mesmo tempo. Por padrão qualquer pessoa pode usar o painel (veja `interaction_check`).
+
+    Cada painel é acompanhado pelo `creator.sessions.registry`, que o encerra depois de ficar parado por muito tempo ou quando o limite de sessões é atingido.
+    Os textos, as opções do menu de seleção e os modals de cada idioma são compilados uma única vez em um `LocaleCatalog` e compartilhados
+    entre as instâncias; os kwargs de personalização (`send_label`, `author_label`, ...) continuam aceitos, mas para mudar os textos de todos
+    os painéis prefira registrar um catálogo com `creator.locales.register_locale`.
+    O rascunho fica guardado como um `EmbedDraft` compacto; a `discord.Embed` só é criada na hora de editar a mensagem ou enviar.
+    Vários modals podem estar abertos ao mesmo tempo: cada alteração é aplicada sobre a versão atual do rascunho, juntando seção por seção
+    as alterações feitas enquanto o modal estava aberto (veja `CreatorMethods`), e as alterações que chegam dentro de `edit_debounce`
+    viram uma única edição da mensagem.
     """
 
+    _options_cache = SelectOptionCache()
+    _broadcaster = Broadcaster()
+    _live_panels: ClassVar[WeakValueDictionary[str, EmbedCreator]] = WeakValueDictionary()
+    # ação -> estilo padrão dos botões, na ordem de `children[1:]`
+    _BUTTONS: ClassVar[Tuple[Tuple[str, ButtonStyle], ...]] = (
+        ("send", ButtonStyle.blurple),
+        ("cancel", ButtonStyle.red),
+        ("undo", ButtonStyle.grey),
+        ("redo", ButtonStyle.grey),
+        ("schedule", ButtonStyle.grey),
+    )
+
     def __init__(
         self,
         *,
         bot: Bot,
-        embed: Optional[Embed] = None,
+        embed: Optional[Union[Embed, EmbedDraft]] = None,
+        prototype: Optional[str] = None,
         timeout: Optional[float] = None,
+        edit_debounce: float = 0.25,
+        store: Optional[DraftStore] = None,
+        session_key: Optional[str] = None,
+        max_channels: int = 1,
+        broadcaster: Optional[Broadcaster] = None,
+        history_limit: int = 50,
+        templates: Optional[TemplateLibrary] = None,
+        url_checker: Optional[UrlChecker] = None,
+        targets: Optional[Sequence[Message]] = None,
+        scheduler: Optional[PostScheduler] = None,
+        channel_index: Optional[ChannelIndex] = None,
+        locale: Optional[Any] = None,
+        editors: Optional[Collection[Any]] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(timeout=timeout)
-        if not embed:
-            embed = self.get_default_embed
-        self.bot, self.embed, self.timeout, self._creator_methods = (
+        self.max_channels, self.broadcaster = max_channels, broadcaster or self._broadcaster
+        self.edit_debounce = edit_debounce
+        self._last_fingerprint: Optional[bytes] = None
+        self._pending_edit: Optional[asyncio.Task[Optional[Message]]] = None
+        self._edit_interaction: Optional[Interaction] = None
+        self._refresh_view = False
+        self.targets: List[Message] = list(targets or ())
+        # id da mensagem -> rascunho da embed publicada nela, para saber quais mensagens precisam ser editadas
+        self._published: Dict[int, Optional[EmbedDraft]] = {
+            message.id: EmbedDraft.from_embed(message.embeds[0]) if message.embeds else None for message in self.targets
+        }
+        if isinstance(embed, EmbedDraft):
+            draft = embed
+        elif embed:
+            draft = EmbedDraft.from_embed(embed)
+        elif self.targets and self._published[self.targets[0].id] is not None:
+            draft = self._published[self.targets[0].id].copy()  # type: ignore
+        else:
+            draft = (get_prototype(prototype) if prototype else DEFAULT_PROTOTYPE).draft()
+        self.history = DraftHistory(history_limit)
+        self.bot, self.timeout, self._creator_methods = (
             bot,
-            embed,
             timeout,
-            CreatorMethods(embed),
+            CreatorMethods(draft, templates, url_checker, locale, self.history),
         )
-        self.options_data = [
-            {
-                "label": kwargs.get("author_label", "Edite o Autor"),
-                "description": kwargs.get(
-                    "author_description", "Edita o nome e ícone do autor."
-                ),
-                "emoji": kwargs.get("author_emoji", "🔹"),
-                "value": "author",
-            },
-            {
-                "label": kwargs.get(
-                    "message_label", "Edite a Mensagem (título e descrição)"
-                ),
-                "description": kwargs.get(
-                    "message_description", "Edita o título e descrição da embed."
-                ),
-                "emoji": kwargs.get("message_emoji", "🔹"),
-                "value": "message",
-            },
-            {
-                "label": kwargs.get("thumbnail_label", "Edite a Thumbnail"),
-                "description": kwargs.get(
-                    "thumbnail_description", "Edita a thumbnail da embed."
-                ),
-                "emoji": kwargs.get("thumbnail_emoji", "🔹"),
-                "value": "thumbnail",
-            },
-            {
-                "label": kwargs.get("image_label", "Edite a Imagem"),
-                "description": kwargs.get(
-                    "image_description", "Edita a imagem da embed."
-                ),
-                "emoji": kwargs.get("image_emoji", "🔹"),
-                "value": "image",
-            },
-            {
-                "label": kwargs.get("footer_label", "Edite o Rodapé"),
-                "description": kwargs.get(
-                    "footer_description", "Edita o texto e o ícone do rodapé da embed."
-                ),
-                "emoji": kwargs.get("footer_emoji", "🔹"),
-                "value": "footer",
-            },
-            {
-                "label": kwargs.get("color_label", "Edite a Cor"),
-                "description": kwargs.get(
-                    "color_description", "Edita a cor da embed."
-                ),
-                "emoji": kwargs.get("color_emoji", "🔹"),
-                "value": "color",
-            },
-            {
-                "label": kwargs.get("addfield_label", "Adicione um campo"),
-                "description": kwargs.get(
-                    "addfield_description", "Adiciona um campo à embed."
-                ),
-                "emoji": kwargs.get("addfield_emoji", "🔹"),
-                "value": "addfield",
-            },
-            {
-                "label": kwargs.get("removefield_label", "Remova um campo"),
-                "description": kwargs.get(
-                    "removefield_description", "Remove um campo da embed."
-                ),
-                "emoji": kwargs.get("removefield_emoji", "🔹"),
-                "value": "removefield",
-            },
-        ]
-
-        self.children[0].options = [SelectOption(  # type: ignore
-            **option) for option in self.options_data
-        ]
-        self.children[1].label, self.children[1].emoji, self.children[1].style = kwargs.get(  # type: ignore
-            "send_label", 'Enviar'), kwargs.get("send_emoji", None), kwargs.get("send_style", ButtonStyle.blurple)
-        self.children[2].label, self.children[2].emoji, self.children[2].style = kwargs.get(  # type: ignore
-            "cancel_label", 'Cancelar'), kwargs.get("cancel_emoji", None), kwargs.get("cancel_style", ButtonStyle.red)  # type: ignore
+        self.editors: Optional[Set[int]] = None if editors is None else {getattr(editor, "id", editor) for editor in editors}
+        self.locale, catalog = locale, get_catalog(locale)
+        self.options_data, options = self._options_cache.get(kwargs, catalog)
+        if templates is None:
+            options = [option for option in options if option.value not in TEMPLATE_OPTIONS]
+        self.children[0].options = list(options)  # type: ignore
+        self.children[0].placeholder = catalog.text("select.placeholder")  # type: ignore
+        for item, (action, style) in zip(self.children[1:], self._BUTTONS):
+            label = catalog.text("button.save" if action == "send" and self.targets else f"button.{action}")
+            if kwargs:
+                label, emoji, style = kwargs.get(f"{action}_label", label), kwargs.get(f"{action}_emoji"), kwargs.get(f"{action}_style", style)
+            else:
+                emoji = None
+            item.label, item.emoji, item.style = label, emoji, style  # type: ignore
+        self._sync_history_buttons()
+        self.scheduler, self.channel_index = scheduler, channel_index
+        if scheduler is None or self.targets:
+            self.remove_item(self.children[5])
+
+        self.store, self.session_key = store, None
+        if store is not None:
+            self.session_key = session_key or os.urandom(8).hex()
+            for item, action in zip(self.children, ("edit", "send", "cancel", "undo", "redo", "schedule")):
+                item.custom_id = f"embedcreator:{self.session_key}:{action}"  # type: ignore
+            self._live_panels[self.session_key] = self
+            store.put(self.session_key, self._record())
+
+    def _record(self) -> Dict[str, Any]:
+        """Esse método retorna o que o modo persistente guarda no `store`: o rascunho, os editores e as mensagens do modo de edição."""
+        return {
+            "embed": self.draft.to_dict(),
+            "editors": None if self.editors is None else sorted(self.editors),
+            "targets": [[message.channel.id, message.id] for message in self.targets],
+        }
+
+    @classmethod
+    async def from_record(cls, record: Mapping[str, Any], *, bot: Bot, **kwargs: Any) -> EmbedCreator:
+        """
+        Esse método recria um painel persistente a partir do registro guardado no `store`, com o mesmo rascunho, os mesmos editores
+        e as mesmas mensagens do modo de edição. As mensagens são buscadas de novo, para comparar o rascunho com as embeds atuais delas;
+        as que não existem mais são ignoradas. Também aceita os registros antigos, que guardavam apenas a embed.
+
+        Parâmetros:
+            record (Mapping[str, Any]): O registro carregado do `store`.
+            bot (discord.Client ou discord.ext.commands.Bot): O bot que recebeu a interação.
+            **kwargs: Os outros argumentos do painel, por exemplo `store=` e `session_key=`. `editors` e `targets` são sempre os do registro.
+        """
+        if "embed" not in record:
+            record = {"embed": record}
+        targets = []
+        for channel_id, message_id in record.get("targets") or ():
+            channel = bot.get_channel(channel_id) or bot.get_partial_messageable(channel_id)
+            try:
+                targets.append(await channel.fetch_message(message_id))  # type: ignore
+            except HTTPException:
+                continue
+        kwargs.update(editors=record.get("editors"), targets=targets)
+        return cls(bot=bot, embed=EmbedDraft.from_dict(record["embed"]), **kwargs)
+
+    @classmethod
+    def get_live_panel(cls, session_key: str) -> Optional[EmbedCreator]:
+        """Esse método retorna o painel persistente ainda em memória com a chave informada, se existir."""
+        panel = cls._live_panels.get(session_key)
+        if panel is None or panel.is_finished():
+            return None
+        return panel
+
+    async def dispatch_persistent(self, action: str, interaction: Interaction, item: Item[Any]) -> None:
+        """
+        Esse método executa a callback do painel correspondente a `action` ("edit", "send", "cancel", "undo", "redo" ou "schedule").
+        Ele é usado para continuar um rascunho persistente que foi carregado do armazenamento, depois que o painel original saiu da memória.
+        Se depois da ação o painel não estiver ligado à mensagem (veja `PersistentPanelItem`), ele é encerrado, para que o próximo clique
+        o recrie em vez de ser ignorado.
+        """
+        callbacks = {
+            "edit": type(self).edit_select_callback,
+            "send": type(self).send_callback,
+            "cancel": type(self).cancel_callback,
+            "undo": type(self).undo_callback,
+            "redo": type(self).redo_callback,
+            "schedule": type(self).schedule_callback,
+        }
+        try:
+            if await self.interaction_check(interaction):
+                await callbacks[action](self, interaction, item)  # type: ignore
+        except Exception as error:
+            await self.on_error(interaction, error, item)
+        finally:
+            if not self.is_dispatching():
+                self.stop()
+
+    def _sync_history_buttons(self) -> None:
+        self.children[3].disabled = not self.history.can_undo  # type: ignore
+        self.children[4].disabled = not self.history.can_redo  # type: ignore
+
+    def catalog(self, interaction: Interaction) -> LocaleCatalog:
+        """Esse método retorna o catálogo usado para responder a interação: o do idioma do painel, ou o de quem interagiu."""
+        return self._creator_methods.catalog(interaction)
+
+    async def interaction_check(self, interaction: Interaction) -> bool:
+        """Esse método aceita qualquer usuário, ou, na edição compartilhada, só os usuários em `editors`."""
+        if self.editors is None or interaction.user.id in self.editors:
+            return True
+        await interaction.response.send_message(self.catalog(interaction).text("editors.denied"), ephemeral=True)
+        return False
+
+    def _forget_draft(self) -> None:
+        if self.store is not None:
+            self.store.delete(self.session_key)  # type: ignore
 
     async def on_error(self, interaction: Interaction, error: Exception, item: Item[Any]) -> None:
         if isinstance(error, HTTPException) and error.code == 50035: # erro de url
-            await interaction.followup.send('Por favor, insira um URL válido', ephemeral=True)
+            await interaction.followup.send(self.catalog(interaction).text("url.invalid"), ephemeral=True)
+
+    def fingerprint(self) -> bytes:
+        """Essa função retorna uma impressão digital da embed e da view, usada para saber se a mensagem precisa ser editada."""
+        state = json.dumps([self.draft.to_dict(), self.to_components()], sort_keys=True, default=str)
+        return hashlib.blake2b(state.encode(), digest_size=16).digest()
+
+    async def update_embed(self, interaction: Interaction, *, refresh_view: bool = False) -> Optional[Message]:
+        """
+        Essa função vai atualizar a embed inteira e editar a mensagem e view.
+        As chamadas feitas dentro de `edit_debounce` segundos são agrupadas em uma única edição, e a edição é ignorada quando nada mudou desde a última.
+
+        Parâmetros:
+            interaction (discord.Interaction): A interação cuja mensagem é editada.
+            refresh_view (bool, optional): Se a view deve ser reenviada mesmo quando nada mudou, para que o menu de seleção volte a não ter
+                nenhuma opção marcada e a mesma opção possa ser escolhida de novo. Por padrão é `False`.
+
+        Retorna:
+            message (discord.Message, optional): A mensagem editada, ou `None` se a edição foi ignorada.
+        """
+        self._edit_interaction = interaction
+        self._refresh_view = self._refresh_view or refresh_view
+        if self._pending_edit is None or self._pending_edit.done():
+            self._pending_edit = asyncio.create_task(self._flush_edit())
+        return await asyncio.shield(self._pending_edit)
+
+    async def _flush_edit(self) -> Optional[Message]:
+        if self.edit_debounce:
+            await asyncio.sleep(self.edit_debounce)
+        # atualizações que chegarem a partir daqui agendam uma nova edição
+        self._pending_edit = None
+        refresh_view, self._refresh_view = self._refresh_view, False
+        fingerprint = self.fingerprint()
+        if fingerprint == self._last_fingerprint:
+            increment("update_embed.skipped")
+            if not refresh_view:
+                return None
+            # a embed não mudou, então só a view é reenviada
+            return await self._edit_interaction.message.edit(view=self)  # type: ignore
+        with span("update_embed"):
+            message = await self._edit_interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+        self._last_fingerprint = fingerprint
+        if self.store is not None:
+            self.store.put(self.session_key, self._record())  # type: ignore
+        return message
+
+    @property
+    def draft(self) -> EmbedDraft:
+        """O rascunho atual da embed."""
+        return self._creator_methods.draft
 
-    async def update_embed(self, interaction: Interaction):
-        """Essa função vai atualizar a embed inteira e editar a mensagem e view."""
-        return await interaction.message.edit(embed=self.embed, view=self)  # type: ignore
+    @property
+    def embed(self) -> Embed:
+        """Uma `discord.Embed` nova criada a partir do rascunho atual. Alterar o objeto retornado não altera o rascunho; atribua uma embed para isso."""
+        return self.draft.to_embed()
+
+    @embed.setter
+    def embed(self, value: Embed) -> None:
+        self._creator_methods.embed = value
 
     @property
     def get_default_embed(self) -> Embed:
         """
         Esse método de classe `get_default_embed` returna um objeto `discord.Embed` pré-configurado com título, descrição, cor, autor, thumbnail, imagem e rodapé já definidos com valores específicos.
         Ele pode ser usado como um modelo padrão para criar o Embed Builder.
+        A embed é copiada do modelo imutável `DEFAULT_PROTOTYPE`, que é construído uma única vez.
 
         Retorna:
             embed (discord.Embed)
         """
-        embed = Embed(title='Isso é um título',
-                      description="Use o menu de seleção para editar minhas seções", colour=Colour.from_str('#070d2d'))
-        embed.set_author(name='Bem-vindo ao Embed Builder.',
-                         icon_url="https://i.imgur.com/8Zx1lLv.gif")
-        embed.set_thumbnail(
-            url="https://i.imgur.com/hARDXOC.png")
-        embed.set_image(
-            url="https://i.imgur.com/g1eBpIP.png")
-        embed.set_footer(
-            text='Isso é um rodapé', icon_url="https://i.imgur.com/8Zx1lLv.gif")
-        return embed
-
-    @select(placeholder="Edite uma seção")
+        return DEFAULT_PROTOTYPE.materialise()
+
+    @select()
     async def edit_select_callback(
         self, interaction: Interaction, select: Select
     ) -> None:
         """
         Esse método é uma função callback da interação `select`.
         Ele é invocado quando um usuário seleciona uma opção do menu de seleção. 
-        O método usa o atributo `callbacks` da classe `CreatorMethods` para chamar a função callback apropriada baseada na seleção do usuário.
+        O método usa `CreatorMethods.dispatch` para chamar a função callback apropriada baseada na seleção do usuário.
 
         Parâmetros:
             interaction (discord.Interaction): O objeto "interaction" representando a interação atual.
             select (discord.Select): O objeto "select" representando o menu de seleção.
         """
-        await self._creator_methods.callbacks[select.values[0]](interaction)
-        await self.update_embed(interaction)
+        registry.touch(self)
+        with span(f"callback.{select.values[0]}"):
+            await self._creator_methods.dispatch(select.values[0], interaction)
+        # o histórico é atualizado pelos próprios métodos, no momento em que cada alteração é aplicada
+        self._sync_history_buttons()
+        await self.update_embed(interaction, refresh_view=True)
 
     @button()
     async def send_callback(self, interaction: Interaction, button: Button) -> None:
         """
         Esse método é uma função callback para a intereração `button`. Ele é invocado quando o usuário clica no botão "Enviar".
-        O método cria um objeto `ChannelSelectPrompt` e envia ele como uma mensagem ephemeral para o usuário. E então ele espera o usuário selecionar um chat.
-        Se um chat é selecionado, o método envia a embed para o chat selecionado e então deleta a mensagem de interação original.
+        O método envia um seletor de chats como uma mensagem ephemeral para o usuário (veja `_pick_channels`). E então ele espera o usuário selecionar um ou mais chats (até `max_channels`).
+        A embed é enviada para os chats selecionados em paralelo (veja `creator.broadcast.Broadcaster`) e então a mensagem de interação original é deletada.
+        Os chats em que o envio falhou são informados ao usuário.
 
         Parâmetros:
             interaction (discord.Interaction): O objeto "interaction" representando a interação atual.
             button (discord.Button): O objeto "button" representando o botão "Enviar".
         """
-        prompt = ChannelSelectPrompt(
-            "Selecione um chat para enviar essa embed...", True, 1)
-        await interaction.response.send_message(view=prompt, ephemeral=True)
-        await prompt.wait()
-        if prompt.values:
-            if not isinstance(prompt.values[0], (StageChannel, ForumChannel, CategoryChannel)):
-                await prompt.values[0].send(embed=self.embed)  # type: ignore
+        registry.touch(self)
+        if self.targets:
+            return await self._save_targets(interaction)
+        channels = await self._pick_channels(interaction, "send")
+        if channels:
+            results = await self.broadcaster.send(channels, embed=self.embed)
+            if failed := [result for result in results if not result.ok]:
+                await interaction.followup.send(
+                    self.catalog(interaction).text("send.failed", channels=", ".join(str(result.channel) for result in failed)), ephemeral=True
+                )
+            if len(failed) < len(results):
                 await interaction.message.delete()  # type: ignore
+                self._forget_draft()
+
+    async def _pick_channels(self, interaction: Interaction, action: str) -> List[Messageable]:
+        """
+        Esse método pergunta ao usuário para quais chats a embed vai e retorna os chats em que ela pode ser enviada.
+        Com um `channel_index`, quando o bot pode enviar embeds em até 25 chats do servidor, o seletor lista só esses chats;
+        senão é usado o seletor de chats do Discord e os chats recusados pelo índice são informados ao usuário.
+
+        Parâmetros:
+            interaction (discord.Interaction): A interação atual. O seletor é a resposta dela, ou um followup se ela já foi respondida.
+            action (str): A ação do placeholder do seletor no catálogo ("send" ou "schedule").
+        """
+        catalog = self.catalog(interaction)
+        placeholder = catalog.text(f"channels.{action}.one" if self.max_channels == 1 else f"channels.{action}.many")
+        guild, index = interaction.guild, self.channel_index
+        postable = index.channels(guild) if index is not None and guild is not None else None
+        send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+        if postable is not None and not postable:
+            await send(catalog.text("channels.none"), ephemeral=True)
+            return []
+        if postable is not None and len(postable) <= 25:
+            options = [SelectOption(label=f"#{channel.name}"[:100], value=str(channel.id)) for channel in postable]
+            prompt = SelectPrompt(placeholder, options, min(self.max_channels, len(options)), True)
+            await send(view=prompt, ephemeral=True)
+            await prompt.wait()
+            return [channel for channel in map(guild.get_channel_or_thread, map(int, prompt.values or ())) if channel is not None]  # type: ignore
+        channel_prompt = ChannelSelectPrompt(placeholder, True, self.max_channels)
+        await send(view=channel_prompt, ephemeral=True)
+        await channel_prompt.wait()
+        channels = [channel for channel in channel_prompt.values or () if channel is not None]
+        if index is None:
+            return [channel for channel in channels if not isinstance(channel, (StageChannel, ForumChannel, CategoryChannel))]
+        channels, rejected = index.split(channels)
+        if rejected:
+            await interaction.followup.send(catalog.text("channels.rejected", channels=", ".join(map(str, rejected))), ephemeral=True)
+        return channels
+
+    async def _save_targets(self, interaction: Interaction) -> None:
+        """
+        Esse método salva o rascunho nas mensagens do modo de edição. As mensagens que já mostram essa embed não são editadas;
+        as outras são editadas ao mesmo tempo, mantendo as demais embeds de cada mensagem.
+        """
+        await interaction.response.defer()
+        draft = self.draft
+        changed = [message for message in self.targets if self._published[message.id] != draft]
+        results = []
+        if changed:
+            embed = self.embed
+            results = await self.broadcaster.edit((message, {"embeds": [embed, *message.embeds[1:]]}) for message in changed)
+        edited = {message.id: result for message, result in zip(changed, results) if result.ok}
+        for index, message in enumerate(self.targets):
+            if message.id in edited:
+                self.targets[index] = edited[message.id].message  # type: ignore
+                self._published[message.id] = draft.copy()
+        failed = [result for result in results if not result.ok]
+        catalog = self.catalog(interaction)
+        summary = catalog.text("targets.summary", edited=len(edited), unchanged=len(self.targets) - len(changed))
+        if failed:
+            summary += "\n" + catalog.text("targets.failed", channels=", ".join(str(result.channel) for result in failed))
+        await interaction.followup.send(summary, ephemeral=True)
+        if not failed:
+            await interaction.message.delete()  # type: ignore
+            self._forget_draft()
 
     @button()
     async def cancel_callback(self, interaction: Interaction, button: Button) -> None:
@@ -189,4 +435,76 @@ class EmbedCreator(View):
             button (Button): O objeto "button" representando o botão "Cancelar".
         """
         await interaction.message.delete()  # type: ignore
+        self._forget_draft()
         self.stop()
+
+    @button(disabled=True)
+    async def undo_callback(self, interaction: Interaction, button: Button) -> None:
+        """
+        Esse método é uma função callback para a interação `button`. Ele é invocado quando um usuário clica no botão "Desfazer".
+        O método volta o rascunho para a versão anterior à última edição e atualiza a mensagem.
+
+        Parâmetros:
+            interaction (Interaction): O objeto "interaction" representando a interação atual.
+            button (Button): O objeto "button" representando o botão "Desfazer".
+        """
+        registry.touch(self)
+        await self._move_history(interaction, self.history.undo(self.draft))
+
+    @button(disabled=True)
+    async def redo_callback(self, interaction: Interaction, button: Button) -> None:
+        """
+        Esse método é uma função callback para a interação `button`. Ele é invocado quando um usuário clica no botão "Refazer".
+        O método aplica de novo a última edição desfeita e atualiza a mensagem.
+
+        Parâmetros:
+            interaction (Interaction): O objeto "interaction" representando a interação atual.
+            button (Button): O objeto "button" representando o botão "Refazer".
+        """
+        registry.touch(self)
+        await self._move_history(interaction, self.history.redo(self.draft))
+
+    async def _move_history(self, interaction: Interaction, draft: Optional[EmbedDraft]) -> None:
+        await interaction.response.defer()
+        if draft is None:
+            return
+        self._creator_methods.restore(draft)
+        self._sync_history_buttons()
+        await self.update_embed(interaction)
+
+    @button()
+    async def schedule_callback(self, interaction: Interaction, button: Button) -> None:
+        """
+        Esse método é uma função callback para a interação `button`. Ele é invocado quando um usuário clica no botão "Agendar".
+        O método pergunta o horário em um modal e os chats em um seletor de chats, agenda o envio no `scheduler` e deleta o painel.
+
+        Parâmetros:
+            interaction (Interaction): O objeto "interaction" representando a interação atual.
+            button (Button): O objeto "button" representando o botão "Agendar".
+        """
+        registry.touch(self)
+        catalog = self.catalog(interaction)
+        if self.scheduler is None:
+            return await interaction.response.send_message(catalog.text("schedule.disabled"), ephemeral=True)
+        section = catalog.sections["schedule"]
+        modal = section.modal(self.draft)
+        with span("interaction.send_modal"):
+            await interaction.response.send_modal(modal)
+        with span("modal.wait"):
+            await modal.wait()
+        if not modal.submitted:
+            return increment("modal.unsubmitted")
+        try:
+            when = parse_when(section.values(modal)["when"], self.scheduler.timezone)
+        except LocalizedError as error:
+            return await self._reject(interaction, error)
+        if when.timestamp() <= time.time():
+            return await interaction.followup.send(catalog.text("schedule.past"), ephemeral=True)
+        channels = await self._pick_channels(interaction, "schedule")
+        if not channels:
+            return
+        self.scheduler.schedule(self.draft, channels, when, guild_id=interaction.guild_id or 0)
+        await interaction.followup.send(catalog.text("schedule.done", when=f"<t:{int(when.timestamp())}:F>"), ephemeral=True)
+        await interaction.message.delete()  # type: ignore
+        self._forget_draft()
+
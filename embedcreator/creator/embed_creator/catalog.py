@@ -0,0 +1,66 @@
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
+from discord import SelectOption
+from creator.constants import DEFAULT_OPTIONS
+from creator.embed_creator.sections import SECTIONS, SectionSpec
+from creator.locales import get_messages, resolve_locale
+
+__all__ = ("LocaleCatalog", "get_catalog")
+
+
+class LocaleCatalog:
+    """
+    Essa classe é o catálogo de um idioma já compilado para o painel: as opções do menu de seleção e os modals de cada seção
+    são construídos uma única vez e compartilhados, sem mudanças, por todas as sessões que usam o idioma.
+
+    Atributos:
+        locale (str): O código do idioma.
+        messages (Mapping[str, str]): O catálogo de textos de `creator.locales`.
+        options_data (Tuple[Mapping[str, Any], ...]): Os dados das opções do menu de seleção, na ordem em que aparecem.
+        options (Tuple[discord.SelectOption, ...]): As opções do menu de seleção.
+        sections (Mapping[str, SectionSpec]): As seções editáveis, com os modals traduzidos.
+    """
+
+    __slots__ = ("locale", "messages", "options_data", "options", "sections")
+
+    def __init__(self, locale: str, messages: Mapping[str, str]) -> None:
+        self.locale, self.messages = locale, messages
+        self.options_data: Tuple[Mapping[str, Any], ...] = tuple(
+            MappingProxyType({
+                "label": messages.get(f"option.{value}.label", defaults["label"]),
+                "description": messages.get(f"option.{value}.description", defaults["description"]),
+                "emoji": defaults["emoji"],
+                "value": value,
+            })
+            for value, defaults in DEFAULT_OPTIONS.items()
+        )
+        self.options = tuple(SelectOption(**option) for option in self.options_data)
+        self.sections: Mapping[str, SectionSpec] = MappingProxyType({name: section.localize(messages) for name, section in SECTIONS.items()})
+
+    def text(self, key: str, **fields: Any) -> str:
+        """Esse método retorna o texto da chave informada, com os campos preenchidos."""
+        text = self.messages[key]
+        return text.format(**fields) if fields else text
+
+    def __repr__(self) -> str:
+        return f"<LocaleCatalog locale={self.locale!r}>"
+
+
+_compiled: Dict[str, LocaleCatalog] = {}
+
+
+def get_catalog(locale: Any = None) -> LocaleCatalog:
+    """
+    Essa função retorna o catálogo compilado do idioma informado, compilando-o apenas no primeiro uso
+    (ou depois que o idioma for registrado de novo com `register_locale`).
+
+    Parâmetros:
+        locale (str ou discord.Locale, optional): O idioma, por exemplo `interaction.locale`. Por padrão é o `DEFAULT_LOCALE`.
+    """
+    code = resolve_locale(locale)
+    catalog = _compiled.get(code)
+    messages = get_messages(code)
+    if catalog is None or catalog.messages is not messages:
+        catalog = _compiled[code] = LocaleCatalog(code, messages)
+    return catalog
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Union
+from discord import Embed
+from creator.constants import DEFAULT_EMBED
+from creator.draft import EmbedDraft
+
+__all__ = ("EmbedPrototype", "EmbedDraft", "register_prototype", "get_prototype", "DEFAULT_PROTOTYPE")
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class EmbedPrototype:
+    """
+    Essa classe guarda um modelo imutável de embed, construído uma única vez e compartilhado por todas as sessões.
+
+    Parâmetros:
+        name (str): O nome do modelo no registro.
+        embed (discord.Embed ou EmbedDraft): A embed usada como base do modelo. Ela é copiada, então alterações posteriores não afetam o modelo.
+    """
+
+    __slots__ = ("name", "_payload", "_draft")
+
+    def __init__(self, name: str, embed: Union[Embed, EmbedDraft]) -> None:
+        self.name = name
+        self._draft = embed.copy() if isinstance(embed, EmbedDraft) else EmbedDraft.from_embed(embed)
+        self._payload: Mapping[str, Any] = _freeze(self._draft.to_dict())
+
+    @property
+    def payload(self) -> Mapping[str, Any]:
+        """O dicionário (somente leitura) da embed no formato da API do Discord."""
+        return self._payload
+
+    def materialise(self) -> Embed:
+        """Esse método cria um novo objeto `discord.Embed` independente a partir do modelo."""
+        return self._draft.to_embed()
+
+    def draft(self) -> EmbedDraft:
+        """Esse método cria um rascunho baseado no modelo. Ele compartilha todos os valores com o modelo até ser editado."""
+        return self._draft.copy()
+
+    def __repr__(self) -> str:
+        return f"<EmbedPrototype name={self.name!r}>"
+
+
+_prototypes: Dict[str, EmbedPrototype] = {}
+
+
+def register_prototype(name: str, embed: Union[Embed, EmbedDraft]) -> EmbedPrototype:
+    """
+    Essa função registra (ou substitui) um modelo de embed com o nome informado.
+
+    Retorna:
+        prototype (EmbedPrototype)
+    """
+    prototype = EmbedPrototype(name, embed)
+    _prototypes[name] = prototype
+    return prototype
+
+
+def get_prototype(name: str) -> EmbedPrototype:
+    """Essa função retorna o modelo registrado com o nome informado. Levanta `KeyError` se ele não existir."""
+    return _prototypes[name]
+
+
+DEFAULT_PROTOTYPE = register_prototype("default", EmbedDraft.from_dict(DEFAULT_EMBED))
@@ -1,8 +1,20 @@
 from __future__ import annotations
-from typing import Callable, Dict
+import asyncio
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+from creator.draft import EmbedDraft
+from creator.embed_creator.catalog import LocaleCatalog, get_catalog
+from creator.embed_creator.sections import MODAL_MAX_LENGTH
+from creator.history import DraftHistory
 from creator.input import ModalInput, SelectPrompt
-from discord import Colour, Embed, HTTPException, Interaction, SelectOption, TextStyle
-from discord.ui import TextInput
+from creator.locales import LocalizedError
+from creator.metrics import increment, span
+from creator.templates import TemplateLibrary
+from creator.urlcheck import UrlChecker
+from creator.validation import EmbedValidationError, EmbedValidator
+from creator.versioning import DraftConflictError, DraftVersions, merge_values
+from discord import Colour, Embed, File, Interaction, SelectOption
 
 __all__ = ("CreatorMethods")
 
@@ -11,230 +23,316 @@ class CreatorMethods:
     Essa classe contém todos os métodos para editar uma embed. Destina-se a ser herdado pela classe principal `EmbedCreator`.
 
     Atributos:
-        embed (discord.Embed): O objeto da embed a ser editado.
+        draft (EmbedDraft): O rascunho compacto que é editado diretamente pelos métodos.
+        embed (discord.Embed): Uma `discord.Embed` nova criada a partir do rascunho a cada leitura. Atribuir uma embed substitui o rascunho.
+        validator (EmbedValidator): O validador que confere cada alteração com os limites do Discord antes de ela ser aplicada.
+        templates (TemplateLibrary, optional): A biblioteca de modelos usada por `save_template` e `load_template`.
+        url_checker (UrlChecker, optional): Se informado, as URLs de imagem só são aceitas depois de verificadas por ele.
+        locale (str ou discord.Locale, optional): O idioma dos modals e mensagens. Se `None`, é usado o idioma de cada interação.
+        history (DraftHistory, optional): O histórico em que cada alteração aplicada é guardada, para desfazer.
+        versions (DraftVersions): A versão atual do rascunho e de cada seção. Como vários modals podem estar abertos ao mesmo tempo
+            (de uma ou de várias pessoas), cada alteração guarda a versão sobre a qual foi preparada: se a seção mudou desde então,
+            os valores são juntados atributo por atributo com `merge_values`, e a alteração é recusada se as duas mexeram no mesmo atributo.
+        CALLBACKS (Dict[str, str]): A tabela, compartilhada pela classe, que liga cada opção do menu de seleção ao nome do método que a trata.
 
     """
 
-    def __init__(self, embed: Embed) -> None:
-        self.embed = embed
-        self.callbacks: Dict[str, Callable] = {
-            "author": self.edit_author,
-            "message": self.edit_message,
-            "thumbnail": self.edit_thumbnail,
-            "image": self.edit_image,
-            "footer": self.edit_footer,
-            "color": self.edit_colour,
-            "addfield": self.add_field,
-            "removefield": self.remove_field,
-        }
+    __slots__ = ("draft", "_validator", "templates", "url_checker", "locale", "history", "versions")
 
+    CALLBACKS: ClassVar[Dict[str, str]] = {
+        "author": "edit_author",
+        "message": "edit_message",
+        "thumbnail": "edit_thumbnail",
+        "image": "edit_image",
+        "footer": "edit_footer",
+        "color": "edit_colour",
+        "addfield": "add_field",
+        "removefield": "remove_field",
+        "importjson": "import_json",
+        "exportjson": "export_json",
+        "savetemplate": "save_template",
+        "loadtemplate": "load_template",
+    }
+
+    def __init__(
+        self,
+        embed: Union[Embed, EmbedDraft],
+        templates: Optional[TemplateLibrary] = None,
+        url_checker: Optional[UrlChecker] = None,
+        locale: Optional[Any] = None,
+        history: Optional[DraftHistory] = None,
+    ) -> None:
+        self.draft = embed if isinstance(embed, EmbedDraft) else EmbedDraft.from_embed(embed)
+        self._validator: Optional[EmbedValidator] = None
+        self.templates = templates
+        self.url_checker = url_checker
+        self.locale = locale
+        self.history = history
+        self.versions = DraftVersions()
+
+    async def dispatch(self, value: str, interaction: Interaction) -> None:
+        """Esse método chama o método correspondente à opção `value` do menu de seleção."""
+        await getattr(self, self.CALLBACKS[value])(interaction)
+
+    @property
+    def callbacks(self) -> Dict[str, Callable]:
+        """Os métodos ligados a cada opção do menu de seleção. Prefira `dispatch`, que não cria esse dicionário."""
+        return {value: getattr(self, name) for value, name in self.CALLBACKS.items()}
+
+    @property
+    def embed(self) -> Embed:
+        return self.draft.to_embed()
+
+    @embed.setter
+    def embed(self, value: Embed) -> None:
+        self.draft = EmbedDraft.from_embed(value)
+        self._validator = None
+        self.versions.bump()
+
+    def restore(self, draft: EmbedDraft) -> None:
+        """Esse método substitui o rascunho atual por `draft`, por exemplo uma versão do histórico. O histórico não é alterado."""
+        self.draft = draft
+        self._validator = None
+        self.versions.bump()
+
+    @contextmanager
+    def _changing(self, *sections: str) -> Iterator[None]:
+        """
+        Esse gerenciador envolve a aplicação de uma alteração no rascunho: se o rascunho mudou, registra uma nova versão das seções
+        informadas (ou da embed inteira) e guarda a versão anterior no histórico. Não deve haver `await` dentro dele,
+        para que a alteração seja aplicada de uma vez sobre a versão atual.
+        """
+        previous = self.draft.copy()
+        yield
+        if self.draft != previous:
+            self.versions.bump(sections)
+            if self.history is not None:
+                self.history.record(previous, self.draft)
+
+    async def _conflict(self, interaction: Interaction, key: str) -> None:
+        increment("draft.conflicts")
+        await interaction.followup.send(self.catalog(interaction).text(key), ephemeral=True)
+
+    @property
+    def validator(self) -> EmbedValidator:
+        if self._validator is None:
+            self._validator = EmbedValidator(self.draft)
+        return self._validator
+
+    def catalog(self, interaction: Interaction) -> LocaleCatalog:
+        """Esse método retorna o catálogo compilado usado para responder a interação: o de `locale`, ou o do idioma de quem interagiu."""
+        return get_catalog(self.locale or getattr(interaction, "locale", None))
+
+    async def _prompt(self, interaction: Interaction, modal: ModalInput) -> bool:
+        """Esse método envia o modal e espera a resposta do usuário. Retorna `False` se o modal não foi enviado pelo usuário."""
+        with span("interaction.send_modal"):
+            await interaction.response.send_modal(modal)
+        with span("modal.wait"):
+            await modal.wait()
+        if not modal.submitted:
+            increment("modal.unsubmitted")
+        return modal.submitted
+
+    async def _reject(self, interaction: Interaction, error: LocalizedError) -> None:
+        """Esse método mostra os problemas do erro para o usuário, no idioma do painel."""
+        catalog = self.catalog(interaction)
+        await interaction.followup.send("\n".join(catalog.text(key, **params) for key, params in error.problems), ephemeral=True)
+
+    async def _check_images(self, urls: Iterable[str]) -> None:
+        """
+        Esse método verifica as URLs de imagem com o `url_checker`, se houver um.
+
+        Levanta:
+            EmbedValidationError: Se alguma URL não responder ou não for uma imagem.
+        """
+        if self.url_checker is None:
+            return
+        if problems := await self.url_checker.problems(urls):
+            raise EmbedValidationError(problems)
+
+    def edit_fields(
+        self,
+        *,
+        remove: Iterable[int] = (),
+        edits: Optional[Mapping[int, Mapping[str, Any]]] = None,
+        order: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Esse método aplica várias alterações nos campos da embed de uma só vez, reconstruindo a lista de campos uma única vez.
+        Todos os índices se referem às posições dos campos antes das alterações.
+
+        Parâmetros:
+            remove (Iterable[int], optional): Os índices dos campos a serem removidos.
+            edits (Mapping[int, Mapping[str, Any]], optional): Os novos valores (`name`, `value` e/ou `inline`) de cada campo a ser editado.
+            order (Sequence[int], optional): A nova ordem dos campos. Os campos que não aparecerem nela ficam no final, na ordem original.
+
+        Levanta:
+            IndexError: Se algum índice não for a posição de um campo. Nesse caso nenhuma alteração é aplicada.
+            EmbedValidationError: Se alguma edição deixar a embed fora dos limites do Discord. Nesse caso nenhuma alteração é aplicada.
+        """
+        draft = self.draft
+        fields = draft.fields
+        removed = set(remove)
+        edits = edits or {}
+        order = list(order) if order is not None else None
+        for index in (*removed, *edits, *(order or ())):
+            if not 0 <= index < len(fields):
+                raise IndexError(f"A embed não tem um campo na posição {index}; ela tem {len(fields)} campo(s).")
+        validator = self.validator
+        validator.remove_fields(removed)
+        try:
+            for index, changes in edits.items():
+                if index not in removed:
+                    name, value, _ = fields[index]
+                    validator.check_field(
+                        str(changes.get("name", name)), str(changes.get("value", value)),
+                        index - sum(1 for other in removed if other < index),
+                    )
+        except BaseException:
+            validator.sync_fields(draft)
+            raise
+        if order is None:
+            indexes = range(len(fields))
+        else:
+            listed = dict.fromkeys(order)
+            indexes = [*listed, *(index for index in range(len(fields)) if index not in listed)]
+        new_fields: List[Any] = []
+        for index in indexes:
+            if index in removed:
+                continue
+            name, value, inline = fields[index]
+            changes = edits.get(index)
+            if changes:
+                name, value, inline = (
+                    str(changes.get("name", name)), str(changes.get("value", value)), bool(changes.get("inline", inline))
+                )
+            new_fields.append((name, value, inline))
+        with self._changing("fields"):
+            draft.fields = tuple(new_fields)
+        validator.sync_fields(draft)
+
+    async def edit_section(self, interaction: Interaction, name: str) -> None:
+        """
+        Esse método edita uma seção descrita em `SECTIONS`: envia o modal da seção, valida os valores com as regras de cada caixa
+        e os aplica no rascunho.
+
+        Parâmetros:
+            interaction (discord.Interaction): A interação que abriu o modal.
+            name (str): O nome da seção em `SECTIONS`, por exemplo "author".
+        """
+        section = self.catalog(interaction).sections[name]
+        version, shown = self.versions.version, section.current(self.draft)
+        modal = section.modal(self.draft)
+        if not await self._prompt(interaction, modal):
+            return
+        values = section.values(modal)
+        try:
+            await self._check_images(section.image_urls(values))
+            if self.versions.changed_since(version, name):
+                # a seção foi alterada por outra edição enquanto o modal estava aberto
+                merged = merge_values(shown, values, section.current(self.draft))
+                values.update((key, value or "") for key, value in merged.items())
+                increment("draft.merges")
+            section.validate(self.validator, values)
+        except EmbedValidationError as error:
+            # a validação pode ter contado textos que não foram aplicados, então os tamanhos são recalculados no próximo uso
+            self._validator = None
+            return await self._reject(interaction, error)
+        except DraftConflictError:
+            return await self._conflict(interaction, "conflict.section")
+        with self._changing(name):
+            section.apply(self.draft, values)
 
     async def edit_author(self, interaction: Interaction) -> None:
         """Esse método edita o autor da embed"""
-        modal = ModalInput(title="Edite o autor da embed")
-        modal.add_item(
-            TextInput(
-                label="Nome do autor",
-                max_length=100,
-                default=self.embed.author.name,
-                placeholder="Nome do autor para ser mostrado na embed",
-                required=False,
-            )
-        )
-        modal.add_item(
-            TextInput(
-                label="Url do ícone do autor",
-                default=self.embed.author.icon_url,
-                placeholder="Ícone do autor para ser mostrado na embed",
-                required=False,
-            )
-        )
-        modal.add_item(
-            TextInput(
-                label="Url do autor",
-                default=self.embed.author.url,
-                placeholder="URL para definir como o link do autor da embed",
-                required=False,
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        try:
-            self.embed.set_author(
-                name=str(modal.children[0]),
-                icon_url=str(modal.children[1]),
-                url=str(modal.children[2]),
-            )
-        except HTTPException:
-            self.embed.set_author(
-                name=str(modal.children[0])
-            )
+        await self.edit_section(interaction, "author")
 
     async def edit_message(self, interaction: Interaction) -> None:
         """Esse método edita a mensagem da embed (discord.Embed.title e discord.Embed.description)"""
-        modal = ModalInput(title="Edite a mensagem da embed")
-        modal.add_item(
-            TextInput(
-                label="Título da embed",
-                max_length=255,
-                default=self.embed.title,
-                placeholder="Título para ser mostrado na embed",
-                required=False,
-            )
-        )
-        modal.add_item(
-            TextInput(
-                label="Descrição da embed",
-                default=self.embed.description,
-                placeholder="Descrição para ser mostrada na embed",
-                style=TextStyle.paragraph,
-                required=False,
-                max_length=2000,
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        self.embed.title, self.embed.description = str(modal.children[0]), str(
-            modal.children[1]
-        )
+        await self.edit_section(interaction, "message")
 
     async def edit_thumbnail(self, interaction: Interaction) -> None:
         """Esse método edita a thumbnail da embed"""
-        modal = ModalInput(title="Edite a thumbnail da embed")
-        modal.add_item(
-            TextInput(
-                label="Url da thumbnail",
-                default=self.embed.thumbnail.url,
-                placeholder="Thumbnail para ser mostrada na embed",
-                required=False,
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        self.embed.set_thumbnail(url=str(modal.children[0]))
+        await self.edit_section(interaction, "thumbnail")
 
     async def edit_image(self, interaction: Interaction) -> None:
         """Esse método edita a imagem da embed"""
-        modal = ModalInput(title="Edite a imagem da embed")
-        modal.add_item(
-            TextInput(
-                label="Url da imagem",
-                default=self.embed.image.url,
-                placeholder="Imagem para ser mostrada na embed",
-                required=False,
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        self.embed.set_image(url=str(modal.children[0]))
+        await self.edit_section(interaction, "image")
 
     async def edit_footer(self, interaction: Interaction) -> None:
         """Esse método edita o rodapé da embed (text, icon_url)"""
-        modal = ModalInput(title="Edite o rodapé da embed")
-        modal.add_item(
-            TextInput(
-                label="Texto do rodapé",
-                max_length=255,
-                required=False,
-                default=self.embed.footer.text,
-                placeholder="Texto para ser mostrado no rodapé da embed",
-            )
-        )
-        modal.add_item(
-            TextInput(
-                label="Ícone do rodapé",
-                required=False,
-                default=self.embed.footer.icon_url,
-                placeholder="Ícone para ser mostrado no rodapé da embed",
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
-        self.embed.set_footer(
-            text=str(modal.children[0]), icon_url=str(modal.children[1])
-        )
+        await self.edit_section(interaction, "footer")
 
     async def edit_colour(self, interaction: Interaction) -> None:
         """Esse método edita a cor da embed"""
-        modal = ModalInput(title="Edite a cor da embed")
-        modal.add_item(
-            TextInput(
-                label="Cor da embed",
-                placeholder="Cor para ser mostrada na embed (ex: #070d2d)",
-                max_length=20
-            )
-        )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
+        catalog = self.catalog(interaction)
+        version, colour = self.versions.version, self.draft.colour
+        modal = catalog.sections["color"].modal(self.draft, colour=None if colour is None else f"#{colour:06x}")
+        if not await self._prompt(interaction, modal):
+            return
+        shown = colour
         try:
             colour = Colour.from_str(str(modal.children[0]))
         except:
-            await interaction.followup.send(
-                "Por favor, informe um código HEX válido.", ephemeral=True
-            )
+            await interaction.followup.send(catalog.text("colour.invalid"), ephemeral=True)
         else:
-            self.embed.color = colour
+            value = colour.value
+            try:
+                if self.versions.changed_since(version, "color"):
+                    value = merge_values({"colour": shown}, {"colour": value}, {"colour": self.draft.colour})["colour"]
+                if value is not None:
+                    self.validator.check_colour(value)
+            except EmbedValidationError as error:
+                return await self._reject(interaction, error)
+            except DraftConflictError:
+                return await self._conflict(interaction, "conflict.section")
+            with self._changing("color"):
+                self.draft.colour = value
 
     async def add_field(self, interaction: Interaction) -> None:
-        if len(self.embed.fields) >= 25:
-            return await interaction.response.send_message(
-                "Você não pode adicionar mais que 25 campos.", ephemeral=True
-            )
-        modal = ModalInput(title="Adicionar novo campo")
-        modal.add_item(
-            TextInput(
-                label="Nome do campo",
-                placeholder="Nome para ser mostrado no campo",
-                max_length=255,
-            )
-        )
-        modal.add_item(
-            TextInput(label="Valor do campo", 
-                      placeholder='Valor para ser mostrado no campo',
-                      max_length=2000, 
-                      style=TextStyle.paragraph)
-        )
-        modal.add_item(
-            TextInput(
-                label="Campos na mesma linha (True/False)",
-                default="True",
-                max_length=5,
-                placeholder="Os campos ficarão na mesma linha? (True ou False)"),
-            )
-        await interaction.response.send_modal(modal)
-        await modal.wait()
+        catalog = self.catalog(interaction)
+        if self.validator.field_count >= 25:
+            return await interaction.response.send_message(catalog.text("field.limit"), ephemeral=True)
+        section = catalog.sections["addfield"]
+        modal = section.modal(self.draft)
+        if not await self._prompt(interaction, modal):
+            return
+        values = section.values(modal)
         try:
             inline = False
-            if str(modal.children[2]).lower() == "true":
+            if values["inline"].lower() == "true":
                 inline = True
-            elif str(modal.children[2]).lower() == "false":
+            elif values["inline"].lower() == "false":
                 inline = False
             else:
                 raise Exception("Resposta inválida.")
         except:
-            await interaction.followup.send(
-                "Por favor, informe uma opção válida em `campos na mesma linha`: ou True ou False.",
-                ephemeral=True,
-            )
+            await interaction.followup.send(catalog.text("field.inline_invalid"), ephemeral=True)
         else:
-            self.embed.add_field(
-                name=str(modal.children[0]), value=str(modal.children[1]), inline=inline
-            )
+            name, value = values["name"], values["value"]
+            try:
+                self.validator.check_field(name, value)
+            except EmbedValidationError as error:
+                return await self._reject(interaction, error)
+            with self._changing("fields"):
+                self.draft.fields += ((name, value, inline),)
 
     async def remove_field(self, interaction: Interaction) -> None:
-        if not self.embed.fields:
-            return await interaction.response.send_message("Não há campos para serem removidos", ephemeral=True)
+        catalog = self.catalog(interaction)
+        version, fields = self.versions.version, self.draft.fields
+        if not fields:
+            return await interaction.response.send_message(catalog.text("field.none"), ephemeral=True)
         field_options = list()
-        for index, field in enumerate(self.embed.fields):
+        for index, (name, _, _) in enumerate(fields):
             field_options.append(
                 SelectOption(
-                    label=str(field.name)[0:30],
+                    label=str(name)[0:30],
                     value=str(index),
                     emoji="\U0001f5d1"
                 )
             )
         select = SelectPrompt(
-            placeholder="Selecione um campo para a remoção...",
+            placeholder=catalog.text("field.remove_placeholder"),
             options=field_options,
             max_values=len(field_options),
             ephemeral=True
@@ -243,5 +341,102 @@ class CreatorMethods:
         await select.wait()
         
         if vals := select.values:
-            for value in vals:
-                self.embed.remove_field(int(value))
\ No newline at end of file
+            remove: Iterable[int] = map(int, vals)
+            if self.versions.changed_since(version, "fields"):
+                # os índices se referem aos campos mostrados no menu, então os mesmos campos são procurados na lista atual;
+                # os que já foram removidos ou editados por outra edição são ignorados
+                current, remove = self.draft.fields, []
+                for field in (fields[index] for index in map(int, vals)):
+                    index = next((index for index, other in enumerate(current) if other == field and index not in remove), None)
+                    if index is not None:
+                        remove.append(index)
+                increment("draft.merges")
+            self.edit_fields(remove=remove)
+
+    async def import_json(self, interaction: Interaction) -> None:
+        """
+        Esse método substitui a embed inteira por um JSON de embed da API do Discord, informado em um único modal.
+        O JSON é validado por completo antes de ser aplicado, então a embed muda de uma só vez ou não muda.
+        """
+        version, current = self.versions.version, self.draft.to_json()
+        modal = self.catalog(interaction).sections["importjson"].modal(self.draft, json=current if len(current) <= MODAL_MAX_LENGTH else None)
+        if not await self._prompt(interaction, modal):
+            return
+        try:
+            draft = EmbedDraft.from_json(str(modal.children[0]))
+        except LocalizedError as error:
+            return await self._reject(interaction, error)
+        validator = EmbedValidator()
+        try:
+            validator.check_draft(draft)
+            await self._check_images(draft.image_urls())
+        except EmbedValidationError as error:
+            return await self._reject(interaction, error)
+        if self.versions.changed_since(version):
+            # substituir a embed inteira apagaria as alterações feitas enquanto o modal estava aberto
+            return await self._conflict(interaction, "conflict.draft")
+        with self._changing():
+            self.draft, self._validator = draft, validator
+
+    async def export_json(self, interaction: Interaction) -> None:
+        """Esse método envia a embed atual em JSON para o usuário, como mensagem ou, se for grande demais, como arquivo."""
+        data = self.draft.to_json()
+        if len(data) <= 1980:
+            await interaction.response.send_message(f"```json\n{data}\n```", ephemeral=True)
+        else:
+            await interaction.response.send_message(
+                file=File(BytesIO(data.encode()), filename="embed.json"), ephemeral=True
+            )
+
+    async def save_template(self, interaction: Interaction) -> None:
+        """Esse método salva a embed atual como um modelo do servidor, com o nome informado em um modal."""
+        catalog = self.catalog(interaction)
+        if self.templates is None:
+            return await interaction.response.send_message(catalog.text("templates.disabled"), ephemeral=True)
+        section = catalog.sections["savetemplate"]
+        modal = section.modal(self.draft)
+        if not await self._prompt(interaction, modal):
+            return
+        name = section.values(modal)["name"].strip()
+        if not name:
+            return await interaction.followup.send(catalog.text("templates.empty_name"), ephemeral=True)
+        await asyncio.get_running_loop().run_in_executor(None, self.templates.save, interaction.guild_id or 0, name, self.draft)
+        await interaction.followup.send(catalog.text("templates.saved", name=name), ephemeral=True)
+
+    async def load_template(self, interaction: Interaction) -> None:
+        """
+        Esse método substitui a embed por um modelo salvo do servidor, escolhido em um menu de seleção.
+        Quando o servidor tem mais modelos do que cabem no menu, o usuário primeiro informa o começo do nome em um modal.
+        """
+        catalog = self.catalog(interaction)
+        if self.templates is None:
+            return await interaction.response.send_message(catalog.text("templates.disabled"), ephemeral=True)
+        guild_id, version = interaction.guild_id or 0, self.versions.version
+        loop = asyncio.get_running_loop()
+        names = await loop.run_in_executor(None, self.templates.names, guild_id, "", 26)
+        send = interaction.response.send_message
+        if len(names) > 25:
+            section = catalog.sections["searchtemplate"]
+            modal = section.modal(self.draft)
+            if not await self._prompt(interaction, modal):
+                return
+            names = await loop.run_in_executor(None, self.templates.names, guild_id, section.values(modal)["prefix"])
+            send = interaction.followup.send
+        if not names:
+            return await send(catalog.text("templates.not_found"), ephemeral=True)
+        select = SelectPrompt(
+            placeholder=catalog.text("templates.placeholder"),
+            options=[SelectOption(label=name, value=name) for name in names],
+            ephemeral=True,
+        )
+        await send(view=select, ephemeral=True)
+        await select.wait()
+        if select.values:
+            draft = await loop.run_in_executor(None, self.templates.load, guild_id, select.values[0])
+            if draft is None:
+                return
+            if self.versions.changed_since(version):
+                return await self._conflict(interaction, "conflict.draft")
+            with self._changing():
+                self.draft, self._validator = draft, None
+
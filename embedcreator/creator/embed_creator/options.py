@@ -0,0 +1,98 @@
+from __future__ import annotations
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+from discord import SelectOption
+from creator.constants import OPTION_KWARGS
+from creator.embed_creator.catalog import LocaleCatalog, get_catalog
+
+__all__ = ("SelectOptionCache",)
+
+OptionsEntry = Tuple[Tuple[Mapping[str, Any], ...], Tuple[SelectOption, ...]]
+
+
+class SelectOptionCache:
+    """
+    Essa classe guarda as listas de opções do menu de seleção já construídas, compartilhadas entre todas as instâncias de `EmbedCreator`.
+    As opções padrão de cada idioma ficam no `LocaleCatalog` dele; as personalizadas por kwargs são descartadas pela ordem de uso (LRU)
+    quando o limite é atingido.
+
+    Parâmetros:
+        maxsize (int, optional): O número máximo de listas personalizadas guardadas. Por padrão é 128.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._custom: OrderedDict[Hashable, OptionsEntry] = OrderedDict()
+
+    @staticmethod
+    def overrides(kwargs: Mapping[str, Any], catalog: Optional[LocaleCatalog] = None) -> Dict[Tuple[str, str], Any]:
+        """
+        Esse método extrai dos kwargs apenas os valores que são diferentes do padrão do idioma, no formato {(opção, atributo): valor}.
+        Um texto igual ao de outro idioma (por exemplo o label em português em um painel em inglês) conta como personalizado.
+
+        Parâmetros:
+            kwargs (Mapping[str, Any]): Os kwargs do `EmbedCreator`, como `author_label`.
+            catalog (LocaleCatalog, optional): O idioma cujas opções são o padrão. Por padrão é o `DEFAULT_LOCALE`.
+        """
+        names = OPTION_KWARGS.keys() & kwargs.keys()
+        if not names:
+            return {}
+        defaults = {data["value"]: data for data in (catalog or get_catalog()).options_data}
+        found = {}
+        for name in names:
+            value, attr = OPTION_KWARGS[name]
+            if kwargs[name] != defaults[value][attr]:
+                found[(value, attr)] = kwargs[name]
+        return found
+
+    @staticmethod
+    def _build(catalog: LocaleCatalog, overrides: Mapping[Tuple[str, str], Any]) -> OptionsEntry:
+        data = tuple(
+            MappingProxyType({
+                "label": overrides.get((defaults["value"], "label"), defaults["label"]),
+                "description": overrides.get((defaults["value"], "description"), defaults["description"]),
+                "emoji": overrides.get((defaults["value"], "emoji"), defaults["emoji"]),
+                "value": defaults["value"],
+            })
+            for defaults in catalog.options_data
+        )
+        return data, tuple(SelectOption(**option) for option in data)
+
+    def get(self, kwargs: Mapping[str, Any], catalog: Optional[LocaleCatalog] = None) -> OptionsEntry:
+        """
+        Esse método retorna os dados e as instâncias de `SelectOption` para os kwargs informados, construindo-os apenas na primeira vez.
+        Sem kwargs de opções, retorna as opções já compiladas do idioma, sem processar nada.
+
+        Parâmetros:
+            kwargs (Mapping[str, Any]): Os kwargs do `EmbedCreator`, como `author_label`.
+            catalog (LocaleCatalog, optional): O idioma das opções. Por padrão é o `DEFAULT_LOCALE`.
+
+        Retorna:
+            (options_data, options) (Tuple[Tuple[Mapping[str, Any], ...], Tuple[SelectOption, ...]])
+        """
+        catalog = catalog or get_catalog()
+        overrides = self.overrides(kwargs, catalog) if kwargs else None
+        if not overrides:
+            return catalog.options_data, catalog.options
+        key = (catalog.locale, tuple(sorted(overrides.items())))
+        try:
+            entry = self._custom[key]
+        except KeyError:
+            pass
+        except TypeError:  # emoji não hashable, não há como guardar
+            return self._build(catalog, overrides)
+        else:
+            self._custom.move_to_end(key)
+            return entry
+        entry = self._custom[key] = self._build(catalog, overrides)
+        if len(self._custom) > self.maxsize:
+            self._custom.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Esse método descarta todas as listas personalizadas guardadas."""
+        self._custom.clear()
+
+    def __len__(self) -> int:
+        return len(self._custom)
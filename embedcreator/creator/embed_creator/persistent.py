@@ -0,0 +1,86 @@
+from __future__ import annotations
+import asyncio
+from typing import Any, ClassVar, Dict, Optional, Type
+from discord import Client, Interaction
+from discord.ui import DynamicItem, Item
+from creator.embed_creator.catalog import get_catalog
+from creator.embed_creator.builder import EmbedCreator
+from creator.storage import DraftStore, SQLiteDraftStore, WriteBehindDraftStore
+
+__all__ = ("PersistentPanelItem", "setup_persistent_panels")
+
+
+class PersistentPanelItem(DynamicItem[Item[Any]], template=r"embedcreator:(?P<key>[\w-]+):(?P<action>edit|send|cancel|undo|redo|schedule)"):
+    """
+    Essa classe é um `discord.ui.DynamicItem` que recebe as interações dos painéis persistentes que não estão mais em memória
+    (por exemplo, depois que o bot reiniciou). O rascunho é carregado do armazenamento apenas nesse momento, e um novo `EmbedCreator`
+    é criado para tratar a interação com `EmbedCreator.from_record`, mantendo os editores e as mensagens do modo de edição do painel original.
+
+    Atributos:
+        store (DraftStore): O armazenamento de onde os rascunhos são carregados.
+        panel_class (Type[EmbedCreator]): A classe usada para recriar os painéis.
+        panel_kwargs (Dict[str, Any]): Outros argumentos passados para os painéis recriados.
+    """
+
+    store: ClassVar[Optional[DraftStore]] = None
+    panel_class: ClassVar[Type[EmbedCreator]] = EmbedCreator
+    panel_kwargs: ClassVar[Dict[str, Any]] = {}
+
+    def __init__(self, item: Item[Any], key: str, action: str) -> None:
+        super().__init__(item)
+        self.key, self.action = key, action
+
+    @classmethod
+    async def from_custom_id(cls, interaction: Interaction, item: Item[Any], match: Any, /) -> PersistentPanelItem:
+        return cls(item, match["key"], match["action"])
+
+    async def callback(self, interaction: Interaction) -> None:
+        # o painel ainda está em memória, e a própria view já está tratando essa interação
+        if self.panel_class.get_live_panel(self.key) is not None:
+            return
+        data = None
+        if self.store is not None:
+            # a leitura pode chegar ao disco, então não é feita no loop de eventos
+            data = await asyncio.get_running_loop().run_in_executor(None, self.store.get, self.key)
+        if data is None:
+            locale = self.panel_kwargs.get("locale") or interaction.locale
+            return await interaction.response.send_message(get_catalog(locale).text("panel.expired"), ephemeral=True)
+        panel = await self.panel_class.from_record(
+            data,
+            bot=interaction.client,  # type: ignore
+            store=self.store,
+            session_key=self.key,
+            **self.panel_kwargs,
+        )
+        # liga o painel à mensagem antes da ação, então os próximos cliques chegam direto a ele, mesmo que a ação não edite a mensagem
+        if interaction.message is not None and panel.is_persistent():
+            interaction.client.add_view(panel, message_id=interaction.message.id)
+        await panel.dispatch_persistent(self.action, interaction, self.item)
+
+
+def setup_persistent_panels(
+    bot: Client,
+    store: Optional[DraftStore] = None,
+    panel_class: Type[EmbedCreator] = EmbedCreator,
+    **panel_kwargs: Any,
+) -> DraftStore:
+    """
+    Essa função ativa a recuperação dos painéis persistentes no bot. Ela deve ser chamada uma vez, antes do bot se conectar.
+
+    Parâmetros:
+        bot (discord.Client ou discord.ext.commands.Bot): O bot que vai receber as interações.
+        store (DraftStore, optional): O armazenamento dos rascunhos. Por padrão é um `SQLiteDraftStore` com gravação agrupada (`WriteBehindDraftStore`).
+        panel_class (Type[EmbedCreator], optional): A classe usada para recriar os painéis. Por padrão é `EmbedCreator`.
+        **panel_kwargs: Outros argumentos passados para os painéis recriados, por exemplo `scheduler=` ou `templates=`. Os editores e as mensagens
+            do modo de edição não vêm daqui: eles são guardados junto com o rascunho de cada painel.
+
+    Retorna:
+        store (DraftStore): O armazenamento usado, que deve ser passado como `store=` para os painéis criados.
+    """
+    if store is None:
+        store = WriteBehindDraftStore(SQLiteDraftStore())
+    PersistentPanelItem.store = store
+    PersistentPanelItem.panel_class = panel_class
+    PersistentPanelItem.panel_kwargs = panel_kwargs
+    bot.add_dynamic_items(PersistentPanelItem)
+    return store
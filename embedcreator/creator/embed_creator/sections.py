@@ -0,0 +1,219 @@
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from discord import TextStyle
+from discord.ui import TextInput
+from creator.draft import EmbedDraft
+from creator.input import ModalInput
+from creator.validation import EmbedLimits, EmbedValidator
+
+__all__ = ("InputSpec", "SectionSpec", "SECTIONS")
+
+# o maior valor que o Discord aceita em `max_length` de uma caixa de texto
+MODAL_MAX_LENGTH = 4000
+
+
+class InputSpec:
+    """
+    Essa classe descreve uma caixa de texto de um modal e como o valor dela é validado e aplicado no rascunho.
+
+    Parâmetros:
+        key (str): O atributo do `EmbedDraft` editado pela caixa. Se não for um atributo do rascunho, a caixa começa com `default`.
+        label (str): O nome da caixa.
+        placeholder (str, optional): O texto mostrado quando a caixa está vazia.
+        style (discord.TextStyle, optional): O estilo da caixa. Por padrão é `TextStyle.short`.
+        max_length (int, optional): O número máximo de caracteres aceitos pela caixa.
+        required (bool, optional): Se a caixa é obrigatória. Por padrão é False.
+        default (str, optional): O valor inicial, usado quando `key` não é um atributo do rascunho.
+        url (str, optional): "link" ou "image", se o valor for uma URL que deve ser validada com `EmbedValidator.check_url`.
+        section (str, optional): A seção de texto (`title`, `description`, `author` ou `footer`) validada com `EmbedValidator.check_text`.
+    """
+
+    __slots__ = ("key", "label", "placeholder", "style", "max_length", "required", "default", "url", "section")
+
+    def __init__(
+        self,
+        key: str,
+        label: str,
+        *,
+        placeholder: Optional[str] = None,
+        style: TextStyle = TextStyle.short,
+        max_length: Optional[int] = None,
+        required: bool = False,
+        default: Optional[str] = None,
+        url: Optional[str] = None,
+        section: Optional[str] = None,
+    ) -> None:
+        self.key, self.label, self.placeholder, self.style = key, label, placeholder, style
+        self.max_length, self.required, self.default = max_length, required, default
+        self.url, self.section = url, section
+
+
+class SectionSpec:
+    """
+    Essa classe descreve uma seção editável da embed: o título do modal e as caixas de texto dele.
+    Os argumentos das caixas são montados uma única vez; cada modal cria as suas caixas com eles e os valores atuais do rascunho.
+    Cada caixa (e cada modal) recebe um `custom_id` aleatório, então vários modals da mesma seção podem estar abertos ao mesmo tempo.
+
+    Parâmetros:
+        name (str): O nome da seção, igual ao valor da opção no menu de seleção.
+        title (str): O título do modal.
+        *inputs (InputSpec): As caixas de texto, na ordem em que aparecem.
+    """
+
+    __slots__ = ("name", "title", "inputs", "_arguments")
+
+    def __init__(self, name: str, title: str, *inputs: InputSpec) -> None:
+        self.name, self.title, self.inputs = name, title, inputs
+        # os argumentos de `discord.ui.TextInput` de cada caixa, exceto o valor inicial
+        self._arguments: Tuple[Dict[str, Any], ...] = tuple(
+            {
+                "label": spec.label,
+                "style": spec.style,
+                "placeholder": spec.placeholder,
+                "required": spec.required,
+                "max_length": spec.max_length,
+            }
+            for spec in inputs
+        )
+
+    def modal(self, draft: EmbedDraft, **defaults: Optional[str]) -> ModalInput:
+        """
+        Esse método cria o modal da seção, com as caixas preenchidas com os valores atuais do rascunho.
+
+        Parâmetros:
+            draft (EmbedDraft): O rascunho de onde os valores iniciais são lidos.
+            **defaults (str, optional): Valores iniciais que substituem os do rascunho, pela `key` da caixa.
+        """
+        modal = ModalInput(title=self.title)
+        for spec, arguments in zip(self.inputs, self._arguments):
+            if spec.key in defaults:
+                default = defaults[spec.key]
+            elif spec.key in _DRAFT_ATTRS:
+                default = getattr(draft, spec.key)
+            else:
+                default = spec.default
+            modal.add_item(TextInput(**arguments, default=default))
+        return modal
+
+    def current(self, draft: EmbedDraft) -> Dict[str, Optional[str]]:
+        """Esse método retorna os valores atuais do rascunho editados pela seção, pela `key` de cada caixa."""
+        return {spec.key: getattr(draft, spec.key) for spec in self.inputs if spec.key in _DRAFT_ATTRS}
+
+    def values(self, modal: ModalInput) -> Dict[str, str]:
+        """Esse método retorna os valores enviados no modal, pela `key` de cada caixa."""
+        return {spec.key: str(item) for spec, item in zip(self.inputs, modal.children)}
+
+    def validate(self, validator: EmbedValidator, values: Mapping[str, str]) -> None:
+        """
+        Esse método valida os valores enviados com as regras de cada caixa.
+
+        Levanta:
+            EmbedValidationError: Se algum valor for inválido.
+        """
+        for spec in self.inputs:
+            if spec.url is not None:
+                validator.check_url(values[spec.key], image=spec.url == "image")
+        sections = {spec.section: values[spec.key] for spec in self.inputs if spec.section is not None}
+        if sections:
+            validator.check_text(**sections)
+
+    def image_urls(self, values: Mapping[str, str]) -> List[str]:
+        """Esse método retorna as URLs de imagem preenchidas nos valores enviados."""
+        return [values[spec.key] for spec in self.inputs if spec.url == "image" and values[spec.key]]
+
+    def apply(self, draft: EmbedDraft, values: Mapping[str, str]) -> None:
+        """Esse método aplica os valores no rascunho. Valores vazios removem o atributo."""
+        for spec in self.inputs:
+            setattr(draft, spec.key, values[spec.key] or None)
+
+    def localize(self, messages: Mapping[str, str]) -> SectionSpec:
+        """
+        Esse método retorna a seção com o título, os nomes e os placeholders traduzidos pelas chaves `section.<seção>...` de um
+        catálogo de `creator.locales`. Se o catálogo não traduzir nada da seção, retorna a própria seção.
+        """
+        prefix = f"section.{self.name}."
+        if not any(key.startswith(prefix) for key in messages):
+            return self
+        inputs = []
+        for spec in self.inputs:
+            localized = InputSpec.__new__(InputSpec)
+            for attr in InputSpec.__slots__:
+                setattr(localized, attr, getattr(spec, attr))
+            localized.label = messages.get(f"{prefix}{spec.key}.label", spec.label)
+            localized.placeholder = messages.get(f"{prefix}{spec.key}.placeholder", spec.placeholder)
+            inputs.append(localized)
+        return SectionSpec(self.name, messages.get(f"{prefix}title", self.title), *inputs)
+
+    def __repr__(self) -> str:
+        return f"<SectionSpec name={self.name!r} inputs={len(self.inputs)}>"
+
+
+_DRAFT_ATTRS = frozenset(EmbedDraft.__slots__)
+
+
+def _sections(*sections: SectionSpec) -> Mapping[str, SectionSpec]:
+    return MappingProxyType({section.name: section for section in sections})
+
+
+# todas as seções editáveis da embed, com os limites e as regras de validação de cada caixa
+SECTIONS: Mapping[str, SectionSpec] = _sections(
+    SectionSpec(
+        "author", "Edite o autor da embed",
+        InputSpec("author_name", "Nome do autor", placeholder="Nome do autor para ser mostrado na embed",
+                  max_length=EmbedLimits.AUTHOR_NAME, section="author"),
+        InputSpec("author_icon_url", "Url do ícone do autor", placeholder="Ícone do autor para ser mostrado na embed", url="image"),
+        InputSpec("author_url", "Url do autor", placeholder="URL para definir como o link do autor da embed", url="link"),
+    ),
+    SectionSpec(
+        "message", "Edite a mensagem da embed",
+        InputSpec("title", "Título da embed", placeholder="Título para ser mostrado na embed",
+                  max_length=EmbedLimits.TITLE, section="title"),
+        InputSpec("description", "Descrição da embed", placeholder="Descrição para ser mostrada na embed", style=TextStyle.paragraph,
+                  max_length=min(EmbedLimits.DESCRIPTION, MODAL_MAX_LENGTH), section="description"),
+    ),
+    SectionSpec(
+        "thumbnail", "Edite a thumbnail da embed",
+        InputSpec("thumbnail", "Url da thumbnail", placeholder="Thumbnail para ser mostrada na embed", url="image"),
+    ),
+    SectionSpec(
+        "image", "Edite a imagem da embed",
+        InputSpec("image", "Url da imagem", placeholder="Imagem para ser mostrada na embed", url="image"),
+    ),
+    SectionSpec(
+        "footer", "Edite o rodapé da embed",
+        InputSpec("footer_text", "Texto do rodapé", placeholder="Texto para ser mostrado no rodapé da embed",
+                  max_length=min(EmbedLimits.FOOTER_TEXT, MODAL_MAX_LENGTH), section="footer"),
+        InputSpec("footer_icon_url", "Ícone do rodapé", placeholder="Ícone para ser mostrado no rodapé da embed", url="image"),
+    ),
+    SectionSpec(
+        "color", "Edite a cor da embed",
+        InputSpec("colour", "Cor da embed", placeholder="Cor para ser mostrada na embed (ex: #070d2d)", max_length=20, required=True),
+    ),
+    SectionSpec(
+        "addfield", "Adicionar novo campo",
+        InputSpec("name", "Nome do campo", placeholder="Nome para ser mostrado no campo",
+                  max_length=EmbedLimits.FIELD_NAME, required=True),
+        InputSpec("value", "Valor do campo", placeholder="Valor para ser mostrado no campo", style=TextStyle.paragraph,
+                  max_length=EmbedLimits.FIELD_VALUE, required=True),
+        InputSpec("inline", "Campos na mesma linha (True/False)", placeholder="Os campos ficarão na mesma linha? (True ou False)",
+                  max_length=5, required=True, default="True"),
+    ),
+    SectionSpec(
+        "importjson", "Importe uma embed em JSON",
+        InputSpec("json", "JSON da embed", placeholder='{"title": "Título", "description": "Descrição", "fields": [...]}',
+                  style=TextStyle.paragraph, max_length=MODAL_MAX_LENGTH, required=True),
+    ),
+    SectionSpec(
+        "schedule", "Agende o envio da embed",
+        InputSpec("when", "Quando enviar", placeholder="DD/MM/AAAA HH:MM, ou +30m, +2h, +1d", max_length=20, required=True),
+    ),
+    SectionSpec(
+        "savetemplate", "Salve a embed como modelo",
+        InputSpec("name", "Nome do modelo", placeholder="Nome para encontrar o modelo depois", max_length=100, required=True),
+    ),
+    SectionSpec(
+        "searchtemplate", "Busque um modelo",
+        InputSpec("prefix", "Começo do nome do modelo", placeholder="Deixe vazio para ver os primeiros modelos", max_length=100),
+    ),
+)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+from collections import deque
+from typing import Deque, Optional
+from creator.draft import EmbedDraft
+
+__all__ = ("DraftHistory",)
+
+
+class DraftHistory:
+    """
+    Essa classe guarda o histórico de um rascunho para desfazer e refazer edições.
+    Cada versão é um `EmbedDraft` que compartilha com as outras versões todos os textos e campos que não mudaram,
+    então o histórico ocupa memória proporcional às edições feitas, e não ao tamanho da embed vezes o número de versões.
+
+    Parâmetros:
+        limit (int, optional): O número máximo de versões guardadas para desfazer. As mais antigas são descartadas. Por padrão é 50.
+    """
+
+    __slots__ = ("limit", "_undo", "_redo")
+
+    def __init__(self, limit: int = 50) -> None:
+        self.limit = limit
+        self._undo: Deque[EmbedDraft] = deque(maxlen=limit)
+        self._redo: Deque[EmbedDraft] = deque(maxlen=limit)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, previous: EmbedDraft, current: EmbedDraft) -> bool:
+        """
+        Esse método guarda `previous`, a versão anterior a uma edição, e descarta as versões que podiam ser refeitas.
+        Nada é guardado se a edição não mudou o rascunho.
+
+        Retorna:
+            recorded (bool): Se uma nova versão foi guardada.
+        """
+        if previous == current:
+            return False
+        self._undo.append(previous)
+        self._redo.clear()
+        return True
+
+    def undo(self, current: EmbedDraft) -> Optional[EmbedDraft]:
+        """Esse método retorna a versão anterior a `current`, ou `None` se não houver nada para desfazer."""
+        if not self._undo:
+            return None
+        self._redo.append(current)
+        return self._undo.pop()
+
+    def redo(self, current: EmbedDraft) -> Optional[EmbedDraft]:
+        """Esse método retorna a versão desfeita por último, ou `None` se não houver nada para refazer."""
+        if not self._redo:
+            return None
+        self._undo.append(current)
+        return self._redo.pop()
+
+    def clear(self) -> None:
+        self._undo.clear()
+        self._redo.clear()
+
+    def __len__(self) -> int:
+        return len(self._undo) + len(self._redo)
+
+    def __repr__(self) -> str:
+        return f"<DraftHistory undo={len(self._undo)} redo={len(self._redo)} limit={self.limit}>"
@@ -1,38 +1,47 @@
 from __future__ import annotations
+import os
 from typing import List, Optional
 from discord.ui import ChannelSelect, Modal, Select, View, select
 from discord import Interaction, SelectOption, ChannelType
 from contextlib import suppress
+from creator.sessions import TrackedSession
 
 __all__ = ("ModalInput", "SelectPrompt", "ChannelSelectPrompt")
 
-class ModalInput(Modal):
+class ModalInput(TrackedSession, Modal):
     """
     Essa classe é uma subclasse da classe `Modal` que deve ser usada como uma classe base para a criação de modals que requerem uma entrada do usuário.
 
     Parâmetros:
         title (str): O título do modal.
         timeout (float, optional): Um argumento opcional que é passado para a classe mãe Modal. Ele é usado para especificar um timeout para o mosal, em segundos.
-        custom_id (str, optional): Um argumento opcional que é passado para a classe mãe Moda. Ele é usado para especificar um ID personalizado para o modal.
+        custom_id (str, optional): Um argumento opcional que é passado para a classe mãe Modal. Ele é usado para especificar um ID personalizado para o modal.
+            Por padrão é um ID aleatório: o discord.py identifica os modals abertos pelo `custom_id`, então dois modals abertos ao mesmo tempo
+            não podem ter o mesmo.
         ephemeral (bool, optional): Um indicador booleano de que o modal será ou não enviado como uma mensagem ephemeral.
+
+    Atributos:
+        submitted (bool): Indica se o usuário enviou o modal. Fica `False` quando o modal é fechado, expira ou é encerrado pelo registro de sessões.
     """
     def __init__(
         self,
         *,
         title: str,
         timeout: Optional[float] = None,
-        custom_id: str = "modal_input",
+        custom_id: Optional[str] = None,
         ephemeral: bool = False,
     ) -> None:
-        super().__init__(title=title, timeout=timeout, custom_id=custom_id)
+        super().__init__(title=title, timeout=timeout, custom_id=custom_id or os.urandom(16).hex())
         self.ephemeral = ephemeral
+        self.submitted = False
 
     async def on_submit(self, interaction: Interaction) -> None:
+        self.submitted = True
         with suppress(Exception):
             await interaction.response.defer(ephemeral=self.ephemeral)
 
 
-class SelectPrompt(View):
+class SelectPrompt(TrackedSession, View):
     """
     Essa classe é uma subclasse da classe `View` que deve ser usada como uma classe base para a criação de um prompt de seleção.
 
@@ -61,7 +70,7 @@ class SelectPrompt(View):
         self.values = select.values
         self.stop()
 
-class ChannelSelectPrompt(View):
+class ChannelSelectPrompt(TrackedSession, View):
     """
     Essa classe é uma subclasse da classe `View` que deve ser usada como uma classe base para a criação de um prompt de seleção de chat.
 
@@ -86,6 +95,6 @@ class ChannelSelectPrompt(View):
         else:
             with suppress(Exception):
                 await interaction.message.delete()  # type: ignore
-        self.values = [interaction.guild.get_channel(i.id) for i in select.values] # type: ignore
+        self.values = [interaction.guild.get_channel_or_thread(i.id) for i in select.values] # type: ignore
         self.stop()
         
\ No newline at end of file
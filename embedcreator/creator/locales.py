@@ -0,0 +1,309 @@
+"""
+Os textos mostrados ao usuário pelo painel, por idioma. Não depende do discord.py.
+
+Cada idioma é um catálogo imutável de chave -> texto, montado uma única vez em `register_locale` a partir do catálogo base,
+então um catálogo novo só precisa informar as chaves que mudam. As chaves são:
+    `button.<ação>`: os rótulos dos botões do painel ("send", "save", "cancel", "undo", "redo" e "schedule").
+    `option.<opção>.label` e `option.<opção>.description`: as opções do menu de seleção (veja `DEFAULT_OPTIONS`).
+    `section.<seção>.title`, `section.<seção>.<caixa>.label` e `section.<seção>.<caixa>.placeholder`: os modals (veja `SECTIONS`).
+        Quando ausentes, são usados os textos definidos na própria seção.
+    `validation.<...>`, `url.<...>` e `json.<...>`: os erros de validação levantados como `LocalizedError` (veja `EmbedValidator`,
+        `UrlCheckResult.problem` e `EmbedDraft.from_json`).
+    As demais chaves são as mensagens enviadas ao usuário, com campos no formato de `str.format`.
+"""
+from __future__ import annotations
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from creator.constants import DEFAULT_OPTIONS
+
+__all__ = (
+    "DEFAULT_LOCALE", "LocalizedError", "register_locale", "resolve_locale", "get_messages", "available_locales", "format_message",
+)
+
+DEFAULT_LOCALE = "pt-BR"
+
+_PT_BR = {
+    **{f"option.{value}.{attr}": text for value, defaults in DEFAULT_OPTIONS.items() for attr, text in defaults.items() if attr != "emoji"},
+    "button.send": "Enviar",
+    "button.save": "Salvar",
+    "button.cancel": "Cancelar",
+    "button.undo": "Desfazer",
+    "button.redo": "Refazer",
+    "button.schedule": "Agendar",
+    "select.placeholder": "Edite uma seção",
+    "channels.send.one": "Selecione um chat para enviar essa embed...",
+    "channels.send.many": "Selecione os chats para enviar essa embed...",
+    "channels.schedule.one": "Selecione um chat para agendar essa embed...",
+    "channels.schedule.many": "Selecione os chats para agendar essa embed...",
+    "channels.none": "O bot não tem permissão para enviar embeds em nenhum chat deste servidor.",
+    "channels.rejected": "O bot não tem permissão para enviar embeds em: {channels}",
+    "send.failed": "Não foi possível enviar a embed para: {channels}",
+    "targets.summary": "{edited} mensagem(ns) editada(s), {unchanged} sem mudanças.",
+    "targets.failed": "Não foi possível editar as mensagens em: {channels}",
+    "schedule.disabled": "O agendamento não está configurado.",
+    "schedule.invalid": "Informe o horário como DD/MM/AAAA HH:MM ou como +30m, +2h ou +1d.",
+    "schedule.past": "O horário do agendamento já passou.",
+    "schedule.done": "Envio agendado para {when}.",
+    "panel.expired": "Esse rascunho não existe mais.",
+    "url.invalid": "Por favor, insira um URL válido",
+    "colour.invalid": "Por favor, informe um código HEX válido.",
+    "field.limit": "Você não pode adicionar mais que 25 campos.",
+    "field.inline_invalid": "Por favor, informe uma opção válida em `campos na mesma linha`: ou True ou False.",
+    "field.none": "Não há campos para serem removidos",
+    "field.remove_placeholder": "Selecione um campo para a remoção...",
+    "templates.disabled": "Nenhuma biblioteca de modelos foi configurada.",
+    "templates.empty_name": "O nome do modelo não pode ficar vazio.",
+    "templates.saved": "Modelo `{name}` salvo.",
+    "templates.not_found": "Nenhum modelo encontrado.",
+    "templates.placeholder": "Selecione um modelo...",
+    "conflict.section": "Outra pessoa mudou os mesmos valores enquanto você editava. Abra a seção de novo para ver a versão atual.",
+    "conflict.draft": "A embed foi alterada por outra pessoa nesse meio-tempo, então ela não foi substituída para não apagar essas mudanças.",
+    "editors.denied": "Apenas os editores deste painel podem usá-lo.",
+    "validation.title.length": "O título tem {length} caracteres, mas o limite é {limit}.",
+    "validation.description.length": "A descrição tem {length} caracteres, mas o limite é {limit}.",
+    "validation.author.length": "O nome do autor tem {length} caracteres, mas o limite é {limit}.",
+    "validation.footer.length": "O texto do rodapé tem {length} caracteres, mas o limite é {limit}.",
+    "validation.total": "A embed ficaria com {total} caracteres, mas o limite é {limit}.",
+    "validation.field.limit": "Você não pode adicionar mais que {limit} campos.",
+    "validation.field.empty": "O nome e o valor do campo não podem ficar vazios.",
+    "validation.field.name_length": "O nome do campo tem {length} caracteres, mas o limite é {limit}.",
+    "validation.field.value_length": "O valor do campo tem {length} caracteres, mas o limite é {limit}.",
+    "validation.fields.count": "A embed tem {count} campos, mas o limite é {limit}.",
+    "validation.fields.empty": "O nome e o valor do campo {position} não podem ficar vazios.",
+    "validation.fields.name_length": "O nome do campo {position} tem {length} caracteres, mas o limite é {limit}.",
+    "validation.fields.value_length": "O valor do campo {position} tem {length} caracteres, mas o limite é {limit}.",
+    "validation.url": "`{url}` não é um URL válido.",
+    "validation.colour": "A cor deve estar entre #000000 e #FFFFFF.",
+    "url.unreachable": "Não foi possível acessar `{url}`.",
+    "url.http_error": "`{url}` respondeu com o erro HTTP {status}.",
+    "url.not_image": "`{url}` não é uma imagem ({content_type}).",
+    "url.not_image.unknown": "`{url}` não é uma imagem (tipo desconhecido).",
+    "url.blocked": "`{url}` aponta para um endereço interno e não pode ser usado.",
+    "json.invalid": "JSON inválido: {error}",
+    "json.not_object": "O JSON deve ser um objeto com os dados da embed.",
+    "json.key_not_object": "`{key}` deve ser um objeto.",
+    "json.fields": "`fields` deve ser uma lista de objetos.",
+    "json.color": "`color` deve ser um número inteiro.",
+    "json.timestamp": "`timestamp` deve estar no formato ISO 8601.",
+    "json.not_text": "`{key}` deve ser um texto.",
+    "json.field_text": "O nome e o valor dos campos devem ser textos.",
+}
+
+_EN_US = {
+    "option.author.label": "Edit the author",
+    "option.author.description": "Edits the author name and icon.",
+    "option.message.label": "Edit the message (title and description)",
+    "option.message.description": "Edits the embed title and description.",
+    "option.thumbnail.label": "Edit the thumbnail",
+    "option.thumbnail.description": "Edits the embed thumbnail.",
+    "option.image.label": "Edit the image",
+    "option.image.description": "Edits the embed image.",
+    "option.footer.label": "Edit the footer",
+    "option.footer.description": "Edits the embed footer text and icon.",
+    "option.color.label": "Edit the colour",
+    "option.color.description": "Edits the embed colour.",
+    "option.addfield.label": "Add a field",
+    "option.addfield.description": "Adds a field to the embed.",
+    "option.removefield.label": "Remove a field",
+    "option.removefield.description": "Removes a field from the embed.",
+    "option.importjson.label": "Import JSON",
+    "option.importjson.description": "Replaces the whole embed with Discord embed JSON.",
+    "option.exportjson.label": "Export as JSON",
+    "option.exportjson.description": "Shows the current embed as JSON.",
+    "option.savetemplate.label": "Save as a template",
+    "option.savetemplate.description": "Saves the current embed as a server template.",
+    "option.loadtemplate.label": "Load a template",
+    "option.loadtemplate.description": "Replaces the embed with a saved server template.",
+    "section.author.title": "Edit the embed author",
+    "section.author.author_name.label": "Author name",
+    "section.author.author_name.placeholder": "Author name shown in the embed",
+    "section.author.author_icon_url.label": "Author icon URL",
+    "section.author.author_icon_url.placeholder": "Author icon shown in the embed",
+    "section.author.author_url.label": "Author URL",
+    "section.author.author_url.placeholder": "URL the author name links to",
+    "section.message.title": "Edit the embed message",
+    "section.message.title.label": "Embed title",
+    "section.message.title.placeholder": "Title shown in the embed",
+    "section.message.description.label": "Embed description",
+    "section.message.description.placeholder": "Description shown in the embed",
+    "section.thumbnail.title": "Edit the embed thumbnail",
+    "section.thumbnail.thumbnail.label": "Thumbnail URL",
+    "section.thumbnail.thumbnail.placeholder": "Thumbnail shown in the embed",
+    "section.image.title": "Edit the embed image",
+    "section.image.image.label": "Image URL",
+    "section.image.image.placeholder": "Image shown in the embed",
+    "section.footer.title": "Edit the embed footer",
+    "section.footer.footer_text.label": "Footer text",
+    "section.footer.footer_text.placeholder": "Text shown in the embed footer",
+    "section.footer.footer_icon_url.label": "Footer icon",
+    "section.footer.footer_icon_url.placeholder": "Icon shown in the embed footer",
+    "section.color.title": "Edit the embed colour",
+    "section.color.colour.label": "Embed colour",
+    "section.color.colour.placeholder": "Colour shown in the embed (e.g. #070d2d)",
+    "section.addfield.title": "Add a new field",
+    "section.addfield.name.label": "Field name",
+    "section.addfield.name.placeholder": "Name shown in the field",
+    "section.addfield.value.label": "Field value",
+    "section.addfield.value.placeholder": "Value shown in the field",
+    "section.addfield.inline.label": "Inline field (True/False)",
+    "section.addfield.inline.placeholder": "Should the field share a line? (True or False)",
+    "section.importjson.title": "Import an embed as JSON",
+    "section.importjson.json.label": "Embed JSON",
+    "section.importjson.json.placeholder": '{"title": "Title", "description": "Description", "fields": [...]}',
+    "section.schedule.title": "Schedule the embed",
+    "section.schedule.when.label": "When to send",
+    "section.schedule.when.placeholder": "DD/MM/YYYY HH:MM, or +30m, +2h, +1d",
+    "section.savetemplate.title": "Save the embed as a template",
+    "section.savetemplate.name.label": "Template name",
+    "section.savetemplate.name.placeholder": "A name to find the template later",
+    "section.searchtemplate.title": "Search templates",
+    "section.searchtemplate.prefix.label": "Start of the template name",
+    "section.searchtemplate.prefix.placeholder": "Leave empty to see the first templates",
+    "button.send": "Send",
+    "button.save": "Save",
+    "button.cancel": "Cancel",
+    "button.undo": "Undo",
+    "button.redo": "Redo",
+    "button.schedule": "Schedule",
+    "select.placeholder": "Edit a section",
+    "channels.send.one": "Select a channel to send this embed to...",
+    "channels.send.many": "Select the channels to send this embed to...",
+    "channels.schedule.one": "Select a channel to schedule this embed in...",
+    "channels.schedule.many": "Select the channels to schedule this embed in...",
+    "channels.none": "The bot is not allowed to send embeds in any channel of this server.",
+    "channels.rejected": "The bot is not allowed to send embeds in: {channels}",
+    "send.failed": "Could not send the embed to: {channels}",
+    "targets.summary": "{edited} message(s) edited, {unchanged} unchanged.",
+    "targets.failed": "Could not edit the messages in: {channels}",
+    "schedule.disabled": "Scheduling is not configured.",
+    "schedule.invalid": "Enter the time as DD/MM/YYYY HH:MM or as +30m, +2h or +1d.",
+    "schedule.past": "That time has already passed.",
+    "schedule.done": "Embed scheduled for {when}.",
+    "panel.expired": "This draft no longer exists.",
+    "url.invalid": "Please enter a valid URL",
+    "colour.invalid": "Please enter a valid HEX code.",
+    "field.limit": "You cannot add more than 25 fields.",
+    "field.inline_invalid": "Please enter a valid option in `inline field`: either True or False.",
+    "field.none": "There are no fields to remove",
+    "field.remove_placeholder": "Select the fields to remove...",
+    "templates.disabled": "No template library has been configured.",
+    "templates.empty_name": "The template name cannot be empty.",
+    "templates.saved": "Template `{name}` saved.",
+    "templates.not_found": "No templates found.",
+    "templates.placeholder": "Select a template...",
+    "conflict.section": "Someone else changed the same values while you were editing. Open the section again to see the current version.",
+    "conflict.draft": "The embed was changed by someone else in the meantime, so it was not replaced to avoid losing those changes.",
+    "editors.denied": "Only this panel's editors can use it.",
+    "validation.title.length": "The title has {length} characters, but the limit is {limit}.",
+    "validation.description.length": "The description has {length} characters, but the limit is {limit}.",
+    "validation.author.length": "The author name has {length} characters, but the limit is {limit}.",
+    "validation.footer.length": "The footer text has {length} characters, but the limit is {limit}.",
+    "validation.total": "The embed would have {total} characters, but the limit is {limit}.",
+    "validation.field.limit": "You cannot add more than {limit} fields.",
+    "validation.field.empty": "The field name and value cannot be empty.",
+    "validation.field.name_length": "The field name has {length} characters, but the limit is {limit}.",
+    "validation.field.value_length": "The field value has {length} characters, but the limit is {limit}.",
+    "validation.fields.count": "The embed has {count} fields, but the limit is {limit}.",
+    "validation.fields.empty": "The name and value of field {position} cannot be empty.",
+    "validation.fields.name_length": "The name of field {position} has {length} characters, but the limit is {limit}.",
+    "validation.fields.value_length": "The value of field {position} has {length} characters, but the limit is {limit}.",
+    "validation.url": "`{url}` is not a valid URL.",
+    "validation.colour": "The colour must be between #000000 and #FFFFFF.",
+    "url.unreachable": "Could not reach `{url}`.",
+    "url.http_error": "`{url}` answered with HTTP error {status}.",
+    "url.not_image": "`{url}` is not an image ({content_type}).",
+    "url.not_image.unknown": "`{url}` is not an image (unknown type).",
+    "url.blocked": "`{url}` points to an internal address and cannot be used.",
+    "json.invalid": "Invalid JSON: {error}",
+    "json.not_object": "The JSON must be an object with the embed data.",
+    "json.key_not_object": "`{key}` must be an object.",
+    "json.fields": "`fields` must be a list of objects.",
+    "json.color": "`color` must be an integer.",
+    "json.timestamp": "`timestamp` must be in ISO 8601 format.",
+    "json.not_text": "`{key}` must be a text.",
+    "json.field_text": "Field names and values must be texts.",
+}
+
+# código do idioma (ex: "en-US") -> catálogo
+_CATALOGS: Dict[str, Mapping[str, str]] = {}
+# idioma sem região (ex: "en") -> o primeiro código registrado dele, usado para "en-GB" cair em "en-US"
+_LANGUAGES: Dict[str, str] = {}
+# código informado -> código resolvido
+_RESOLVED: Dict[str, str] = {}
+
+
+def register_locale(locale: str, messages: Mapping[str, str], *, base: Optional[str] = DEFAULT_LOCALE) -> None:
+    """
+    Essa função registra (ou substitui) o catálogo de um idioma. Os painéis criados depois passam a usá-lo.
+
+    Parâmetros:
+        locale (str): O código do idioma, no formato do `discord.Locale` (ex: "en-US", "es-ES").
+        messages (Mapping[str, str]): Os textos do idioma. As chaves ausentes são copiadas do catálogo `base`.
+        base (str, optional): O catálogo usado para as chaves ausentes. Por padrão é o `DEFAULT_LOCALE`. Use `None` para nenhum.
+    """
+    catalog = {**(_CATALOGS[base] if base is not None else {}), **messages}
+    _CATALOGS[locale] = MappingProxyType(catalog)
+    _LANGUAGES.setdefault(locale.split("-")[0], locale)
+    _RESOLVED.clear()
+
+
+def resolve_locale(locale: Any = None) -> str:
+    """
+    Essa função retorna o código do catálogo usado para o idioma informado: o próprio idioma, outro registrado da mesma língua
+    (ex: "en-GB" usa "en-US") ou o `DEFAULT_LOCALE`.
+
+    Parâmetros:
+        locale (str ou discord.Locale, optional): O idioma, por exemplo `interaction.locale`.
+    """
+    code = str(getattr(locale, "value", locale or DEFAULT_LOCALE))
+    resolved = _RESOLVED.get(code)
+    if resolved is None:
+        if code in _CATALOGS:
+            resolved = code
+        else:
+            resolved = _LANGUAGES.get(code.split("-")[0], DEFAULT_LOCALE)
+        _RESOLVED[code] = resolved
+    return resolved
+
+
+def get_messages(locale: Any = None) -> Mapping[str, str]:
+    """Essa função retorna o catálogo imutável do idioma informado (veja `resolve_locale`)."""
+    return _CATALOGS[resolve_locale(locale)]
+
+
+def available_locales() -> Mapping[str, Mapping[str, str]]:
+    """Essa função retorna os catálogos registrados, por código do idioma."""
+    return MappingProxyType(_CATALOGS)
+
+
+def format_message(key: str, locale: Any = None, /, **fields: Any) -> str:
+    """Essa função retorna o texto da chave no catálogo do idioma informado (veja `resolve_locale`), com os campos preenchidos."""
+    text = get_messages(locale)[key]
+    return text.format(**fields) if fields else text
+
+
+class LocalizedError(ValueError):
+    """
+    Essa exceção é levantada por erros que podem ser mostrados ao usuário. As mensagens são guardadas como chaves dos catálogos,
+    com os campos de cada uma, para serem mostradas no idioma de quem usa o painel (por exemplo com `LocaleCatalog.text`).
+    `str(error)` mostra as mensagens no `DEFAULT_LOCALE`.
+
+    Parâmetros:
+        key (str): A chave da mensagem.
+        **params: Os campos da mensagem.
+
+    Atributos:
+        problems (List[Tuple[str, Dict[str, Any]]]): As mensagens, como pares de chave e campos.
+    """
+
+    def __init__(self, key: str, /, **params: Any) -> None:
+        self.problems: List[Tuple[str, Dict[str, Any]]] = [(key, params)]
+        super().__init__(self.localize())
+
+    def localize(self, locale: Any = None) -> str:
+        """Esse método retorna as mensagens no idioma informado, uma por linha."""
+        return "\n".join(format_message(key, locale, **params) for key, params in self.problems)
+
+
+register_locale(DEFAULT_LOCALE, _PT_BR, base=None)
+register_locale("en-US", _EN_US)
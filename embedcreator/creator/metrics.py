@@ -0,0 +1,204 @@
+from __future__ import annotations
+import logging
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+__all__ = ("Histogram", "Metrics", "MetricsExporter", "LoggingExporter", "enable", "disable", "get_metrics", "span", "increment")
+
+_log = logging.getLogger(__name__)
+
+# limites dos baldes dos histogramas, em segundos (de 1ms a 15min)
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 900.0,
+)
+
+
+class Histogram:
+    """
+    Essa classe é um histograma de baldes fixos, com custo constante por observação.
+
+    Parâmetros:
+        buckets (Sequence[float], optional): Os limites superiores dos baldes, em ordem crescente.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percent: float) -> float:
+        """Esse método estima o percentil (entre 0 e 1) pelo limite superior do balde em que ele cai."""
+        if not self.count:
+            return 0.0
+        target = percent * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "p50": self.percentile(0.5),
+            "p99": self.percentile(0.99),
+            "buckets": dict(zip((*self.bounds, float("inf")), self.counts)),
+        }
+
+
+class MetricsExporter(ABC):
+    """Essa classe é a interface dos exportadores, que recebem o resumo das métricas em `Metrics.export()`."""
+
+    @abstractmethod
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        """Esse método recebe o resumo das métricas, no formato de `Metrics.snapshot()`."""
+
+
+class LoggingExporter(MetricsExporter):
+    """Esse exportador escreve o resumo das métricas no logger `creator.metrics`."""
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        self.level = level
+
+    def export(self, snapshot: Dict[str, Any]) -> None:
+        for name, histogram in snapshot["histograms"].items():
+            _log.log(self.level, "%s: count=%d p50=%.3fs p99=%.3fs", name, histogram["count"], histogram["p50"], histogram["p99"])
+        for name, value in snapshot["counters"].items():
+            _log.log(self.level, "%s: %d", name, value)
+
+
+class Metrics:
+    """
+    Essa classe agrega, em memória, a duração (histogramas) e as contagens (contadores) das operações instrumentadas.
+
+    Os nomes usados pela biblioteca são:
+        `callback.<opção>`: cada callback do menu de seleção do `EmbedCreator`.
+        `interaction.send_modal` e `modal.wait`: o envio do modal e a espera pela resposta do usuário.
+        `update_embed`: a edição da mensagem do painel.
+        `channel.send`: cada envio da embed para um chat.
+        `scheduler.dispatch`: cada lote de envios agendados despachado pelo `PostScheduler` (`scheduler.posts` conta os envios).
+        `message.edit`: cada edição de uma mensagem já enviada, no modo de edição (`EmbedCreator(targets=...)`).
+    Cada span também conta `<nome>.calls`, `<nome>.errors` e `<nome>.errors.<status HTTP>`; `modal.unsubmitted` conta os modals fechados
+    sem resposta (expirados, dispensados pelo usuário ou encerrados pelo registro de sessões) e `update_embed.skipped` as edições ignoradas
+    por não haver mudanças; `draft.merges` conta as alterações juntadas com outras feitas ao mesmo tempo e `draft.conflicts` as recusadas por conflito.
+    Com um `ChannelIndex`, `channels.index.build` mede a montagem do índice de um servidor e `channels.index.invalidations` conta os índices descartados.
+    Com um `UrlChecker`, `url.check` mede cada verificação de URL de imagem e `url.check.cached` conta as respondidas pelo cache.
+
+    Parâmetros:
+        exporters (List[MetricsExporter], optional): Os exportadores chamados por `export()`.
+    """
+
+    def __init__(self, exporters: Optional[List[MetricsExporter]] = None, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.exporters = exporters or []
+        self.buckets = buckets
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+
+    def observe(self, name: str, seconds: float) -> None:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "histograms": {name: histogram.snapshot() for name, histogram in self.histograms.items()},
+            "counters": dict(self.counters),
+        }
+
+    def export(self) -> None:
+        """Esse método envia o resumo atual para todos os exportadores."""
+        snapshot = self.snapshot()
+        for exporter in self.exporters:
+            exporter.export(snapshot)
+
+    def reset(self) -> None:
+        self.histograms.clear()
+        self.counters.clear()
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics: Metrics, name: str) -> None:
+        self.metrics, self.name = metrics, name
+
+    def __enter__(self) -> _Span:
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], traceback: Any) -> None:
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        self.metrics.increment(f"{self.name}.calls")
+        if exc is not None:
+            self.metrics.increment(f"{self.name}.errors")
+            # o status HTTP das respostas de erro da API (`discord.HTTPException.status`), não o `code` de erro do JSON do Discord
+            status = getattr(exc, "status", None)
+            if status is not None:
+                self.metrics.increment(f"{self.name}.errors.{status}")
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+_metrics: Optional[Metrics] = None
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """
+    Essa função ativa a instrumentação. Enquanto ela estiver desativada (o padrão), os spans não medem nada.
+
+    Retorna:
+        metrics (Metrics): O agregador em uso.
+    """
+    global _metrics
+    _metrics = metrics or Metrics()
+    return _metrics
+
+
+def disable() -> None:
+    """Essa função desativa a instrumentação."""
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[Metrics]:
+    """Essa função retorna o agregador em uso, ou `None` se a instrumentação estiver desativada."""
+    return _metrics
+
+
+def span(name: str) -> Any:
+    """Essa função retorna um gerenciador de contexto que mede a duração do bloco com o nome informado."""
+    if _metrics is None:
+        return _NULL_SPAN
+    return _Span(_metrics, name)
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """Essa função soma `amount` ao contador informado."""
+    if _metrics is not None:
+        _metrics.increment(name, amount)
@@ -0,0 +1,253 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from discord import Client, Embed
+from discord.abc import Messageable
+from creator.broadcast import Broadcaster
+from creator.draft import EmbedDraft
+from creator.locales import LocalizedError
+from creator.metrics import increment, span
+
+__all__ = ("ScheduledPost", "PostScheduler", "parse_when")
+
+_log = logging.getLogger(__name__)
+
+_RELATIVE = re.compile(r"^\+\s*(\d+)\s*([mhd])$", re.IGNORECASE)
+_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+_FORMATS = ("%d/%m/%Y %H:%M", "%d/%m/%y %H:%M", "%Y-%m-%d %H:%M")
+
+
+def parse_when(text: str, tz: tzinfo = timezone.utc, now: Optional[datetime] = None) -> datetime:
+    """
+    Essa função interpreta o horário de um agendamento: uma data e hora ("25/12/2026 18:30", no fuso `tz`)
+    ou um tempo a partir de agora ("+30m", "+2h", "+1d").
+
+    Levanta:
+        LocalizedError: Se o texto não estiver em nenhum dos formatos, com a mensagem `schedule.invalid`.
+    """
+    text = text.strip()
+    now = now or datetime.now(tz)
+    if match := _RELATIVE.match(text):
+        return now + timedelta(**{_UNITS[match[2].lower()]: int(match[1])})
+    for format in _FORMATS:
+        try:
+            return datetime.strptime(text, format).replace(tzinfo=tz)
+        except ValueError:
+            continue
+    raise LocalizedError("schedule.invalid")
+
+
+class ScheduledPost:
+    """
+    Essa classe representa um envio agendado.
+
+    Atributos:
+        id (str): O identificador do agendamento, usado em `PostScheduler.cancel`.
+        due (float): O horário do envio, em segundos desde a época Unix.
+        channel_ids (Tuple[int, ...]): Os IDs dos chats de destino.
+        data (Dict[str, Any]): A embed, no formato da API do Discord.
+        guild_id (int): O ID do servidor que agendou o envio, ou 0.
+    """
+
+    __slots__ = ("id", "due", "channel_ids", "data", "guild_id")
+
+    def __init__(self, id: str, due: float, channel_ids: Tuple[int, ...], data: Dict[str, Any], guild_id: int = 0) -> None:
+        self.id, self.due, self.channel_ids, self.data, self.guild_id = id, due, channel_ids, data, guild_id
+
+    @property
+    def when(self) -> datetime:
+        return datetime.fromtimestamp(self.due, timezone.utc)
+
+    def __repr__(self) -> str:
+        return f"<ScheduledPost id={self.id!r} when={self.when.isoformat()} channels={len(self.channel_ids)}>"
+
+
+class PostScheduler:
+    """
+    Essa classe envia embeds em horários agendados. Os agendamentos ficam em um heap em memória, ordenado pelo horário,
+    e uma única tarefa dorme até o próximo horário (em vez de uma tarefa por agendamento). Todos os envios vencidos
+    são despachados juntos, através do mesmo `Broadcaster` usado pelo botão "Enviar".
+    Os agendamentos também são gravados em um banco SQLite local, então sobrevivem a reinícios: os que venceram com o bot desligado
+    são enviados logo depois de `start()`. Um agendamento só é apagado do banco depois de enviado, então um envio interrompido por
+    uma queda pode ser repetido no reinício. As gravações no banco são feitas em uma thread própria, uma de cada vez e na ordem
+    em que foram feitas, então o loop não espera pelo disco.
+
+    Parâmetros:
+        bot (discord.Client): O bot usado para encontrar os chats de destino.
+        path (str, optional): O caminho do arquivo do banco. Por padrão é "embedcreator_schedule.sqlite3", separado do banco do
+            `SQLiteDraftStore`, então as gravações dos rascunhos não bloqueiam os agendamentos.
+        broadcaster (Broadcaster, optional): O `Broadcaster` usado nos envios. Por padrão é um novo, com os valores padrão.
+        timezone (datetime.tzinfo, optional): O fuso usado para interpretar as datas digitadas no botão "Agendar". Por padrão é UTC.
+        db_timeout (float, optional): O tempo máximo, em segundos, de espera quando o banco está bloqueado por outra conexão. Por padrão é 5.
+    """
+
+    def __init__(
+        self,
+        bot: Client,
+        path: str = "embedcreator_schedule.sqlite3",
+        broadcaster: Optional[Broadcaster] = None,
+        timezone: tzinfo = timezone.utc,
+        db_timeout: float = 5.0,
+    ) -> None:
+        self.bot, self.path, self.timezone = bot, path, timezone
+        self.broadcaster = broadcaster or Broadcaster()
+        self._heap: List[Tuple[float, str]] = []
+        self._posts: Dict[str, ScheduledPost] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._connection = sqlite3.connect(path, timeout=db_timeout, check_same_thread=False)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedcreator-schedule")
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS scheduled_posts "
+                "(id TEXT PRIMARY KEY, due REAL NOT NULL, guild_id INTEGER NOT NULL, channels TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+        for id, due, guild_id, channels, data in self._connection.execute("SELECT id, due, guild_id, channels, data FROM scheduled_posts"):
+            self._push(ScheduledPost(id, due, tuple(json.loads(channels)), json.loads(data), guild_id))
+
+    def _write(self, sql: str, rows: Iterable[Tuple[Any, ...]]) -> None:
+        rows = list(rows)
+
+        def write() -> None:
+            with self._connection:
+                self._connection.executemany(sql, rows)
+
+        def done(future: Future[None]) -> None:
+            if future.exception() is not None:
+                _log.error("Falha ao gravar %d agendamento(s) no banco.", len(rows), exc_info=future.exception())
+
+        self._executor.submit(write).add_done_callback(done)
+
+    def _push(self, post: ScheduledPost) -> None:
+        self._posts[post.id] = post
+        heapq.heappush(self._heap, (post.due, post.id))
+
+    def start(self) -> None:
+        """Esse método inicia a tarefa que envia os agendamentos. Deve ser chamado com o loop do bot rodando, por exemplo em `setup_hook`."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def schedule(
+        self,
+        embed: Union[Embed, EmbedDraft],
+        channels: Iterable[Union[Messageable, int]],
+        when: Union[datetime, float],
+        *,
+        guild_id: int = 0,
+    ) -> ScheduledPost:
+        """
+        Esse método agenda o envio da embed para os chats informados.
+
+        Parâmetros:
+            embed (discord.Embed ou EmbedDraft): A embed a ser enviada. Ela é copiada, então alterações posteriores não afetam o envio.
+            channels (Iterable[discord.abc.Messageable ou int]): Os chats de destino, ou os IDs deles.
+            when (datetime.datetime ou float): O horário do envio (um `datetime` com fuso, ou segundos desde a época Unix).
+            guild_id (int, optional): O ID do servidor, usado para listar os agendamentos em `pending`.
+
+        Retorna:
+            post (ScheduledPost)
+        """
+        draft = embed if isinstance(embed, EmbedDraft) else EmbedDraft.from_embed(embed)
+        due = when.timestamp() if isinstance(when, datetime) else float(when)
+        channel_ids = tuple(channel if isinstance(channel, int) else channel.id for channel in channels)  # type: ignore
+        post = ScheduledPost(os.urandom(8).hex(), due, channel_ids, draft.to_dict(), guild_id)
+        self._write(
+            "INSERT INTO scheduled_posts (id, due, guild_id, channels, data) VALUES (?, ?, ?, ?, ?)",
+            [(post.id, post.due, post.guild_id, json.dumps(channel_ids), json.dumps(post.data))],
+        )
+        self._push(post)
+        if self._heap[0][1] == post.id:
+            # o novo agendamento é o próximo, então a tarefa precisa acordar antes do horário em que estava dormindo
+            self._wakeup.set()
+        return post
+
+    def cancel(self, post_id: str) -> bool:
+        """
+        Esse método cancela um agendamento que ainda não foi enviado.
+
+        Retorna:
+            cancelled (bool): Se o agendamento existia.
+        """
+        # a entrada no heap é ignorada quando chegar a vez dela
+        if self._posts.pop(post_id, None) is None:
+            return False
+        self._write("DELETE FROM scheduled_posts WHERE id = ?", [(post_id,)])
+        return True
+
+    def pending(self, guild_id: Optional[int] = None) -> List[ScheduledPost]:
+        """Esse método lista os agendamentos ainda não enviados, em ordem de horário, de todos os servidores ou só de `guild_id`."""
+        posts = (post for post in self._posts.values() if guild_id is None or post.guild_id == guild_id)
+        return sorted(posts, key=lambda post: post.due)
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    async def _run(self) -> None:
+        while True:
+            now = time.time()
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                _, post_id = heapq.heappop(self._heap)
+                post = self._posts.pop(post_id, None)
+                if post is not None:
+                    due.append(post)
+            if due:
+                await self._dispatch(due)
+                continue
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _dispatch(self, posts: List[ScheduledPost]) -> None:
+        with span("scheduler.dispatch"):
+            await asyncio.gather(*(self._send(post) for post in posts))
+        self._write("DELETE FROM scheduled_posts WHERE id = ?", ((post.id,) for post in posts))
+        increment("scheduler.posts", len(posts))
+
+    async def _resolve(self, channel_id: int) -> Optional[Messageable]:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except Exception:
+                return None
+        return channel  # type: ignore
+
+    async def _send(self, post: ScheduledPost) -> None:
+        try:
+            channels = [channel for channel in await asyncio.gather(*map(self._resolve, post.channel_ids)) if channel is not None]
+            if len(channels) < len(post.channel_ids):
+                _log.warning("Agendamento %s: %d chat(s) não encontrado(s).", post.id, len(post.channel_ids) - len(channels))
+            results = await self.broadcaster.send(channels, embed=EmbedDraft.from_dict(post.data).to_embed())
+            for result in results:
+                if not result.ok:
+                    _log.warning("Agendamento %s: não foi possível enviar para %s: %s", post.id, result.channel, result.error)
+        except Exception:
+            _log.exception("Agendamento %s falhou.", post.id)
+
+    async def close(self) -> None:
+        """
+        Esse método para a tarefa, espera as gravações em andamento e fecha o banco.
+        Os agendamentos pendentes continuam gravados para o próximo `start()`.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+        self._connection.close()
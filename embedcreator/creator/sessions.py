@@ -0,0 +1,137 @@
+from __future__ import annotations
+import asyncio
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Optional
+
+__all__ = ("SessionRegistry", "TrackedSession", "registry")
+
+
+class _Session:
+    __slots__ = ("view", "last_seen", "idle_timeout")
+
+    def __init__(self, view: Any, idle_timeout: Optional[float]) -> None:
+        self.view = view
+        self.last_seen = time.monotonic()
+        self.idle_timeout = idle_timeout
+
+
+class SessionRegistry:
+    """
+    Essa classe acompanha todas as views e modals vivos (painéis `EmbedCreator`, `ModalInput`, `SelectPrompt` e `ChannelSelectPrompt`).
+    Quando o limite de sessões é atingido, a sessão usada há mais tempo (LRU) é encerrada. Se `idle_timeout` for definido, as sessões paradas
+    por mais que esse tempo também são encerradas por uma tarefa em segundo plano. Encerrar uma sessão chama `stop()`, o que libera qualquer `wait()` pendente.
+    O encerramento por inatividade é opcional porque muda o comportamento dos painéis criados com `timeout=None`, que antes nunca expiravam;
+    para ativá-lo no registro global, use por exemplo `registry.idle_timeout = 900` (a validade de uma interação do Discord).
+
+    Parâmetros:
+        max_sessions (int, optional): O número máximo de sessões vivas. Por padrão é 10000.
+        idle_timeout (float, optional): O tempo máximo, em segundos, que uma sessão pode ficar sem interações. Por padrão é `None`, que desativa o encerramento
+            por inatividade. Pode ser alterado depois, e vale também para as sessões já registradas.
+        reap_interval (float, optional): O intervalo, em segundos, entre as verificações de sessões paradas. Por padrão é 30.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 10_000,
+        idle_timeout: Optional[float] = None,
+        reap_interval: float = 30.0,
+    ) -> None:
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self._reaper: Optional[asyncio.Task[None]] = None
+
+    def register(self, view: Any, idle_timeout: Optional[float] = None) -> None:
+        """
+        Esse método começa a acompanhar uma view ou modal.
+
+        Parâmetros:
+            view (discord.ui.View ou discord.ui.Modal): A sessão a ser acompanhada.
+            idle_timeout (float, optional): Um timeout de inatividade específico para essa sessão. Por padrão usa o do registro.
+        """
+        self._sessions[view.id] = _Session(view, idle_timeout)
+        while len(self._sessions) > self.max_sessions:
+            _, oldest = self._sessions.popitem(last=False)
+            oldest.view.stop()
+        self._start_reaper()
+
+    def touch(self, view: Any) -> None:
+        """Esse método marca a sessão como usada agora, adiando seu encerramento por inatividade."""
+        session = self._sessions.get(view.id)
+        if session is not None:
+            session.last_seen = time.monotonic()
+            self._sessions.move_to_end(view.id)
+
+    def unregister(self, view: Any) -> None:
+        """Esse método para de acompanhar a sessão, sem encerrá-la."""
+        self._sessions.pop(view.id, None)
+
+    def expire(self, view: Any) -> None:
+        """Esse método encerra a sessão e para de acompanhá-la."""
+        self.unregister(view)
+        view.stop()
+
+    def reap(self, now: Optional[float] = None) -> int:
+        """
+        Esse método encerra todas as sessões paradas há mais tempo que o seu timeout de inatividade, e descarta as que já terminaram.
+
+        Retorna:
+            count (int): O número de sessões removidas.
+        """
+        now = time.monotonic() if now is None else now
+        expired = []
+        for session in self._sessions.values():
+            idle_timeout = session.idle_timeout if session.idle_timeout is not None else self.idle_timeout
+            if session.view.is_finished() or (idle_timeout is not None and now - session.last_seen > idle_timeout):
+                expired.append(session)
+        for session in expired:
+            self.expire(session.view)
+        return len(expired)
+
+    def counts(self) -> Dict[str, int]:
+        """Esse método retorna o número de sessões vivas por tipo, por exemplo {"EmbedCreator": 3, "ModalInput": 1}."""
+        return dict(Counter(type(session.view).__name__ for session in self._sessions.values()))
+
+    def _start_reaper(self) -> None:
+        if self._reaper is not None and not self._reaper.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._reaper = loop.create_task(self._reap_loop())
+
+    async def _reap_loop(self) -> None:
+        while self._sessions:
+            await asyncio.sleep(self.reap_interval)
+            self.reap()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, view: Any) -> bool:
+        return getattr(view, "id", None) in self._sessions
+
+
+registry = SessionRegistry()
+
+
+class TrackedSession:
+    """
+    Essa classe é um mixin para views e modals que devem ser acompanhados pelo `registry` global.
+    A sessão é registrada na criação e removida do registro quando é parada ou expira.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        registry.register(self)
+
+    def stop(self) -> None:
+        registry.unregister(self)
+        super().stop()  # type: ignore
+
+    async def on_timeout(self) -> None:
+        registry.unregister(self)
+        await super().on_timeout()  # type: ignore
@@ -0,0 +1,208 @@
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+__all__ = ("DraftStore", "SQLiteDraftStore", "WriteBehindDraftStore")
+
+_log = logging.getLogger(__name__)
+
+
+class DraftStore(ABC):
+    """
+    Essa classe é a interface dos armazenamentos de rascunhos usados pelo modo persistente do `EmbedCreator`.
+    Cada registro é um dicionário serializável em JSON, identificado pela chave da sessão; o `EmbedCreator` guarda nele o rascunho
+    (no formato de `discord.Embed.to_dict()`), os editores e as mensagens do modo de edição (veja `EmbedCreator.from_record`).
+    Os métodos são síncronos: um armazenamento que acessa disco ou rede bloqueia quem o chama, então no loop de eventos
+    ele deve ser usado através do `WriteBehindDraftStore`, que faz as gravações em uma thread separada.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Esse método retorna o rascunho guardado com a chave informada, ou `None` se ele não existir."""
+
+    @abstractmethod
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Esse método guarda (ou substitui) vários rascunhos de uma vez, como pares de chave e rascunho."""
+
+    @abstractmethod
+    def delete_many(self, keys: Iterable[str]) -> None:
+        """Esse método remove os rascunhos com as chaves informadas. Chaves inexistentes são ignoradas."""
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        self.put_many(((key, data),))
+
+    def delete(self, key: str) -> None:
+        self.delete_many((key,))
+
+    def flush(self) -> None:
+        """Esse método grava as alterações pendentes. Por padrão não faz nada."""
+
+    def close(self) -> None:
+        """Esse método grava as alterações pendentes e libera os recursos do armazenamento."""
+        self.flush()
+
+
+class SQLiteDraftStore(DraftStore):
+    """
+    Essa classe guarda os rascunhos em um banco SQLite local. As chamadas bloqueiam até o banco responder; elas podem ser feitas
+    de qualquer thread, o que permite ao `WriteBehindDraftStore` gravar fora do loop de eventos.
+
+    Parâmetros:
+        path (str, optional): O caminho do arquivo do banco. Por padrão é "embedcreator.sqlite3".
+    """
+
+    def __init__(self, path: str = "embedcreator.sqlite3") -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS drafts (key TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute("SELECT data FROM drafts WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        now = time.time()
+        rows = [(key, json.dumps(data), now) for key, data in items]
+        with self._lock, self._connection:
+            self._connection.executemany("INSERT OR REPLACE INTO drafts (key, data, updated_at) VALUES (?, ?, ?)", rows)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        rows = [(key,) for key in keys]
+        with self._lock, self._connection:
+            self._connection.executemany("DELETE FROM drafts WHERE key = ?", rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class WriteBehindDraftStore(DraftStore):
+    """
+    Essa classe agrupa as gravações de outro armazenamento: as alterações ficam em memória e são gravadas juntas,
+    em uma única transação, a cada `flush_interval` segundos ou quando `max_pending` alterações se acumulam.
+    Dentro do loop de eventos, as gravações são feitas em uma thread própria, uma de cada vez e na ordem em que foram feitas,
+    então o loop não espera pelo disco. As leituras consultam primeiro as alterações pendentes e as que estão sendo gravadas,
+    então um rascunho recém-editado é sempre lido na versão mais recente; só a leitura de um rascunho fora da memória chega ao `backend`.
+    `get` pode ser chamado de outra thread (por exemplo com `run_in_executor`): as alterações em memória são protegidas por um lock.
+
+    Parâmetros:
+        backend (DraftStore): O armazenamento em que as alterações são gravadas.
+        flush_interval (float, optional): O intervalo máximo, em segundos, entre as gravações. Por padrão é 5.
+        max_pending (int, optional): O número de alterações pendentes que força uma gravação imediata. Por padrão é 100.
+    """
+
+    def __init__(self, backend: DraftStore, flush_interval: float = 5.0, max_pending: int = 100) -> None:
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        # chave -> rascunho, ou None para uma remoção pendente
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        # as alterações entregues à thread de gravação e ainda não confirmadas, no mesmo formato
+        self._writing: Dict[str, Optional[Dict[str, Any]]] = {}
+        # protege `_pending` e `_writing`, lidos por `get` em outras threads e trocados no loop de eventos
+        self._lock = threading.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedcreator-drafts")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for layer in (self._pending, self._writing):
+                if key in layer:
+                    return layer[key]
+        # fora da memória: o `backend` já tem a última versão confirmada, e a leitura não precisa segurar o lock
+        return self.backend.get(key)
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        items = list(items)
+        with self._lock:
+            self._pending.update(items)
+        self._schedule()
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        removed = [(key, None) for key in keys]
+        with self._lock:
+            self._pending.update(removed)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.flush()
+        if len(self._pending) >= self.max_pending:
+            return self._flush_in_background()
+        if self._timer is None:
+            self._timer = loop.call_later(self.flush_interval, self._flush_in_background)
+
+    def _take(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._writing.update(pending)
+        return pending
+
+    def _write(self, pending: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        self.backend.put_many((key, data) for key, data in pending.items() if data is not None)
+        self.backend.delete_many(key for key, data in pending.items() if data is None)
+
+    def _written(self, pending: Dict[str, Optional[Dict[str, Any]]], error: Optional[BaseException]) -> None:
+        with self._lock:
+            for key, data in pending.items():
+                if error is not None:
+                    # mantém as alterações para a próxima tentativa, sem sobrescrever as que chegaram depois
+                    self._pending.setdefault(key, data)
+                if key in self._writing and self._writing[key] is data:
+                    del self._writing[key]
+
+    def _flush_in_background(self) -> None:
+        pending = self._take()
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+
+        def done(future: Future[None]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._finish_background, pending, future.exception())
+
+        self._executor.submit(self._write, pending).add_done_callback(done)
+
+    def _finish_background(self, pending: Dict[str, Optional[Dict[str, Any]]], error: Optional[BaseException]) -> None:
+        self._written(pending, error)
+        if error is not None:
+            _log.error("Falha ao gravar %d rascunho(s); nova tentativa em %ss", len(pending), self.flush_interval, exc_info=error)
+            if self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._flush_in_background)
+
+    def flush(self) -> None:
+        """
+        Esse método grava as alterações pendentes e espera a gravação terminar, junto com as que já estavam em andamento.
+        Ele bloqueia quem o chama; dentro do loop de eventos as gravações já acontecem sozinhas, então use-o ao encerrar o bot.
+        """
+        pending = self._take()
+        error = None
+        try:
+            self._executor.submit(self._write, pending).result()
+        except Exception as exc:
+            error = exc
+            raise
+        finally:
+            self._written(pending, error)
+
+    def close(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
+        self.backend.close()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from creator.draft import EmbedDraft
+from creator.locales import LocalizedError
+
+__all__ = ("TemplateLibrary",)
+
+# maior caractere Unicode, usado como limite superior das buscas por prefixo
+_MAX_CHAR = "\U0010ffff"
+
+
+class TemplateLibrary:
+    """
+    Essa classe é uma biblioteca de modelos de embed salvos por servidor, guardada em um banco SQLite local.
+    Os modelos são indexados por (servidor, nome), então listar, buscar por prefixo e carregar um modelo consultam apenas o índice,
+    qualquer que seja o número de modelos salvos. Os nomes não diferenciam maiúsculas de minúsculas.
+    Os modelos mais usados ficam em um cache LRU em memória e são carregados sem acessar o disco.
+    As chamadas bloqueiam até o banco responder e podem ser feitas de qualquer thread; dentro do loop de eventos,
+    faça as chamadas com `loop.run_in_executor`, como o `CreatorMethods`.
+
+    Parâmetros:
+        path (str, optional): O caminho do arquivo do banco. Por padrão é "embedcreator_templates.sqlite3", separado do banco do
+            `SQLiteDraftStore`, então as gravações dos rascunhos não bloqueiam os modelos.
+        cache_size (int, optional): O número máximo de modelos guardados em memória. Por padrão é 64.
+        timeout (float, optional): O tempo máximo, em segundos, de espera quando o banco está bloqueado por outra conexão. Por padrão é 5.
+    """
+
+    def __init__(self, path: str = "embedcreator_templates.sqlite3", cache_size: int = 64, timeout: float = 5.0) -> None:
+        self.path = path
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Tuple[int, str], EmbedDraft] = OrderedDict()
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        # protege a conexão e o cache, usados pelas threads do executor
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS templates ("
+                "guild_id INTEGER NOT NULL, key TEXT NOT NULL, name TEXT NOT NULL, data TEXT NOT NULL, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (guild_id, key)) WITHOUT ROWID"
+            )
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return name.strip().casefold()
+
+    def save(self, guild_id: int, name: str, draft: EmbedDraft) -> None:
+        """
+        Esse método salva (ou substitui) o rascunho como o modelo `name` do servidor.
+
+        Levanta:
+            LocalizedError: Se o nome estiver vazio, com a mensagem `templates.empty_name`.
+        """
+        key = self._key(name)
+        if not key:
+            raise LocalizedError("templates.empty_name")
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO templates (guild_id, key, name, data, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (guild_id, key, name.strip(), json.dumps(draft.to_dict()), time.time()),
+            )
+            self._remember((guild_id, key), draft.copy())
+
+    def load(self, guild_id: int, name: str) -> Optional[EmbedDraft]:
+        """
+        Esse método carrega o modelo `name` do servidor.
+
+        Retorna:
+            draft (EmbedDraft, optional): Um rascunho novo com o modelo, que pode ser editado sem alterar o modelo salvo, ou `None` se ele não existir.
+        """
+        cache_key = (guild_id, self._key(name))
+        with self._lock:
+            draft = self._cache.get(cache_key)
+            if draft is None:
+                row = self._connection.execute(
+                    "SELECT data FROM templates WHERE guild_id = ? AND key = ?", cache_key
+                ).fetchone()
+                if row is None:
+                    return None
+                draft = EmbedDraft.from_dict(json.loads(row[0]))
+                self._remember(cache_key, draft)
+            else:
+                self._cache.move_to_end(cache_key)
+            return draft.copy()
+
+    def delete(self, guild_id: int, name: str) -> bool:
+        """
+        Esse método remove o modelo `name` do servidor.
+
+        Retorna:
+            deleted (bool): Se o modelo existia.
+        """
+        cache_key = (guild_id, self._key(name))
+        with self._lock, self._connection:
+            self._cache.pop(cache_key, None)
+            cursor = self._connection.execute("DELETE FROM templates WHERE guild_id = ? AND key = ?", cache_key)
+        return cursor.rowcount > 0
+
+    def names(self, guild_id: int, prefix: str = "", limit: int = 25) -> List[str]:
+        """
+        Esse método lista, em ordem alfabética, os nomes dos modelos do servidor que começam com `prefix`.
+        Pode ser usado diretamente no autocomplete de um comando de barra.
+
+        Parâmetros:
+            guild_id (int): O ID do servidor.
+            prefix (str, optional): O começo do nome. Por padrão lista todos os modelos.
+            limit (int, optional): O número máximo de nomes retornados. Por padrão é 25, o máximo de opções de um menu de seleção.
+        """
+        start = self._key(prefix)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT name FROM templates WHERE guild_id = ? AND key >= ? AND key < ? ORDER BY key LIMIT ?",
+                (guild_id, start, start + _MAX_CHAR, limit),
+            ).fetchall()
+        return [name for name, in rows]
+
+    def count(self, guild_id: int) -> int:
+        """Esse método retorna o número de modelos salvos do servidor."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM templates WHERE guild_id = ?", (guild_id,)).fetchone()[0]
+
+    def _remember(self, cache_key: Tuple[int, str], draft: EmbedDraft) -> None:
+        self._cache[cache_key] = draft
+        self._cache.move_to_end(cache_key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Esse método descarta os modelos guardados em memória."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+import asyncio
+import ipaddress
+import socket
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import aiohttp
+from aiohttp.abc import AbstractResolver, ResolveResult
+from yarl import URL
+from creator.metrics import increment, span
+
+__all__ = ("UrlCheckResult", "UrlChecker")
+
+# respostas a HEAD que indicam que o servidor só não aceita o método, e não que a URL é inválida
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+_REDIRECTS = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+def _is_public(host: str) -> bool:
+    address = ipaddress.ip_address(host)
+    if isinstance(address, ipaddress.IPv6Address) and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global
+
+
+class _BlockedAddressError(OSError):
+    pass
+
+
+class _PublicResolver(AbstractResolver):
+    # resolve os nomes na hora da conexão e recusa endereços internos, então um DNS que muda de resposta depois
+    # da verificação (DNS rebinding) não leva a requisição para a rede interna
+    def __init__(self) -> None:
+        self._resolver = aiohttp.DefaultResolver()
+
+    async def resolve(self, host: str, port: int = 0, family: socket.AddressFamily = socket.AF_INET) -> List[ResolveResult]:
+        addresses = await self._resolver.resolve(host, port, family)
+        if not all(_is_public(address["host"]) for address in addresses):
+            raise _BlockedAddressError(f"{host} resolves to an internal address")
+        return addresses
+
+    async def close(self) -> None:
+        await self._resolver.close()
+
+
+class UrlCheckResult:
+    """
+    Essa classe representa o resultado da verificação de uma URL de imagem.
+
+    Atributos:
+        url (str): A URL verificada.
+        status (int, optional): O código HTTP da resposta, ou `None` se não houve resposta.
+        content_type (str, optional): O tipo de mídia da resposta, sem parâmetros (ex: "image/png").
+        error (str, optional): A descrição do erro de conexão, se houve um.
+        blocked (bool): Se a URL (ou um redirecionamento dela) aponta para um endereço interno e não foi acessada.
+    """
+
+    __slots__ = ("url", "status", "content_type", "error", "blocked")
+
+    def __init__(
+        self,
+        url: str,
+        status: Optional[int] = None,
+        content_type: Optional[str] = None,
+        error: Optional[str] = None,
+        blocked: bool = False,
+    ) -> None:
+        self.url, self.status, self.content_type, self.error, self.blocked = url, status, content_type, error, blocked
+
+    @property
+    def ok(self) -> bool:
+        return self.status is not None and 200 <= self.status < 300 and (self.content_type or "").startswith("image/")
+
+    @property
+    def problem(self) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        O erro, como a chave da mensagem em `creator.locales` e os campos dela (como em `EmbedValidationError.problems`),
+        ou `None` se a URL é uma imagem válida.
+        """
+        if self.ok:
+            return None
+        url = self.url[:100]
+        if self.blocked:
+            return "url.blocked", {"url": url}
+        if self.status is None:
+            return "url.unreachable", {"url": url}
+        if not 200 <= self.status < 300:
+            return "url.http_error", {"url": url, "status": self.status}
+        if self.content_type is None:
+            return "url.not_image.unknown", {"url": url}
+        return "url.not_image", {"url": url, "content_type": self.content_type}
+
+    def __repr__(self) -> str:
+        return f"<UrlCheckResult url={self.url!r} ok={self.ok} status={self.status} content_type={self.content_type!r}>"
+
+
+class UrlChecker:
+    """
+    Essa classe verifica se as URLs de imagem de uma embed respondem e apontam para uma imagem, antes de a embed ser enviada.
+    Cada URL é verificada com um HEAD (ou, se o servidor não aceitar HEAD, com um GET do primeiro byte), com um limite de verificações simultâneas.
+    Verificações simultâneas da mesma URL são feitas uma única vez, e os resultados ficam em um cache com validade e tamanho máximo,
+    então os links comuns (imgur, CDNs) são verificados apenas uma vez.
+    URLs (e redirecionamentos) que apontam para endereços internos (loopback, redes privadas, link-local) são recusadas sem serem acessadas.
+
+    Parâmetros:
+        concurrency (int, optional): O número máximo de verificações simultâneas. Por padrão é 10.
+        timeout (float, optional): O tempo máximo, em segundos, de cada verificação. Por padrão é 5.
+        ttl (float, optional): A validade, em segundos, de um resultado positivo no cache. Por padrão é 3600.
+        failure_ttl (float, optional): A validade, em segundos, de um resultado negativo no cache. Por padrão é 60.
+        max_entries (int, optional): O número máximo de resultados no cache. Os usados há mais tempo são descartados. Por padrão é 1024.
+        session (aiohttp.ClientSession, optional): A sessão HTTP usada. Por padrão uma é criada no primeiro uso e fechada em `close()`.
+            Só a sessão criada pelo verificador confere os endereços também na hora da conexão.
+        allow_private (bool, optional): Se URLs que apontam para endereços internos podem ser acessadas. Por padrão é `False`.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 10,
+        timeout: float = 5.0,
+        ttl: float = 3600.0,
+        failure_ttl: float = 60.0,
+        max_entries: int = 1024,
+        session: Optional[aiohttp.ClientSession] = None,
+        allow_private: bool = False,
+    ) -> None:
+        self.timeout, self.ttl, self.failure_ttl, self.max_entries = timeout, ttl, failure_ttl, max_entries
+        self.allow_private = allow_private
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._session, self._owns_session = session, session is None
+        # url -> (expira em, resultado), na ordem de uso
+        self._cache: OrderedDict[str, Tuple[float, UrlCheckResult]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task[UrlCheckResult]] = {}
+
+    async def check(self, url: str) -> UrlCheckResult:
+        """
+        Esse método verifica uma URL de imagem. URLs `attachment://` são sempre aceitas.
+
+        Retorna:
+            result (UrlCheckResult)
+        """
+        if url.startswith("attachment://"):
+            return UrlCheckResult(url, 200, "image/*")
+        cached = self._cache.get(url)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                self._cache.move_to_end(url)
+                increment("url.check.cached")
+                return cached[1]
+            del self._cache[url]
+        task = self._inflight.get(url)
+        if task is None:
+            task = self._inflight[url] = asyncio.create_task(self._fetch(url))
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # o cancelamento de quem espera não cancela a verificação compartilhada
+        return await asyncio.shield(task)
+
+    async def check_many(self, urls: Iterable[str]) -> List[UrlCheckResult]:
+        """Esse método verifica várias URLs em paralelo e retorna os resultados na mesma ordem."""
+        return list(await asyncio.gather(*(self.check(url) for url in urls)))
+
+    async def problems(self, urls: Iterable[Optional[str]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Esse método verifica as URLs informadas (as vazias são ignoradas) e retorna os erros (veja `UrlCheckResult.problem`) das que falharem."""
+        results = await self.check_many(dict.fromkeys(url for url in urls if url))
+        return [result.problem for result in results if result.problem is not None]
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            resolver = None if self.allow_private else _PublicResolver()
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(resolver=resolver))
+            self._owns_session = True
+        return self._session
+
+    async def _allowed(self, url: URL) -> bool:
+        # a sessão passada por quem usa o verificador não tem o `_PublicResolver`, então os nomes também são resolvidos aqui
+        if self.allow_private:
+            return True
+        host = url.raw_host
+        if url.scheme not in ("http", "https") or not host:
+            return False
+        try:
+            return _is_public(host)
+        except ValueError:
+            pass
+        try:
+            addresses = await asyncio.get_running_loop().getaddrinfo(host, url.port, type=socket.SOCK_STREAM)
+        except OSError:
+            # o nome não existe: a requisição falha sozinha e a URL é informada como inacessível
+            return True
+        return all(_is_public(address[4][0]) for address in addresses)
+
+    async def _request(self, method: str, url: str, **kwargs: object) -> UrlCheckResult:
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        target = URL(url)
+        # os redirecionamentos são seguidos aqui, para que cada destino seja conferido antes de ser acessado
+        for _ in range(_MAX_REDIRECTS + 1):
+            if not await self._allowed(target):
+                return UrlCheckResult(url, blocked=True)
+            async with self._get_session().request(method, target, timeout=timeout, allow_redirects=False, **kwargs) as response:  # type: ignore
+                location = response.headers.get("Location")
+                if response.status not in _REDIRECTS or not location:
+                    return UrlCheckResult(url, response.status, response.content_type)
+                target = response.url.join(URL(location))
+        return UrlCheckResult(url, error="too many redirects")
+
+    async def _fetch(self, url: str) -> UrlCheckResult:
+        async with self._semaphore:
+            with span("url.check"):
+                try:
+                    result = await self._request("HEAD", url)
+                    if result.status in _HEAD_UNSUPPORTED:
+                        result = await self._request("GET", url, headers={"Range": "bytes=0-0"})
+                except aiohttp.ClientConnectorError as error:
+                    result = UrlCheckResult(url, error=str(error), blocked=isinstance(error.os_error, _BlockedAddressError))
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as error:
+                    result = UrlCheckResult(url, error=str(error) or type(error).__name__)
+        self._remember(result)
+        return result
+
+    def _remember(self, result: UrlCheckResult) -> None:
+        self._cache[result.url] = (time.monotonic() + (self.ttl if result.ok else self.failure_ttl), result)
+        self._cache.move_to_end(result.url)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Esse método descarta todos os resultados do cache."""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    async def close(self) -> None:
+        """Esse método fecha a sessão HTTP, se ela foi criada pelo verificador."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,226 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from creator.draft import EmbedDraft
+from creator.locales import LocalizedError
+
+if TYPE_CHECKING:
+    from discord import Embed
+
+__all__ = ("EmbedLimits", "EmbedValidationError", "EmbedValidator")
+
+
+class EmbedLimits:
+    """Os limites de uma embed na API do Discord."""
+
+    TITLE = 256
+    DESCRIPTION = 4096
+    FIELDS = 25
+    FIELD_NAME = 256
+    FIELD_VALUE = 1024
+    FOOTER_TEXT = 2048
+    AUTHOR_NAME = 256
+    TOTAL = 6000
+    COLOUR = 0xFFFFFF
+    URL_SCHEMES = ("http", "https")
+    IMAGE_URL_SCHEMES = ("http", "https", "attachment")
+
+
+# limite de cada seção de texto que conta para o total de caracteres; a mensagem de erro é `validation.<seção>.length`
+_TEXT_LIMITS = {
+    "title": EmbedLimits.TITLE,
+    "description": EmbedLimits.DESCRIPTION,
+    "author": EmbedLimits.AUTHOR_NAME,
+    "footer": EmbedLimits.FOOTER_TEXT,
+}
+
+# (chave da mensagem em `creator.locales`, campos da mensagem)
+Problem = Tuple[str, Dict[str, Any]]
+
+
+class EmbedValidationError(LocalizedError):
+    """
+    Essa exceção é levantada quando uma alteração deixaria a embed fora dos limites do Discord.
+
+    Parâmetros:
+        problems (List[Tuple[str, Dict[str, Any]]]): Os problemas encontrados, como pares de chave do catálogo e campos da mensagem.
+    """
+
+    def __init__(self, problems: List[Problem]) -> None:
+        self.problems = problems
+        ValueError.__init__(self, self.localize())
+
+
+class EmbedValidator:
+    """
+    Essa classe valida as alterações de uma embed localmente, antes de qualquer chamada à API do Discord.
+    Ela guarda o tamanho de cada seção e o total de caracteres, então validar uma alteração custa apenas o tamanho da seção alterada.
+    Os métodos `check_*` devem ser chamados logo antes de aplicar a alteração na embed: se ela for válida, o total é atualizado;
+    se não for, `EmbedValidationError` é levantada e nada muda.
+
+    Parâmetros:
+        embed (EmbedDraft ou discord.Embed, optional): A embed inicial. Por padrão a validação começa com uma embed vazia.
+    """
+
+    def __init__(self, embed: Optional[Union[EmbedDraft, Embed]] = None) -> None:
+        self._sections = dict.fromkeys(_TEXT_LIMITS, 0)
+        self._fields: List[int] = []
+        self.total = 0
+        if embed is not None:
+            self.reset(embed)
+
+    def reset(self, embed: Union[EmbedDraft, Embed]) -> None:
+        """Esse método recalcula todos os tamanhos a partir da embed informada."""
+        draft = embed if isinstance(embed, EmbedDraft) else EmbedDraft.from_embed(embed)
+        self._sections = {
+            "title": len(draft.title or ""),
+            "description": len(draft.description or ""),
+            "author": len(draft.author_name or ""),
+            "footer": len(draft.footer_text or ""),
+        }
+        self.sync_fields(draft)
+
+    def sync_fields(self, draft: EmbedDraft) -> None:
+        """Esse método recalcula apenas os tamanhos dos campos, depois de uma alteração em lote nos campos."""
+        self._fields = [len(name or "") + len(value or "") for name, value, _ in draft.fields]
+        self.total = sum(self._sections.values()) + sum(self._fields)
+
+    @property
+    def field_count(self) -> int:
+        return len(self._fields)
+
+    def _check_total(self, total: int, problems: List[Problem]) -> None:
+        if total > EmbedLimits.TOTAL:
+            problems.append(("validation.total", {"total": total, "limit": EmbedLimits.TOTAL}))
+        if problems:
+            raise EmbedValidationError(problems)
+
+    def check_text(self, **sections: Optional[str]) -> None:
+        """
+        Esse método valida novos textos para as seções `title`, `description`, `author` (nome) e `footer` (texto).
+
+        Levanta:
+            EmbedValidationError: Se algum texto passar do limite da seção ou do total da embed.
+        """
+        problems: List[Problem] = []
+        lengths = {}
+        for section, text in sections.items():
+            limit = _TEXT_LIMITS[section]
+            lengths[section] = length = len(text or "")
+            if length > limit:
+                problems.append((f"validation.{section}.length", {"length": length, "limit": limit}))
+        total = self.total + sum(length - self._sections[section] for section, length in lengths.items())
+        self._check_total(total, problems)
+        self._sections.update(lengths)
+        self.total = total
+
+    def check_field(self, name: str, value: str, index: Optional[int] = None) -> None:
+        """
+        Esse método valida um campo novo (`index` igual a `None`) ou os novos valores do campo na posição `index`.
+
+        Levanta:
+            EmbedValidationError: Se o campo passar dos limites, se a embed já tiver 25 campos ou se o total passar de 6000 caracteres.
+        """
+        problems: List[Problem] = []
+        if index is None and len(self._fields) >= EmbedLimits.FIELDS:
+            problems.append(("validation.field.limit", {"limit": EmbedLimits.FIELDS}))
+        if not name or not value:
+            problems.append(("validation.field.empty", {}))
+        if len(name) > EmbedLimits.FIELD_NAME:
+            problems.append(("validation.field.name_length", {"length": len(name), "limit": EmbedLimits.FIELD_NAME}))
+        if len(value) > EmbedLimits.FIELD_VALUE:
+            problems.append(("validation.field.value_length", {"length": len(value), "limit": EmbedLimits.FIELD_VALUE}))
+        length = len(name) + len(value)
+        total = self.total + length - (0 if index is None else self._fields[index])
+        self._check_total(total, problems)
+        if index is None:
+            self._fields.append(length)
+        else:
+            self._fields[index] = length
+        self.total = total
+
+    def check_draft(self, draft: EmbedDraft) -> None:
+        """
+        Esse método valida um rascunho inteiro, por exemplo um importado de JSON, e passa a acompanhar os tamanhos dele.
+
+        Levanta:
+            EmbedValidationError: Com todos os problemas encontrados, se o rascunho estiver fora dos limites do Discord.
+        """
+        problems: List[Problem] = []
+        sections = {"title": draft.title, "description": draft.description, "author": draft.author_name, "footer": draft.footer_text}
+        total = 0
+        for section, text in sections.items():
+            limit = _TEXT_LIMITS[section]
+            length = len(text or "")
+            total += length
+            if length > limit:
+                problems.append((f"validation.{section}.length", {"length": length, "limit": limit}))
+        if len(draft.fields) > EmbedLimits.FIELDS:
+            problems.append(("validation.fields.count", {"count": len(draft.fields), "limit": EmbedLimits.FIELDS}))
+        for position, (name, value, _) in enumerate(draft.fields, 1):
+            total += len(name) + len(value)
+            if not name or not value:
+                problems.append(("validation.fields.empty", {"position": position}))
+            if len(name) > EmbedLimits.FIELD_NAME:
+                problems.append(
+                    ("validation.fields.name_length", {"position": position, "length": len(name), "limit": EmbedLimits.FIELD_NAME})
+                )
+            if len(value) > EmbedLimits.FIELD_VALUE:
+                problems.append(
+                    ("validation.fields.value_length", {"position": position, "length": len(value), "limit": EmbedLimits.FIELD_VALUE})
+                )
+        urls = (
+            (draft.url, False), (draft.author_url, False), (draft.author_icon_url, True),
+            (draft.footer_icon_url, True), (draft.thumbnail, True), (draft.image, True),
+        )
+        for url, image in urls:
+            try:
+                self.check_url(url, image=image)
+            except EmbedValidationError as error:
+                problems.extend(error.problems)
+        if draft.colour is not None:
+            try:
+                self.check_colour(draft.colour)
+            except EmbedValidationError as error:
+                problems.extend(error.problems)
+        self._check_total(total, problems)
+        self.reset(draft)
+
+    def remove_fields(self, indexes: Iterable[int]) -> None:
+        """Esse método desconta os campos removidos do total."""
+        removed = set(indexes)
+        self.total -= sum(self._fields[index] for index in removed)
+        self._fields = [length for index, length in enumerate(self._fields) if index not in removed]
+
+    @staticmethod
+    def check_url(url: Optional[str], *, image: bool = False) -> None:
+        """
+        Esse método valida uma URL. Uma URL vazia é aceita e significa remover a imagem ou o link.
+
+        Parâmetros:
+            url (str, optional): A URL a ser validada.
+            image (bool, optional): Se a URL é de uma imagem, caso em que `attachment://` também é aceito. Por padrão é False.
+
+        Levanta:
+            EmbedValidationError: Se a URL não for http(s) ou não tiver um endereço.
+        """
+        if not url:
+            return
+        schemes = EmbedLimits.IMAGE_URL_SCHEMES if image else EmbedLimits.URL_SCHEMES
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            parts = None
+        if parts is None or parts.scheme not in schemes or not parts.netloc or any(char.isspace() for char in url):
+            raise EmbedValidationError([("validation.url", {"url": url[:100]})])
+
+    @staticmethod
+    def check_colour(value: int) -> None:
+        """
+        Esse método valida o valor de uma cor.
+
+        Levanta:
+            EmbedValidationError: Se a cor não estiver entre 0x000000 e 0xFFFFFF.
+        """
+        if not 0 <= value <= EmbedLimits.COLOUR:
+            raise EmbedValidationError([("validation.colour", {})])
@@ -0,0 +1,80 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+__all__ = ("DraftConflictError", "DraftVersions", "merge_values")
+
+# a "seção" marcada pelas alterações que substituem a embed inteira
+WHOLE_DRAFT = "*"
+
+
+class DraftConflictError(Exception):
+    """
+    Essa exceção é levantada quando uma alteração foi feita sobre uma versão antiga do rascunho e se sobrepõe a uma alteração mais nova.
+
+    Atributos:
+        keys (Tuple[str, ...]): Os atributos do rascunho em conflito, ou `("*",)` quando a alteração substituiria a embed inteira.
+    """
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        self.keys = tuple(keys)
+        super().__init__(f"Conflito em: {', '.join(self.keys)}")
+
+
+class DraftVersions:
+    """
+    Essa classe numera as versões de um rascunho editado por várias pessoas ao mesmo tempo.
+    Cada alteração aplicada recebe o próximo número e marca as seções que mudou (ex: "author", "fields"), então uma alteração
+    preparada sobre a versão `n` sabe, sem comparar rascunhos, se alguma seção dela mudou desde então.
+    """
+
+    __slots__ = ("version", "_sections")
+
+    def __init__(self) -> None:
+        self.version = 0
+        # seção -> versão da última alteração nela
+        self._sections: Dict[str, int] = {}
+
+    def bump(self, sections: Iterable[str] = ()) -> int:
+        """
+        Esse método registra uma alteração nas seções informadas (ou na embed inteira, se nenhuma for informada).
+
+        Retorna:
+            version (int): O número da nova versão.
+        """
+        self.version += 1
+        for section in tuple(sections) or (WHOLE_DRAFT,):
+            self._sections[section] = self.version
+        return self.version
+
+    def changed_since(self, version: int, section: Optional[str] = None) -> bool:
+        """Esse método diz se a seção informada (ou qualquer parte do rascunho, se `None`) mudou depois da versão `version`."""
+        if section is None:
+            return self.version > version
+        return max(self._sections.get(section, 0), self._sections.get(WHOLE_DRAFT, 0)) > version
+
+
+def _empty(value: Any) -> Any:
+    return None if value == "" else value
+
+
+def merge_values(base: Mapping[str, Any], mine: Mapping[str, Any], theirs: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Essa função junta, atributo por atributo, uma alteração preparada sobre `base` com o estado atual `theirs`.
+    O atributo que eu não mudei fica com o valor atual; o que só eu mudei (ou que mudou para o mesmo valor) fica com o meu.
+    Textos vazios e `None` são considerados iguais.
+
+    Levanta:
+        DraftConflictError: Se algum atributo foi mudado dos dois lados, para valores diferentes.
+    """
+    merged, conflicts = {}, []
+    for key, value in mine.items():
+        original, current, value = _empty(base.get(key)), _empty(theirs.get(key)), _empty(value)
+        if value == original:
+            merged[key] = current
+        elif current == original or current == value:
+            merged[key] = value
+        else:
+            conflicts.append(key)
+    if conflicts:
+        raise DraftConflictError(conflicts)
+    return merged
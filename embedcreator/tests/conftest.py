@@ -0,0 +1,6 @@
+import os
+import sys
+
+# os testes usam o pacote `creator` desta pasta e os objetos falsos dos benchmarks
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.join(ROOT, "benchmarks")]
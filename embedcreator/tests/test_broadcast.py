@@ -0,0 +1,42 @@
+"""
+Testes do `Broadcaster`: os envios para o mesmo chat ficam em fila mesmo quando vêm de chamadas diferentes de `send`.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+
+from creator.broadcast import Broadcaster
+
+
+class SlowChannel:
+    id = 1
+
+    def __init__(self) -> None:
+        self.active = self.peak = self.sent = 0
+
+    async def send(self, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        self.sent += 1
+        return object()
+
+
+def test_sends_to_one_channel_stay_queued_across_calls():
+    async def main():
+        broadcaster, channel = Broadcaster(), SlowChannel()
+        first = asyncio.create_task(broadcaster.send([channel]))
+        await asyncio.sleep(0)
+        # espera na fila do chat enquanto o primeiro envio acontece
+        second = asyncio.create_task(broadcaster.send([channel]))
+        await first
+        # o primeiro terminou e o segundo ainda não começou: a rota não pode ser descartada
+        third = asyncio.create_task(broadcaster.send([channel]))
+        await asyncio.gather(second, third)
+        return broadcaster, channel
+
+    broadcaster, channel = asyncio.run(main())
+    assert (channel.sent, channel.peak) == (3, 1)
+    assert broadcaster._routes == {}
@@ -0,0 +1,160 @@
+"""
+Testes de `CreatorMethods.edit_fields` e `CreatorMethods.remove_field`, a edição dos campos em lote.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+from typing import List
+
+import pytest
+
+from creator.draft import EmbedDraft
+from creator.embed_creator.methods import CreatorMethods
+from creator.input import SelectPrompt
+from creator.validation import EmbedLimits, EmbedValidationError
+from fakes import FakeAPI, FakeInteraction
+
+FIELDS = tuple((f"nome {index}", f"valor {index}", index % 2 == 0) for index in range(5))
+
+
+def make_methods() -> CreatorMethods:
+    return CreatorMethods(EmbedDraft(title="Título", fields=FIELDS))
+
+
+def names(methods: CreatorMethods) -> List[str]:
+    return [name for name, _, _ in methods.draft.fields]
+
+
+def assert_in_sync(methods: CreatorMethods) -> None:
+    # os tamanhos acompanhados pelo validador devem ser os mesmos de um validador novo
+    fresh = CreatorMethods(methods.draft).validator
+    assert methods.validator.field_count == fresh.field_count
+    assert methods.validator.total == fresh.total
+
+
+def test_remove_several_fields():
+    methods = make_methods()
+    methods.edit_fields(remove=[3, 0, 1])
+    assert names(methods) == ["nome 2", "nome 4"]
+    assert_in_sync(methods)
+
+
+def test_remove_all_fields():
+    methods = make_methods()
+    methods.edit_fields(remove=range(len(FIELDS)))
+    assert methods.draft.fields == ()
+    assert_in_sync(methods)
+
+
+def test_reorder_fields():
+    methods = make_methods()
+    methods.edit_fields(order=[4, 2])
+    # os campos fora de `order` ficam no final, na ordem original
+    assert names(methods) == ["nome 4", "nome 2", "nome 0", "nome 1", "nome 3"]
+    assert_in_sync(methods)
+
+
+def test_reorder_with_removals():
+    methods = make_methods()
+    methods.edit_fields(remove=[2], order=[4, 3, 2, 1, 0])
+    assert names(methods) == ["nome 4", "nome 3", "nome 1", "nome 0"]
+    assert_in_sync(methods)
+
+
+def test_edits_next_to_removals():
+    methods = make_methods()
+    methods.edit_fields(
+        remove=[1, 3],
+        edits={0: {"name": "primeiro"}, 2: {"value": "valor novo", "inline": True}, 4: {"name": "último", "inline": False}},
+    )
+    assert methods.draft.fields == (
+        ("primeiro", "valor 0", True),
+        ("nome 2", "valor novo", True),
+        ("último", "valor 4", False),
+    )
+    assert_in_sync(methods)
+
+
+def test_edit_of_removed_field_is_ignored():
+    methods = make_methods()
+    methods.edit_fields(remove=[1], edits={1: {"name": "x" * (EmbedLimits.FIELD_NAME + 1)}})
+    assert names(methods) == ["nome 0", "nome 2", "nome 3", "nome 4"]
+    assert_in_sync(methods)
+
+
+def test_invalid_edit_changes_nothing():
+    methods = make_methods()
+    with pytest.raises(EmbedValidationError):
+        methods.edit_fields(remove=[0], edits={2: {"name": "x" * (EmbedLimits.FIELD_NAME + 1)}})
+    assert methods.draft.fields == FIELDS
+    assert_in_sync(methods)
+
+
+@pytest.mark.parametrize("changes", [
+    {"remove": [5]},
+    {"remove": [-1]},
+    {"remove": [0], "edits": {7: {"name": "x"}}},
+    {"remove": [0, 1], "order": [0, 9]},
+])
+def test_out_of_range_index_changes_nothing(changes):
+    methods = make_methods()
+    methods.validator  # o validador já está acompanhando os tamanhos antes da chamada
+    with pytest.raises(IndexError):
+        methods.edit_fields(**changes)
+    assert methods.draft.fields == FIELDS
+    assert_in_sync(methods)
+    # o validador continua utilizável depois do erro
+    methods.edit_fields(remove=[0])
+    assert_in_sync(methods)
+
+
+class ChoosingInteraction(FakeInteraction):
+    """Uma interação falsa em que o usuário escolhe as opções `choices` do menu de seleção."""
+
+    choices: List[str] = []
+
+    def child(self):
+        interaction = ChoosingInteraction(self.api, guild=self.guild, message=self.message, locale=self.locale)
+        interaction.followup, interaction.tasks = self.followup, self.tasks
+        return interaction
+
+    async def answer_view(self, view):
+        select = view.children[0]
+        select._values = list(self.choices)
+        await SelectPrompt.select_callback(view, self.child(), select)
+
+
+def run_remove_field(methods: CreatorMethods, choices: List[str]) -> None:
+    async def main():
+        interaction = ChoosingInteraction(FakeAPI())
+        interaction.choices = choices
+        await methods.remove_field(interaction)
+        await asyncio.gather(*interaction.tasks)
+
+    asyncio.run(main())
+
+
+def test_remove_field_with_several_choices():
+    methods = make_methods()
+    run_remove_field(methods, ["4", "0", "2"])
+    assert names(methods) == ["nome 1", "nome 3"]
+    assert_in_sync(methods)
+
+
+def test_remove_field_after_concurrent_change():
+    methods = make_methods()
+
+    async def main():
+        interaction = ChoosingInteraction(FakeAPI(user_delay=0.01))
+        interaction.choices = ["1", "3"]
+        task = asyncio.ensure_future(methods.remove_field(interaction))
+        await asyncio.sleep(0)
+        # outra pessoa remove o primeiro campo enquanto o menu está aberto, mudando os índices
+        methods.edit_fields(remove=[0])
+        await task
+        await asyncio.gather(*interaction.tasks)
+
+    asyncio.run(main())
+    assert names(methods) == ["nome 2", "nome 4"]
+    assert_in_sync(methods)
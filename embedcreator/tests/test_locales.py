@@ -0,0 +1,84 @@
+"""
+Testes das mensagens de erro traduzidas: os erros guardam chaves dos catálogos e são mostrados no idioma de quem usa o painel.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+
+import pytest
+
+from creator.draft import EmbedDraft
+from creator.embed_creator.methods import CreatorMethods
+from creator.locales import LocalizedError, available_locales
+from creator.scheduler import parse_when
+from creator.urlcheck import UrlCheckResult
+from creator.validation import EmbedLimits, EmbedValidationError, EmbedValidator
+from fakes import FakeAPI, FakeInteraction
+
+
+def test_error_keys_exist_in_every_catalog():
+    catalogs = available_locales()
+    english = {key for key in catalogs["en-US"] if key.startswith(("validation.", "url.", "json."))}
+    portuguese = {key for key in catalogs["pt-BR"] if key.startswith(("validation.", "url.", "json."))}
+    assert english == portuguese
+
+
+def test_validation_errors_carry_keys():
+    validator = EmbedValidator()
+    with pytest.raises(EmbedValidationError) as info:
+        validator.check_text(title="x" * (EmbedLimits.TITLE + 1))
+    assert info.value.problems == [("validation.title.length", {"length": EmbedLimits.TITLE + 1, "limit": EmbedLimits.TITLE})]
+    # `str(error)` continua mostrando a mensagem no idioma padrão
+    assert str(info.value) == f"O título tem {EmbedLimits.TITLE + 1} caracteres, mas o limite é {EmbedLimits.TITLE}."
+    assert info.value.localize("en-US") == f"The title has {EmbedLimits.TITLE + 1} characters, but the limit is {EmbedLimits.TITLE}."
+
+
+def test_check_draft_collects_every_problem():
+    draft = EmbedDraft(image="ftp://exemplo.com/a.png", colour=0x1000000, fields=(("", "valor", False),))
+    with pytest.raises(EmbedValidationError) as info:
+        EmbedValidator().check_draft(draft)
+    assert [key for key, _ in info.value.problems] == ["validation.fields.empty", "validation.url", "validation.colour"]
+
+
+@pytest.mark.parametrize("result, key", [
+    (UrlCheckResult("https://a.com/x"), "url.unreachable"),
+    (UrlCheckResult("https://a.com/x", status=404), "url.http_error"),
+    (UrlCheckResult("https://a.com/x", status=200, content_type="text/html"), "url.not_image"),
+    (UrlCheckResult("https://a.com/x", status=200), "url.not_image.unknown"),
+])
+def test_url_problems_carry_keys(result, key):
+    assert result.problem[0] == key
+    assert "`https://a.com/x`" in EmbedValidationError([result.problem]).localize("en-US")
+
+
+def test_other_errors_carry_keys():
+    with pytest.raises(LocalizedError) as info:
+        parse_when("amanhã")
+    assert info.value.problems == [("schedule.invalid", {})]
+    with pytest.raises(LocalizedError) as info:
+        EmbedDraft.from_json('{"fields": 1}')
+    assert info.value.problems == [("json.fields", {})]
+    # continuam sendo `ValueError`, como antes
+    assert isinstance(info.value, ValueError)
+
+
+@pytest.mark.parametrize("locale, answer, expected", [
+    ("en-US", "[1", "Invalid JSON: "),
+    ("pt-BR", "[1", "JSON inválido: "),
+    ("en-US", '{"title": "' + "x" * 300 + '"}', "The title has 300 characters"),
+    ("pt-BR", '{"title": "' + "x" * 300 + '"}', "O título tem 300 caracteres"),
+])
+def test_import_json_answers_in_the_user_language(locale, answer, expected):
+    methods = CreatorMethods(EmbedDraft(title="Título"))
+
+    async def main():
+        api = FakeAPI(answers={"Embed JSON": answer, "JSON da embed": answer})
+        interaction = FakeInteraction(api, locale=locale)
+        await methods.import_json(interaction)
+        await asyncio.gather(*interaction.tasks)
+        return interaction.followup.sent
+
+    sent = asyncio.run(main())
+    assert sent[0]["content"].startswith(expected)
+    assert methods.draft.title == "Título"
@@ -0,0 +1,70 @@
+"""
+Testes de `creator.metrics`: percentis dos histogramas, contagem de erros dos spans e ativação da instrumentação.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+from typing import Any, Dict, List
+
+import pytest
+
+from creator import metrics
+from creator.metrics import Histogram, Metrics, MetricsExporter
+
+
+@pytest.fixture(autouse=True)
+def disabled():
+    metrics.disable()
+    yield
+    metrics.disable()
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+
+def test_exporter_is_abstract():
+    with pytest.raises(TypeError):
+        MetricsExporter()  # type: ignore
+
+
+def test_percentile_uses_the_bucket_upper_bound():
+    histogram = Histogram((0.1, 1.0))
+    assert histogram.percentile(0.5) == 0.0
+    for value in (0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.percentile(0.75) == 1.0
+    assert histogram.percentile(1.0) == float("inf")
+    assert histogram.snapshot()["buckets"] == {0.1: 2, 1.0: 1, float("inf"): 1}
+
+
+def test_span_counts_errors_by_status():
+    aggregate = metrics.enable()
+    with metrics.span("channel.send"):
+        pass
+    for error in (HTTPError(429), HTTPError(429), ValueError()):
+        with pytest.raises(type(error)):
+            with metrics.span("channel.send"):
+                raise error
+    assert aggregate.counters == {"channel.send.calls": 4, "channel.send.errors": 3, "channel.send.errors.429": 2}
+    assert aggregate.histograms["channel.send"].count == 4
+
+
+def test_disabled_instrumentation_records_nothing():
+    exported: List[Dict[str, Any]] = []
+
+    class ListExporter(MetricsExporter):
+        def export(self, snapshot: Dict[str, Any]) -> None:
+            exported.append(snapshot)
+
+    aggregate = Metrics([ListExporter()])
+    assert metrics.enable(aggregate) is aggregate and metrics.get_metrics() is aggregate
+    metrics.increment("draft.merges")
+    metrics.disable()
+    assert metrics.get_metrics() is None
+    with metrics.span("update_embed"):
+        metrics.increment("draft.merges")
+    aggregate.export()
+    assert exported == [{"histograms": {}, "counters": {"draft.merges": 1}}]
@@ -0,0 +1,99 @@
+"""
+Testes dos modals abertos ao mesmo tempo, entregues pelo `ViewStore` do discord.py como acontece com um bot conectado.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from discord.ui.view import ViewStore
+
+from creator.draft import EmbedDraft
+from creator.embed_creator.methods import CreatorMethods
+from creator.embed_creator.sections import SECTIONS
+from creator.input import ModalInput
+from fakes import FakeAPI, FakeInteraction, FakeResponse
+
+
+class StoreResponse(FakeResponse):
+    """Uma resposta falsa que registra os modals no `ViewStore`, como `InteractionResponse.send_modal`, sem respondê-los."""
+
+    async def send_modal(self, modal: ModalInput) -> None:
+        await self._respond("response.send_modal")
+        self._interaction.store.add_view(modal)
+        self._interaction.opened.append(modal)
+
+
+class StoreInteraction(FakeInteraction):
+    def __init__(self, api: FakeAPI, store: ViewStore, opened: List[ModalInput]) -> None:
+        super().__init__(api)
+        self.store, self.opened = store, opened
+        self.response = StoreResponse(self)
+
+
+def submit(store: ViewStore, modal: ModalInput, values: Dict[str, str]) -> None:
+    # o payload de um modal enviado: uma caixa de texto por linha, identificada pelo `custom_id`
+    components: List[Dict[str, Any]] = [
+        {"type": 1, "components": [{"type": 4, "custom_id": item.custom_id, "value": values.get(key, "")}]}
+        for key, item in zip((spec.key for spec in SECTIONS[modal_section(modal)].inputs), modal.children)
+    ]
+    interaction = FakeInteraction(FakeAPI())
+    interaction._state = Mock()  # usado pelo discord.py para resolver menções, que esses modals não têm
+    store.dispatch_modal(modal.custom_id, interaction, components, {})  # type: ignore
+
+
+def modal_section(modal: ModalInput) -> str:
+    return next(name for name, section in SECTIONS.items() if section.title == modal.title)
+
+
+def test_modal_custom_ids_are_unique():
+    async def main():
+        first, second = ModalInput(title="a"), ModalInput(title="a")
+        assert first.custom_id != second.custom_id
+        assert ModalInput(title="a", custom_id="fixo").custom_id == "fixo"
+        a, b = SECTIONS["author"].modal(EmbedDraft()), SECTIONS["author"].modal(EmbedDraft())
+        assert {item.custom_id for item in a.children}.isdisjoint(item.custom_id for item in b.children)
+
+    asyncio.run(main())
+
+
+def test_two_modals_open_at_once_are_both_submitted():
+    methods = CreatorMethods(EmbedDraft(title="Título"))
+
+    async def main():
+        store, opened = ViewStore(Mock()), []
+        first = asyncio.ensure_future(methods.edit_author(StoreInteraction(FakeAPI(), store, opened)))
+        second = asyncio.ensure_future(methods.edit_message(StoreInteraction(FakeAPI(), store, opened)))
+        while len(opened) < 2:
+            await asyncio.sleep(0)
+        author, message = opened
+        assert len(store._modals) == 2
+        # os dois modals são enviados, na ordem inversa à de abertura
+        submit(store, message, {"title": "Novo título", "description": "Nova descrição"})
+        await asyncio.wait_for(second, 1)
+        submit(store, author, {"author_name": "Autor"})
+        await asyncio.wait_for(first, 1)
+        assert not store._modals
+
+    asyncio.run(main())
+    assert (methods.draft.title, methods.draft.description, methods.draft.author_name) == ("Novo título", "Nova descrição", "Autor")
+
+
+def test_two_modals_of_the_same_section_are_both_submitted():
+    methods = CreatorMethods(EmbedDraft())
+
+    async def main():
+        store, opened = ViewStore(Mock()), []
+        tasks = [asyncio.ensure_future(methods.edit_footer(StoreInteraction(FakeAPI(), store, opened))) for _ in range(2)]
+        while len(opened) < 2:
+            await asyncio.sleep(0)
+        submit(store, opened[0], {"footer_text": "Rodapé"})
+        await asyncio.wait_for(tasks[0], 1)
+        # o segundo modal mudou outro atributo da mesma seção, então as duas alterações são juntadas
+        submit(store, opened[1], {"footer_icon_url": "https://exemplo.com/icone.png"})
+        await asyncio.wait_for(tasks[1], 1)
+
+    asyncio.run(main())
+    assert (methods.draft.footer_text, methods.draft.footer_icon_url) == ("Rodapé", "https://exemplo.com/icone.png")
@@ -0,0 +1,30 @@
+"""
+Testes do `SelectOptionCache`: os kwargs das opções são comparados com o padrão do idioma do painel.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+from creator.embed_creator.catalog import get_catalog
+from creator.embed_creator.options import SelectOptionCache
+
+
+def label(locale: str, value: str) -> str:
+    return next(data["label"] for data in get_catalog(locale).options_data if data["value"] == value)
+
+
+def test_default_of_the_panel_locale_is_not_an_override():
+    cache, english = SelectOptionCache(), get_catalog("en-US")
+    options_data, options = cache.get({"author_label": label("en-US", "author")}, english)
+    assert options_data is english.options_data and options is english.options
+    assert len(cache) == 0
+
+
+def test_default_of_another_locale_is_an_override():
+    cache = SelectOptionCache()
+    portuguese = label("pt-BR", "author")
+    assert portuguese != label("en-US", "author")
+    options_data, _ = cache.get({"author_label": portuguese}, get_catalog("en-US"))
+    assert label("en-US", "author") not in [data["label"] for data in options_data]
+    assert portuguese in [data["label"] for data in options_data]
+    assert cache.overrides({"author_label": portuguese}) == {}
+    assert cache.overrides({"author_label": portuguese}, get_catalog("en-US")) == {("author", "label"): portuguese}
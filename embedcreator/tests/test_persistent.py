@@ -0,0 +1,179 @@
+"""
+Testes dos painéis persistentes recriados depois que o bot reinicia: o rascunho, os editores e as mensagens do modo de edição
+devem ser os do painel original.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+from discord import Embed
+from discord.ui import Button
+from discord.ui.view import ViewStore
+
+from creator.draft import EmbedDraft
+from creator.embed_creator.builder import EmbedCreator
+from creator.embed_creator.persistent import PersistentPanelItem
+from creator.storage import DraftStore
+from fakes import FakeAPI, FakeGuild, FakeInteraction, FakeMessage
+
+
+class MemoryDraftStore(DraftStore):
+    def __init__(self) -> None:
+        self.data: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.data.get(key)
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        self.data.update(items)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.data.pop(key, None)
+
+
+class FakeBot:
+    def __init__(self, guild: FakeGuild) -> None:
+        self.guild = guild
+        self.views = ViewStore(Mock())
+
+    def get_channel(self, channel_id: int):
+        return self.guild.get_channel(channel_id)
+
+    def add_view(self, view, *, message_id: Optional[int] = None) -> None:
+        self.views.add_view(view, message_id)
+
+
+def restart(store: MemoryDraftStore, key: str) -> None:
+    # simula o reinício do bot: o painel sai da memória e só o que está no armazenamento continua
+    EmbedCreator._live_panels.pop(key, None)
+    PersistentPanelItem.store, PersistentPanelItem.panel_kwargs = store, {}
+
+
+def interaction_from(api: FakeAPI, guild: FakeGuild, bot: FakeBot, user_id: int, message: Optional[FakeMessage] = None) -> FakeInteraction:
+    interaction = FakeInteraction(api, guild=guild, message=message)
+    interaction.client, interaction.user = bot, SimpleNamespace(id=user_id)
+    return interaction
+
+
+async def click(bot: FakeBot, key: str, action: str, interaction: FakeInteraction) -> None:
+    # como no discord.py: a view ligada à mensagem recebe o clique e o item dinâmico também é chamado
+    custom_id = f"embedcreator:{key}:{action}"
+    interaction.data = {"component_type": 2, "custom_id": custom_id}  # type: ignore
+    bot.views.dispatch_view(2, custom_id, interaction)  # type: ignore
+    await PersistentPanelItem(Button(custom_id=custom_id), key, action).callback(interaction)  # type: ignore
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_restored_panel_keeps_editors_and_targets():
+    async def main():
+        api = FakeAPI()
+        guild = FakeGuild(api)
+        bot = FakeBot(guild)
+        target = await guild.channels[0].send(embed=Embed(title="Publicada"))
+        store = MemoryDraftStore()
+        panel = EmbedCreator(bot=bot, store=store, editors=[1, 2], targets=[target], edit_debounce=0)  # type: ignore
+        key = panel.session_key
+        panel.stop()
+        restart(store, key)
+
+        restored = await EmbedCreator.from_record(store.get(key), bot=bot, store=store, session_key=key)  # type: ignore
+        assert restored.editors == {1, 2}
+        assert [message.id for message in restored.targets] == [target.id]
+        assert restored.draft.title == "Publicada"
+        restored.stop()
+
+        # alguém que não é editor não pode usar o painel recriado
+        message = FakeMessage(api)
+        outsider = interaction_from(api, guild, bot, 3, message)
+        await click(bot, key, "cancel", outsider)
+        assert api.calls.get("message.delete") is None
+        assert key in store.data
+
+        editor = interaction_from(api, guild, bot, 2, message)
+        await click(bot, key, "cancel", editor)
+        assert api.calls["message.delete"] == 1
+        assert key not in store.data
+
+    asyncio.run(main())
+
+
+def test_deleted_targets_are_ignored_on_restore():
+    async def main():
+        api = FakeAPI()
+        guild = FakeGuild(api)
+        bot = FakeBot(guild)
+        kept = await guild.channels[0].send(embed=Embed(title="Mantida"))
+        deleted = await guild.channels[0].send(embed=Embed(title="Apagada"))
+        store = MemoryDraftStore()
+        panel = EmbedCreator(bot=bot, store=store, targets=[kept, deleted])  # type: ignore
+        panel.stop()
+        guild.channels[0].messages.remove(deleted)
+        restored = await EmbedCreator.from_record(store.get(panel.session_key), bot=bot)  # type: ignore
+        assert [message.id for message in restored.targets] == [kept.id]
+        assert restored.editors is None
+        restored.stop()
+
+    asyncio.run(main())
+
+
+def test_old_records_with_only_the_embed_are_accepted():
+    async def main():
+        draft = EmbedDraft(title="Antigo")
+        restored = await EmbedCreator.from_record(draft.to_dict(), bot=FakeBot(FakeGuild(FakeAPI())))  # type: ignore
+        assert restored.draft.title == "Antigo"
+        assert restored.editors is None and restored.targets == []
+        restored.stop()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("first", ["undo", "redo"])
+def test_second_click_on_a_restored_panel_is_handled(first):
+    async def main():
+        api = FakeAPI()
+        guild = FakeGuild(api)
+        bot = FakeBot(guild)
+        store = MemoryDraftStore()
+        panel = EmbedCreator(bot=bot, store=store, edit_debounce=0)  # type: ignore
+        key = panel.session_key
+        panel.stop()
+        restart(store, key)
+
+        message = FakeMessage(api)
+        # com o histórico vazio, a primeira ação não edita a mensagem
+        await click(bot, key, first, interaction_from(api, guild, bot, 1, message))
+        assert api.calls.get("message.edit") is None
+        await click(bot, key, "cancel", interaction_from(api, guild, bot, 1, message))
+        assert api.calls.get("message.delete") == 1
+        assert key not in store.data
+
+    asyncio.run(main())
+
+
+def test_restored_panel_with_timeout_is_rebuilt_on_every_click():
+    async def main():
+        api = FakeAPI()
+        guild = FakeGuild(api)
+        bot = FakeBot(guild)
+        store = MemoryDraftStore()
+        panel = EmbedCreator(bot=bot, store=store, edit_debounce=0)  # type: ignore
+        key = panel.session_key
+        panel.stop()
+        restart(store, key)
+        # com um timeout o painel não é persistente para o discord.py e não pode ser ligado à mensagem
+        PersistentPanelItem.panel_kwargs = {"timeout": 600}
+
+        message = FakeMessage(api)
+        await click(bot, key, "undo", interaction_from(api, guild, bot, 1, message))
+        assert EmbedCreator.get_live_panel(key) is None
+        await click(bot, key, "cancel", interaction_from(api, guild, bot, 1, message))
+        assert api.calls.get("message.delete") == 1
+
+    asyncio.run(main())
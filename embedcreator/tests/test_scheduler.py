@@ -0,0 +1,37 @@
+"""
+Testes do `PostScheduler`: os agendamentos são gravados fora do loop de eventos e sobrevivem a reinícios.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+import threading
+
+from creator.draft import EmbedDraft
+from creator.scheduler import PostScheduler
+
+
+def test_writes_leave_the_loop_thread_and_survive_restarts(tmp_path):
+    path = str(tmp_path / "schedule.sqlite3")
+
+    async def main():
+        scheduler = PostScheduler(None, path)  # type: ignore
+        threads = []
+        write = scheduler._executor.submit
+
+        def tracked(function, *args):
+            return write(lambda: (threads.append(threading.get_ident()), function(*args)))
+
+        scheduler._executor.submit = tracked  # type: ignore
+        kept = scheduler.schedule(EmbedDraft(title="Mantido"), [1, 2], 4_000_000_000.0)
+        cancelled = scheduler.schedule(EmbedDraft(title="Cancelado"), [3], 4_000_000_000.0)
+        assert scheduler.cancel(cancelled.id)
+        await scheduler.close()
+        assert threads and threading.get_ident() not in threads
+        return kept
+
+    kept = asyncio.run(main())
+    restarted = PostScheduler(None, path)  # type: ignore
+    [post] = restarted.pending()
+    assert (post.id, post.channel_ids, post.data["title"]) == (kept.id, (1, 2), "Mantido")
+    asyncio.run(restarted.close())
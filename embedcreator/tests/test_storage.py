@@ -0,0 +1,70 @@
+"""
+Testes do `WriteBehindDraftStore`: gravações fora do loop de eventos, na ordem em que foram feitas, e leituras de outras threads.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+import threading
+
+import pytest
+
+from creator.storage import DraftStore, SQLiteDraftStore, WriteBehindDraftStore
+
+
+def test_draft_store_is_abstract():
+    with pytest.raises(TypeError):
+        DraftStore()  # type: ignore
+
+
+def test_background_writes_leave_the_loop_thread(tmp_path):
+    async def main():
+        backend = SQLiteDraftStore(str(tmp_path / "drafts.sqlite3"))
+        threads = []
+        put_many = backend.put_many
+
+        def tracked(items):
+            threads.append(threading.get_ident())
+            put_many(items)
+
+        backend.put_many = tracked  # type: ignore
+        store = WriteBehindDraftStore(backend, flush_interval=0.01, max_pending=2)
+        store.put("a", {"title": "1"})
+        store.put("b", {"title": "2"})
+        store.delete("a")
+        assert store.get("a") is None and store.get("b") == {"title": "2"}
+        await asyncio.sleep(0.1)
+        assert threads and threading.get_ident() not in threads
+        assert backend.get("a") is None and backend.get("b") == {"title": "2"}
+        store.put("c", {"title": "3"})
+        store.close()
+
+    asyncio.run(main())
+    assert SQLiteDraftStore(str(tmp_path / "drafts.sqlite3")).get("c") == {"title": "3"}
+
+
+def test_get_from_other_threads_while_the_loop_writes(tmp_path):
+    async def main():
+        store = WriteBehindDraftStore(SQLiteDraftStore(str(tmp_path / "drafts.sqlite3")), flush_interval=0.001, max_pending=5)
+        loop = asyncio.get_running_loop()
+        store.put("painel", {"version": 0})
+        errors = []
+
+        def read():
+            try:
+                for _ in range(300):
+                    assert store.get("painel") is not None
+            except Exception as error:
+                errors.append(error)
+
+        readers = [loop.run_in_executor(None, read) for _ in range(4)]
+        for version in range(1, 400):
+            store.put("painel", {"version": version})
+            store.put(f"outro-{version % 7}", {"version": version})
+            await asyncio.sleep(0)
+        await asyncio.gather(*readers)
+        store.close()
+        assert not errors
+        assert SQLiteDraftStore(str(tmp_path / "drafts.sqlite3")).get("painel") == {"version": 399}
+
+    asyncio.run(main())
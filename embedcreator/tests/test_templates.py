@@ -0,0 +1,29 @@
+"""
+Testes da `TemplateLibrary` usada fora do loop de eventos, pelas threads do executor.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+
+from creator.draft import EmbedDraft
+from creator.templates import TemplateLibrary
+
+
+def test_calls_from_executor_threads(tmp_path):
+    async def main():
+        library = TemplateLibrary(str(tmp_path / "templates.sqlite3"), cache_size=4)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(None, library.save, 1, f"Modelo {index}", EmbedDraft(title=str(index))) for index in range(20)
+        ))
+        library.clear_cache()
+        drafts = await asyncio.gather(*(loop.run_in_executor(None, library.load, 1, f"modelo {index}") for index in range(20)))
+        names = await loop.run_in_executor(None, library.names, 1, "modelo 1")
+        library.close()
+        return drafts, names
+
+    drafts, names = asyncio.run(main())
+    assert [draft.title for draft in drafts] == [str(index) for index in range(20)]
+    assert names == ["Modelo 1", *(f"Modelo {index}" for index in range(10, 20))]
+
@@ -0,0 +1,51 @@
+"""
+Testes de `EmbedCreator.update_embed`: a edição é ignorada quando nada mudou, mas a view é reenviada depois de uma escolha no menu
+de seleção, para que a mesma opção possa ser escolhida de novo.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+from typing import Any, Dict, List
+
+from creator.embed_creator.builder import EmbedCreator
+from fakes import FakeAPI, FakeInteraction, FakeMessage, FakeSelect
+
+
+class RecordingMessage(FakeMessage):
+    def __init__(self, api: FakeAPI) -> None:
+        super().__init__(api)
+        self.edits: List[Dict[str, Any]] = []
+
+    async def edit(self, **kwargs: Any) -> FakeMessage:
+        self.edits.append(kwargs)
+        return await super().edit(**kwargs)
+
+
+def test_unchanged_select_choice_still_refreshes_the_view():
+    async def main():
+        api = FakeAPI(answers={"Cor da embed": "#ff0000"})
+        message = RecordingMessage(api)
+        panel = EmbedCreator(bot=None, edit_debounce=0)  # type: ignore
+        for _ in range(2):
+            await EmbedCreator.edit_select_callback(panel, FakeInteraction(api, message=message), FakeSelect("color"))  # type: ignore
+        panel.stop()
+        return message.edits
+
+    first, second = asyncio.run(main())
+    assert set(first) == {"embed", "view"}
+    # a cor é a mesma: a embed não é reenviada, só a view
+    assert set(second) == {"view"}
+
+
+def test_unchanged_button_click_skips_the_edit():
+    async def main():
+        api = FakeAPI()
+        message = RecordingMessage(api)
+        panel = EmbedCreator(bot=None, edit_debounce=0)  # type: ignore
+        for _ in range(2):
+            await panel.update_embed(FakeInteraction(api, message=message))  # type: ignore
+        panel.stop()
+        return message.edits
+
+    assert len(asyncio.run(main())) == 1
@@ -0,0 +1,142 @@
+"""
+Testes do `UrlChecker` contra um servidor HTTP local que faz o papel do CDN de imagens.
+
+Uso (dentro da pasta `embedcreator`):
+    python -m pytest -q
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, List
+
+import pytest
+from aiohttp import web
+
+from creator.urlcheck import UrlChecker
+
+
+async def serve(requests: List[str]) -> web.AppRunner:
+    async def image(request: web.Request) -> web.Response:
+        requests.append(f"{request.method} {request.path}")
+        return web.Response(body=b"\x89PNG", content_type="image/png")
+
+    async def missing(request: web.Request) -> web.Response:
+        requests.append(f"{request.method} {request.path}")
+        return web.Response(status=404)
+
+    async def get_only(request: web.Request) -> web.Response:
+        requests.append(f"{request.method} {request.path}")
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        return web.Response(body=b"\x89", content_type="image/png")
+
+    async def slow(request: web.Request) -> web.Response:
+        requests.append(f"{request.method} {request.path}")
+        await asyncio.sleep(1)
+        return web.Response(body=b"\x89PNG", content_type="image/png")
+
+    async def redirect(request: web.Request) -> web.Response:
+        requests.append(f"{request.method} {request.path}")
+        raise web.HTTPFound("/image.png")
+
+    app = web.Application()
+    routes: Dict[str, Callable[[web.Request], Awaitable[web.Response]]] = {
+        "/image.png": image, "/missing.png": missing, "/get-only.png": get_only, "/slow.png": slow, "/redirect.png": redirect,
+    }
+    for path, handler in routes.items():
+        app.router.add_route("*", path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def check(path: str, **kwargs) -> tuple:
+    async def main():
+        requests: List[str] = []
+        runner = await serve(requests)
+        port = runner.addresses[0][1]
+        checker = UrlChecker(**kwargs)
+        try:
+            return await checker.check(f"http://127.0.0.1:{port}{path}"), requests
+        finally:
+            await checker.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_image_is_accepted():
+    result, requests = check("/image.png", allow_private=True)
+    assert result.ok and result.problem is None
+    assert requests == ["HEAD /image.png"]
+
+
+def test_http_error_is_reported():
+    result, _ = check("/missing.png", allow_private=True)
+    assert result.problem == ("url.http_error", {"url": result.url, "status": 404})
+
+
+def test_head_not_allowed_falls_back_to_get():
+    result, requests = check("/get-only.png", allow_private=True)
+    assert result.ok
+    assert requests == ["HEAD /get-only.png", "GET /get-only.png"]
+
+
+def test_slow_server_is_unreachable():
+    result, _ = check("/slow.png", allow_private=True, timeout=0.1)
+    assert result.problem == ("url.unreachable", {"url": result.url})
+
+
+def test_redirects_are_followed():
+    result, requests = check("/redirect.png", allow_private=True)
+    assert result.ok
+    assert requests == ["HEAD /redirect.png", "HEAD /image.png"]
+
+
+@pytest.mark.parametrize("path", ["/image.png", "/redirect.png"])
+def test_internal_address_is_blocked_without_a_request(path):
+    result, requests = check(path)
+    assert result.problem == ("url.blocked", {"url": result.url})
+    assert requests == []
+
+
+@pytest.mark.parametrize("url", [
+    "http://localhost/image.png",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://10.0.0.1/image.png",
+    "http://[::1]/image.png",
+    "http://[::ffff:127.0.0.1]/image.png",
+    "file:///etc/passwd",
+])
+def test_internal_urls_are_blocked(url):
+    async def main():
+        checker = UrlChecker()
+        try:
+            return await checker.check(url)
+        finally:
+            await checker.close()
+
+    result = asyncio.run(main())
+    assert result.blocked and result.problem == ("url.blocked", {"url": url})
+
+
+def test_redirect_to_internal_address_is_blocked():
+    async def main():
+        requests: List[str] = []
+        runner = await serve(requests)
+        port = runner.addresses[0][1]
+
+        # um servidor "público" que redireciona para o servidor interno: a primeira URL é liberada, o destino não
+        async def allowed(url):
+            return url.path == "/redirect.png"
+
+        checker = UrlChecker()
+        checker._allowed = allowed  # type: ignore
+        try:
+            return await checker.check(f"http://127.0.0.1:{port}/redirect.png"), requests
+        finally:
+            await checker.close()
+            await runner.cleanup()
+
+    result, requests = asyncio.run(main())
+    assert result.blocked
+    assert requests == ["HEAD /redirect.png"]